@@ -12,19 +12,79 @@ OUTPUT_DIR = Path(__file__).resolve().parents[1] / "data" / "peer-test" / "audio
 SAMPLE_RATE = 44100
 
 
-def generate_tone(freq_hz: float, duration_s: float, sr: int = SAMPLE_RATE) -> np.ndarray:
-    """Generate a pure sine wave at the given frequency."""
-    t = np.linspace(0, duration_s, int(sr * duration_s), endpoint=False)
+# One period of a sine sampled at _SINE_LUT_SIZE points. Tones index it with a
+# 16.16 fixed-point phase accumulator instead of evaluating np.sin per sample;
+# at 16384 entries the truncation error sits around -68 dB.
+_SINE_LUT_SIZE = 16384
+_SINE_LUT = np.sin(
+    2 * np.pi * np.arange(_SINE_LUT_SIZE) / _SINE_LUT_SIZE
+).astype(np.float32)
+_PHASE_FRAC_BITS = 16
+
+# Shared int64 sample-index ramp, grown on demand
+_SAMPLE_INDEX = np.arange(0, dtype=np.int64)
+
+
+def _sample_index(n: int) -> np.ndarray:
+    """Return the first ``n`` entries of the cached 0..n-1 sample-index ramp."""
+    global _SAMPLE_INDEX  # noqa: PLW0603
+    if len(_SAMPLE_INDEX) < n:
+        _SAMPLE_INDEX = np.arange(n, dtype=np.int64)
+    return _SAMPLE_INDEX[:n]
+
+
+# Linear 0 -> 1 fade ramps keyed by length; the fade-out is a reversed view
+_FADE_RAMPS: dict[int, np.ndarray] = {}
+
+
+def _fade_ramp(n: int) -> np.ndarray:
+    """Return a cached float32 ramp from 0 to 1 inclusive of length ``n``."""
+    ramp = _FADE_RAMPS.get(n)
+    if ramp is None:
+        ramp = np.arange(n, dtype=np.float32)
+        if n > 1:
+            ramp *= np.float32(1.0 / (n - 1))
+        _FADE_RAMPS[n] = ramp
+    return ramp
+
+
+def _lut_sine(
+    freq_hz: float, n: int, sr: int, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Return ``n`` samples of a unit sine at ``freq_hz`` read from the wavetable.
+
+    If ``out`` is given (a float32 buffer of length ``n``), the samples are
+    written into it rather than into a new array.
+    """
+    step = round(freq_hz * _SINE_LUT_SIZE * (1 << _PHASE_FRAC_BITS) / sr)
+    idx = _sample_index(n) * step
+    idx >>= _PHASE_FRAC_BITS
+    idx &= _SINE_LUT_SIZE - 1
+    return _SINE_LUT.take(idx, out=out)
+
+
+def generate_tone(
+    freq_hz: float,
+    duration_s: float,
+    sr: int = SAMPLE_RATE,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Generate a pure sine wave at the given frequency.
+
+    Pass ``out`` (e.g. a slice of a preallocated buffer) to synthesize in
+    place instead of allocating a new array.
+    """
+    audio = _lut_sine(freq_hz, int(sr * duration_s), sr, out=out)
     # Add slight fade in/out to avoid clicks
-    audio = np.sin(2 * np.pi * freq_hz * t).astype(np.float32)
     fade_len = int(sr * 0.02)  # 20ms fade
-    audio[:fade_len] *= np.linspace(0, 1, fade_len)
-    audio[-fade_len:] *= np.linspace(1, 0, fade_len)
+    ramp = _fade_ramp(fade_len)
+    audio[:fade_len] *= ramp
+    audio[-fade_len:] *= ramp[::-1]
     return audio
 
 
 def main():
-    import soundfile as sf
+    from crj_engine.synthesis.render import save_wav_pcm16
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -33,7 +93,7 @@ def main():
     # Test 1: Single Sa tone (3 seconds)
     sa_tone = generate_tone(sa_hz, 3.0)
     sa_path = OUTPUT_DIR / "test_sa_261hz.wav"
-    sf.write(str(sa_path), sa_tone, SAMPLE_RATE)
+    save_wav_pcm16(sa_tone, sa_path, SAMPLE_RATE)
     print(f"Generated: {sa_path} (Sa = {sa_hz} Hz, 3s)")
 
     # Test 2: Shankarabharanam ascending scale (Sa Ri Ga Ma Pa Dha Ni Sa')
@@ -41,25 +101,29 @@ def main():
     swara_names = ["Sa", "Ri2", "Ga3", "Ma1", "Pa", "Dha2", "Ni3", "Sa'"]
     note_duration = 0.75  # seconds per note
 
-    scale_audio = np.array([], dtype=np.float32)
-    silence = np.zeros(int(SAMPLE_RATE * 0.1), dtype=np.float32)  # 100ms gap
+    note_len = int(SAMPLE_RATE * note_duration)
+    silence_len = int(SAMPLE_RATE * 0.1)  # 100ms gap
+    scale_audio = np.zeros(len(scale_cents) * (note_len + silence_len), dtype=np.float32)
 
+    offset = 0
     for cents, name in zip(scale_cents, swara_names):
         freq = sa_hz * (2 ** (cents / 1200))
-        tone = generate_tone(freq, note_duration)
-        scale_audio = np.concatenate([scale_audio, tone, silence])
+        generate_tone(freq, note_duration, out=scale_audio[offset:offset + note_len])
+        offset += note_len + silence_len
         print(f"  {name}: {freq:.1f} Hz")
 
     scale_path = OUTPUT_DIR / "test_shankarabharanam_scale.wav"
-    sf.write(str(scale_path), scale_audio, SAMPLE_RATE)
+    save_wav_pcm16(scale_audio, scale_path, SAMPLE_RATE)
     print(f"Generated: {scale_path} (Shankarabharanam scale, {len(scale_audio)/SAMPLE_RATE:.1f}s)")
 
     # Test 3: Pa drone (Sa + Pa together, 5 seconds)
-    t = np.linspace(0, 5.0, int(SAMPLE_RATE * 5.0), endpoint=False)
+    n_drone = int(SAMPLE_RATE * 5.0)
     pa_hz = sa_hz * 1.5
-    drone = (0.5 * np.sin(2 * np.pi * sa_hz * t) + 0.3 * np.sin(2 * np.pi * pa_hz * t)).astype(np.float32)
+    drone = _lut_sine(sa_hz, n_drone, SAMPLE_RATE)
+    drone *= np.float32(0.5)
+    drone += np.float32(0.3) * _lut_sine(pa_hz, n_drone, SAMPLE_RATE)
     drone_path = OUTPUT_DIR / "test_sa_pa_drone.wav"
-    sf.write(str(drone_path), drone, SAMPLE_RATE)
+    save_wav_pcm16(drone, drone_path, SAMPLE_RATE)
     print(f"Generated: {drone_path} (Sa+Pa drone, 5s)")
 
     print(f"\nAll test files in: {OUTPUT_DIR}")
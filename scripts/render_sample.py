@@ -5,7 +5,9 @@ Generates 3 versions (sine, voice, string) plus a standalone tanpura drone.
 Output: data/peer-test/audio/rendered_*.wav
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -24,7 +26,7 @@ from crj_engine.synthesis.render import (
     ToneType,
     generate_tanpura,
     render_composition,
-    save_wav,
+    save_wav_pcm16,
 )
 
 OUTPUT_DIR = Path(__file__).resolve().parents[1] / "data" / "peer-test" / "audio"
@@ -116,6 +118,25 @@ def build_shankarabharanam_composition() -> Composition:
     )
 
 
+def _render_tone(comp: Composition, tempo: int, tone_type: ToneType) -> tuple[Path, float]:
+    """Render one tone version and write it to disk (runs in a worker process)."""
+    audio = render_composition(
+        comp, tempo_bpm=tempo, tone=tone_type,
+        include_tanpura=True,
+    )
+    path = OUTPUT_DIR / f"rendered_{tone_type.value}.wav"
+    save_wav_pcm16(audio, path)
+    return path, len(audio) / 44100
+
+
+def _render_tanpura() -> tuple[Path, float]:
+    """Render the standalone 10 s tanpura drone (runs in a worker process)."""
+    tanpura = generate_tanpura(REFERENCE_SA_HZ, duration_s=10.0)
+    path = OUTPUT_DIR / "tanpura_drone.wav"
+    save_wav_pcm16(tanpura, path)
+    return path, len(tanpura) / 44100
+
+
 def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -126,25 +147,20 @@ def main():
     print(f"Raga: {comp.raga} | Tala: {comp.tala_id} | Tempo: {tempo} BPM")
     print(f"Sa = {REFERENCE_SA_HZ} Hz\n")
 
-    # Render in each tone type
-    for tone_type in ToneType:
-        print(f"Rendering {tone_type.value} tone...")
-        audio = render_composition(
-            comp, tempo_bpm=tempo, tone=tone_type,
-            include_tanpura=True,
-        )
-        filename = f"rendered_{tone_type.value}.wav"
-        path = OUTPUT_DIR / filename
-        save_wav(audio, path)
-        duration = len(audio) / 44100
-        print(f"  Saved: {path} ({duration:.1f}s)")
-
-    # Also render standalone tanpura drone
-    print("\nRendering tanpura drone (10s)...")
-    tanpura = generate_tanpura(REFERENCE_SA_HZ, duration_s=10.0)
-    tanpura_path = OUTPUT_DIR / "tanpura_drone.wav"
-    save_wav(tanpura, tanpura_path)
-    print(f"  Saved: {tanpura_path}")
+    # The tone versions and the tanpura are independent, so render them in
+    # parallel. Workers write their own WAVs rather than shipping audio back.
+    n_jobs = len(ToneType) + 1
+    with ProcessPoolExecutor(max_workers=min(n_jobs, os.cpu_count() or 1)) as ex:
+        futures = {ex.submit(_render_tanpura): "tanpura drone (10s)"}
+        for tone_type in ToneType:
+            futures[ex.submit(_render_tone, comp, tempo, tone_type)] = (
+                f"{tone_type.value} tone"
+            )
+        print(f"Rendering {', '.join(futures.values())}...")
+
+        for fut in as_completed(futures):
+            path, duration = fut.result()
+            print(f"  Saved {futures[fut]}: {path} ({duration:.1f}s)")
 
     print("\nDone! Open the WAV files in any audio player to listen.")
 
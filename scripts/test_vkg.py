@@ -4,11 +4,17 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from crj_engine.pitch.audio_io import get_duration, load_audio
 from crj_engine.pitch.detector import PitchAlgorithm, detect_pitch
-from crj_engine.swara.mapper import freq_to_swara, freq_to_western
+from crj_engine.swara.mapper import (
+    freq_to_swara_batch,
+    freq_to_western,
+    swara_names,
+)
 
 AUDIO_DIR = Path(__file__).resolve().parents[1] / "data" / "peer-test" / "audio"
 AUDIO_FILE = AUDIO_DIR / "test_shankarabharanam_scale.wav"
@@ -37,12 +43,16 @@ def main():
     print(f"{'Time (ms)':>10} {'Freq (Hz)':>10} {'Conf':>6} {'Western':>8} {'Swara':>8} {'Script':>12}")
     print("-" * 65)
 
-    for frame in voiced.frames[:20]:
+    # Map every voiced frame once; reused for the table and the distribution
+    freqs = voiced.frequencies
+    swara_ids = freq_to_swara_batch(freqs, reference_sa_hz=REFERENCE_SA_HZ)
+    kannada_names = swara_names("kannada")
+
+    for frame, swara_id in zip(voiced.frames[:20], swara_ids[:20], strict=True):
         western = freq_to_western(frame.frequency_hz)
-        swara = freq_to_swara(frame.frequency_hz, reference_sa_hz=REFERENCE_SA_HZ)
 
-        swara_name = swara.swara_id if swara else "?"
-        kannada = swara.names.get("kannada", "") if swara else ""
+        swara_name = swara_id or "?"
+        kannada = kannada_names.get(swara_id, "")
 
         print(
             f"{frame.timestamp_ms:10.0f} "
@@ -54,21 +64,20 @@ def main():
         )
 
     # Frequency distribution
-    freqs = voiced.frequencies
     print(f"\nPitch range: {freqs.min():.1f} - {freqs.max():.1f} Hz")
     print(f"Mean pitch: {freqs.mean():.1f} Hz")
 
     # Swara distribution
-    swara_counts: dict[str, int] = {}
-    for frame in voiced.frames:
-        swara = freq_to_swara(frame.frequency_hz, reference_sa_hz=REFERENCE_SA_HZ)
-        if swara:
-            swara_counts[swara.swara_id] = swara_counts.get(swara.swara_id, 0) + 1
+    names, counts = np.unique(swara_ids[swara_ids != ""], return_counts=True)
+    order = np.argsort(-counts, kind="stable")
+    pcts = 100 * counts / len(freqs)
 
-    if swara_counts:
+    if names.size:
         print(f"\nSwara distribution:")
-        for name, count in sorted(swara_counts.items(), key=lambda x: -x[1]):
-            pct = 100 * count / len(voiced.frames)
+        for name, count, pct in zip(
+            names[order].tolist(), counts[order].tolist(), pcts[order].tolist(),
+            strict=True,
+        ):
             bar = "#" * int(pct / 2)
             print(f"  {name:>6}: {count:>5} ({pct:5.1f}%) {bar}")
 
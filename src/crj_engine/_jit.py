@@ -0,0 +1,25 @@
+"""Optional Numba JIT support for small numeric kernels.
+
+Numba is installed alongside librosa, but nothing here requires it: ``njit``
+compiles with Numba when it can be imported and otherwise hands the function
+back unchanged. Callers check ``HAVE_NUMBA`` to pick between a loop-style
+kernel (fast only when compiled) and their vectorized NumPy path.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - numba ships with librosa
+    _numba_njit = None
+
+HAVE_NUMBA = _numba_njit is not None
+
+
+def njit(*args, **kwargs):
+    """``numba.njit`` when available, else a no-op decorator."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -26,14 +27,39 @@ from crj_engine.api.routes import (
 _WEB_DIR = Path(__file__).resolve().parents[3] / "web"
 
 
+def _warm_pitch_detectors() -> None:
+    """Run both pitch detectors once on silence.
+
+    This pulls in librosa/torch and loads the CREPE weights before the
+    first real request, so that request doesn't pay several seconds of
+    import and model-load time.
+    """
+    import numpy as np
+
+    from crj_engine.pitch.detector import PitchAlgorithm, detect_pitch
+
+    silence = np.zeros(16000, dtype=np.float32)
+    for algorithm in (PitchAlgorithm.PYIN, PitchAlgorithm.CREPE):
+        detect_pitch(silence, 16000, algorithm=algorithm)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Pre-load heavy resources on startup."""
+    """Pre-load heavy resources on startup.
+
+    Set ``CRJ_WARM_PITCH=1`` to also warm the pitch detectors (used in the
+    container image; left off by default to keep tests and dev reloads fast).
+    """
     from crj_engine.raga.matcher import RagaMatcher
     from crj_engine.swara.mapper import _load_swarasthanas
 
     app.state.raga_matcher = RagaMatcher()
     app.state.swarasthanas = _load_swarasthanas()
+    app.state.reference_payloads = reference.build_reference_payloads(
+        app.state.raga_matcher, app.state.swarasthanas,
+    )
+    if os.environ.get("CRJ_WARM_PITCH") == "1":
+        _warm_pitch_detectors()
     yield
 
 
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+import numpy as np
+from fastapi import APIRouter, File, Form, HTTPException, Request, Response, UploadFile
+from pydantic import TypeAdapter
 
 from crj_engine.api.schemas import (
     AnalysisResponse,
@@ -13,31 +17,81 @@ from crj_engine.api.schemas import (
     PitchAlgorithmChoice,
     PitchFrameOut,
     RagaCandidateOut,
-    SeparatorEventOut,
     ScriptChoice,
+    SeparatorEventOut,
     SRTUnitOut,
     TranscribedNoteOut,
     TranscribedPhraseOut,
 )
+from crj_engine.pitch.audio_io import get_duration, load_audio
+from crj_engine.pitch.detector import PitchAlgorithm, detect_pitch
+from crj_engine.pitch.gamaka import classify_gamakas
+from crj_engine.pitch.segmenter import segment_contour
+from crj_engine.raga.matcher import RagaMatcher
+from crj_engine.tala.srt_sync import (
+    build_srt_units,
+    detect_separator_events,
+    parse_srt,
+)
+from crj_engine.tala.transcribe import (
+    render_transcription,
+    render_transcription_compact,
+    transcribe_contour,
+)
 
 router = APIRouter()
 
+_RESPONSE_ADAPTER = TypeAdapter(AnalysisResponse)
+
 MAX_FILE_SIZE_BYTES = 25 * 1024 * 1024  # 25 MB — fits 180s mono WAV @ 44.1 kHz
 MAX_DURATION_S = 180.0  # Phase 2: support up to 3-minute sessions
 ALGO_AUTO_PYIN_THRESHOLD_S = 60.0  # CREPE too slow on Cloud Run 2-vCPU beyond this
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     ".wav", ".mp3", ".m4a", ".aac", ".ogg", ".flac", ".webm",
-}
+})
+# Formats soundfile decodes straight from memory; everything else goes through
+# ffmpeg, which needs a seekable file for containers like M4A (moov atom at end).
+_IN_MEMORY_EXTENSIONS = frozenset({".wav", ".flac"})
 
+# Leading magic bytes -> container suffix. MP3/AAC may also arrive as bare
+# frame streams (0xFFFx sync word), so those are matched on the sync bits.
+_MAGIC = (
+    (b"RIFF", ".wav"),
+    (b"fLaC", ".flac"),
+    (b"OggS", ".ogg"),
+    (b"\x1a\x45\xdf\xa3", ".webm"),
+    (b"ID3", ".mp3"),
+)
+# Containers that always start with a recognisable signature; an upload
+# labelled as one of these whose bytes match nothing is rejected outright.
+_SIGNED_EXTENSIONS = frozenset({".wav", ".flac", ".ogg", ".webm", ".m4a"})
+
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+async def _read_upload(file: UploadFile) -> bytearray:
+    """Copy the upload into memory in chunks, rejecting it past the cap.
+
+    Starlette has already received and spooled the whole request body by
+    the time this runs, so this does not limit the transfer itself; it
+    caps the in-memory copy at ``MAX_FILE_SIZE_BYTES`` plus one chunk
+    rather than reading an oversized file in full.
+    """
+    buf = bytearray()
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        buf.extend(chunk)
+        if len(buf) > MAX_FILE_SIZE_BYTES:
+            raise HTTPException(
+                413,
+                f"File too large (> {MAX_FILE_SIZE_BYTES} bytes). "
+                f"Maximum: {MAX_FILE_SIZE_BYTES}.",
+            )
+    return buf
 
-def _validate_upload(file: UploadFile, content: bytes) -> str:
-    """Validate file size and extension. Return the file suffix."""
-    if len(content) > MAX_FILE_SIZE_BYTES:
-        raise HTTPException(
-            413,
-            f"File too large ({len(content)} bytes). Maximum: {MAX_FILE_SIZE_BYTES}.",
-        )
 
+def _validate_upload(file: UploadFile) -> str:
+    """Validate the file extension. Return the file suffix."""
     filename = file.filename or "recording.webm"
     suffix = Path(filename).suffix.lower()
     if not suffix:
@@ -52,6 +106,63 @@ def _validate_upload(file: UploadFile, content: bytes) -> str:
     return suffix
 
 
+def _sniff_suffix(content: bytes | bytearray) -> str | None:
+    """Return the container suffix implied by the first bytes, if recognised."""
+    head = bytes(content[:12])
+    for magic, suffix in _MAGIC:
+        if head.startswith(magic):
+            return suffix
+    if head[4:8] == b"ftyp":
+        return ".m4a"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # 11-bit MPEG frame sync, which covers MPEG-1, 2 and 2.5 (0xFFE...).
+        # Layer bits 00 are reserved in MPEG audio and instead mark ADTS AAC,
+        # which uses the full 12-bit sync; version bits 01 are reserved.
+        if head[1] & 0x06:
+            if head[1] & 0x18 != 0x08:
+                return ".mp3"
+        elif head[1] & 0xF0 == 0xF0:
+            return ".aac"
+    return None
+
+
+def _check_content(content: bytes | bytearray, suffix: str) -> str:
+    """Reconcile the declared suffix with the upload's magic bytes.
+
+    A recognised signature wins over the filename, so a mislabelled upload is
+    still routed to the right decoder. Bytes that match no known signature
+    are rejected when the declared container always carries one.
+    """
+    sniffed = _sniff_suffix(content)
+    if sniffed is not None:
+        return sniffed
+    if suffix in _SIGNED_EXTENSIONS:
+        raise HTTPException(
+            400,
+            f"File content does not look like {suffix[1:].upper()} audio.",
+        )
+    return suffix
+
+
+def _decode_upload(content: bytes | bytearray, suffix: str) -> tuple[np.ndarray, int]:
+    """Decode uploaded audio bytes to 16 kHz mono samples.
+
+    WAV/FLAC are decoded from an in-memory buffer; other formats are spooled
+    to a temp file for ffmpeg.
+    """
+    if suffix in _IN_MEMORY_EXTENSIONS:
+        return load_audio(io.BytesIO(content), target_sr=16000, format=suffix)
+
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        tmp.write(content)
+        tmp_path = tmp.name
+
+    try:
+        return load_audio(tmp_path, target_sr=16000)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
 _FILE_PARAM = File(..., description="Audio file (WAV, MP3, M4A, WebM)")
 _SA_PARAM = Form(261.63, description="Tonic Sa frequency in Hz")
 _ALGO_PARAM = Form(PitchAlgorithmChoice.pyin, description="Pitch detection algorithm")
@@ -76,39 +187,58 @@ async def analyze_audio(
     tolerance_cents: float = _TOL_PARAM,
     srt_content: str | None = _SRT_CONTENT_PARAM,
     separator_mode: str = _SEPARATOR_MODE_PARAM,
-) -> AnalysisResponse:
+) -> Response:
     """Run the full CRJ Engine analysis pipeline on uploaded audio.
 
     Pipeline: load audio -> detect pitch -> transcribe swaras ->
     classify gamakas -> identify raga -> render notation.
+
+    The pipeline is CPU-bound (decoding, pYIN/CREPE, gamaka analysis), so it
+    runs in a worker thread to keep the event loop free for other requests.
+    The response is encoded to JSON in that thread as well: with a contour
+    attached it can hold thousands of frames.
     """
-    from crj_engine.pitch.audio_io import get_duration, load_audio
-    from crj_engine.pitch.detector import PitchAlgorithm, detect_pitch
-    from crj_engine.pitch.gamaka import classify_gamaka
-    from crj_engine.pitch.segmenter import segment_contour
-    from crj_engine.tala.transcribe import (
-        render_transcription,
-        render_transcription_compact,
-        transcribe_contour,
-    )
-    from crj_engine.tala.srt_sync import (
-        build_srt_units,
-        detect_separator_events,
-        parse_srt,
+    # --- 1. Validate and read upload ---
+    suffix = _validate_upload(file)
+    content = await _read_upload(file)
+    suffix = _check_content(content, suffix)
+
+    body = await asyncio.to_thread(
+        _run_analysis_json,
+        content,
+        suffix,
+        request.app.state.raga_matcher,
+        reference_sa_hz=reference_sa_hz,
+        algorithm=algorithm,
+        script=script,
+        include_contour=include_contour,
+        tolerance_cents=tolerance_cents,
+        srt_content=srt_content,
+        separator_mode=separator_mode,
     )
+    return Response(content=body, media_type="application/json")
 
-    # --- 1. Read and validate upload ---
-    content = await file.read()
-    suffix = _validate_upload(file, content)
 
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(content)
-        tmp_path = tmp.name
+def _run_analysis_json(*args, **kwargs) -> bytes:
+    """Run :func:`_run_analysis` and encode the result with pydantic-core."""
+    return _RESPONSE_ADAPTER.dump_json(_run_analysis(*args, **kwargs))
 
-    try:
-        audio, sr = load_audio(tmp_path, target_sr=16000)
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+
+def _run_analysis(
+    content: bytes | bytearray,
+    suffix: str,
+    matcher: RagaMatcher,
+    *,
+    reference_sa_hz: float,
+    algorithm: PitchAlgorithmChoice,
+    script: ScriptChoice,
+    include_contour: bool,
+    tolerance_cents: float,
+    srt_content: str | None,
+    separator_mode: str,
+) -> AnalysisResponse:
+    """Synchronous body of ``analyze_audio``: decode, analyse, build the response."""
+    audio, sr = _decode_upload(content, suffix)
 
     duration_s = get_duration(audio, sr)
     if duration_s > MAX_DURATION_S:
@@ -157,24 +287,26 @@ async def analyze_audio(
         hop_ms=100.0,
         reference_sa_hz=reference_sa_hz,
     )
-    gamakas = []
-    for seg in segments:
-        g = classify_gamaka(seg, hop_ms=contour.hop_ms)
-        gamakas.append(GamakaOut(
-            segment_start_ms=seg.start_ms,
-            segment_end_ms=seg.end_ms,
+    gamakas = [
+        GamakaOut.model_construct(
+            segment_start_ms=float(seg.start_ms),
+            segment_end_ms=float(seg.end_ms),
             gamaka_type=g.gamaka_type,
             confidence=g.confidence,
-        ))
+        )
+        for seg, g in zip(
+            segments, classify_gamakas(segments, hop_ms=contour.hop_ms), strict=True
+        )
+    ]
 
     # --- 5. Build swara sequence and identify raga ---
-    swara_sequence: list[str] = []
-    for phrase in transcription.phrases:
-        for note in phrase.notes:
-            if not swara_sequence or note.swara_id != swara_sequence[-1]:
-                swara_sequence.append(note.swara_id)
+    ids = transcription.all_swara_ids
+    swara_sequence: list[str] = (
+        ids[np.concatenate(([True], ids[1:] != ids[:-1]))].tolist()
+        if ids.size
+        else []
+    )
 
-    matcher = request.app.state.raga_matcher
     candidates_raw = matcher.identify(swara_sequence, top_n=5)
     raga_candidates = [
         RagaCandidateOut(
@@ -190,39 +322,60 @@ async def analyze_audio(
     # --- 6. Render notation ---
     notation_iast = render_transcription(transcription, script="iast")
     notation_compact = render_transcription_compact(transcription, script="iast")
-    notation_requested = render_transcription(transcription, script=script.value)
+    notation_requested = (
+        notation_iast
+        if script == ScriptChoice.iast
+        else render_transcription(transcription, script=script.value)
+    )
 
     # --- 7. Build phrase output ---
+    # The values below come straight from our own pipeline, so the output
+    # models are built with model_construct() to skip per-item validation.
+    # Notes are read straight from the transcription's columns, so no
+    # TranscribedNote objects are built on this path.
+    cols = transcription.columns
+    notes_out = [
+        TranscribedNoteOut.model_construct(
+            start_ms=t0,
+            end_ms=t1,
+            swara_id=swara_id,
+            octave=octave.value,
+            frequency_hz=round(freq, 2),
+            cents_deviation=round(dev, 2),
+            confidence=round(conf, 3),
+        )
+        for t0, t1, swara_id, octave, freq, dev, conf in zip(
+            cols.start_ms.tolist(),
+            cols.end_ms.tolist(),
+            cols.swara_ids.tolist(),
+            cols.octaves,
+            cols.freq_hz.tolist(),
+            cols.cents_dev.tolist(),
+            cols.confidence.tolist(),
+            strict=True,
+        )
+    ]
+    bounds = transcription.phrase_bounds.tolist()
     phrases_out = [
-        TranscribedPhraseOut(
-            notes=[
-                TranscribedNoteOut(
-                    start_ms=n.start_ms,
-                    end_ms=n.end_ms,
-                    swara_id=n.swara_id,
-                    octave=n.octave.value,
-                    frequency_hz=round(n.frequency_hz, 2),
-                    cents_deviation=round(n.cents_deviation, 2),
-                    confidence=round(n.confidence, 3),
-                )
-                for n in phrase.notes
-            ],
-            start_ms=phrase.start_ms,
-            end_ms=phrase.end_ms,
+        TranscribedPhraseOut.model_construct(
+            notes=notes_out[start:stop],
+            start_ms=notes_out[start].start_ms,
+            end_ms=notes_out[stop - 1].end_ms,
         )
-        for phrase in transcription.phrases
+        for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
     ]
 
     # --- 8. Optional pitch contour ---
     contour_out = None
     if include_contour:
+        timestamps = contour.timestamps.tolist()
+        freqs = np.round(contour.frequencies, 2).tolist()
+        confs = np.round(contour.confidences, 3).tolist()
         contour_out = [
-            PitchFrameOut(
-                timestamp_ms=f.timestamp_ms,
-                frequency_hz=round(f.frequency_hz, 2),
-                confidence=round(f.confidence, 3),
+            PitchFrameOut.model_construct(
+                timestamp_ms=t, frequency_hz=f, confidence=c,
             )
-            for f in contour.frames
+            for t, f, c in zip(timestamps, freqs, confs, strict=True)
         ]
 
     return AnalysisResponse(
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from collections.abc import Sequence
+
+from fastapi import APIRouter, Request, Response
+from pydantic import TypeAdapter
 
 from crj_engine.api.schemas import SwarasthanaOut, TuningPresetOut
+from crj_engine.raga.matcher import RagaMatcher
 
 router = APIRouter()
 
+_SWARASTHANAS_ADAPTER = TypeAdapter(list[SwarasthanaOut])
+_TUNING_PRESETS_ADAPTER = TypeAdapter(list[TuningPresetOut])
+_RAGAS_ADAPTER = TypeAdapter(list[dict])
 
-@router.get("/swarasthanas", response_model=list[SwarasthanaOut])
-async def get_swarasthanas(request: Request) -> list[SwarasthanaOut]:
-    """Return the 12 swarasthanas with multilingual names."""
-    return [
+
+def build_reference_payloads(
+    matcher: RagaMatcher,
+    swarasthanas: Sequence[dict],
+) -> dict[str, bytes]:
+    """Serialize the static reference data once, at application startup.
+
+    The data never changes for the life of the process, so the handlers
+    below just return these bytes instead of rebuilding and re-encoding the
+    same models on every request.
+
+    Args:
+        matcher: The loaded raga matcher (source of the 72 Melakartas).
+        swarasthanas: Swarasthana definitions from ``swarasthanas.json``.
+
+    Returns:
+        JSON bodies keyed by ``"swarasthanas"``, ``"tuning_presets"`` and
+        ``"ragas"``.
+    """
+    from crj_engine.pitch.audio_io import load_config
+
+    swaras = [
         SwarasthanaOut(
             index=s["index"],
             id=s["id"],
@@ -23,17 +48,11 @@ async def get_swarasthanas(request: Request) -> list[SwarasthanaOut]:
             is_fixed=s["is_fixed"],
             aliases=s.get("aliases", []),
         )
-        for s in request.app.state.swarasthanas
+        for s in swarasthanas
     ]
 
-
-@router.get("/tuning-presets", response_model=list[TuningPresetOut])
-async def get_tuning_presets() -> list[TuningPresetOut]:
-    """Return available Sa tuning presets."""
-    from crj_engine.pitch.audio_io import load_config
-
     config = load_config("tuning.json")
-    return [
+    presets = [
         TuningPresetOut(
             id=pid,
             description=p["description"],
@@ -43,12 +62,7 @@ async def get_tuning_presets() -> list[TuningPresetOut]:
         for pid, p in config["presets"].items()
     ]
 
-
-@router.get("/ragas")
-async def get_ragas(request: Request) -> list[dict]:
-    """Return all 72 Melakarta ragas."""
-    matcher = request.app.state.raga_matcher
-    return [
+    ragas = [
         {
             "number": r.number,
             "name": r.name,
@@ -59,3 +73,52 @@ async def get_ragas(request: Request) -> list[dict]:
         }
         for r in matcher.ragas
     ]
+
+    return {
+        "swarasthanas": _SWARASTHANAS_ADAPTER.dump_json(swaras),
+        "tuning_presets": _TUNING_PRESETS_ADAPTER.dump_json(presets),
+        "ragas": _RAGAS_ADAPTER.dump_json(ragas),
+    }
+
+
+def _reference_payloads(request: Request) -> dict[str, bytes]:
+    """The app's reference payloads, built and cached on first use if needed.
+
+    The lifespan handler normally builds them at startup; an app served
+    without it (e.g. ``TestClient(app)`` outside a ``with`` block) builds
+    them here once instead of failing.
+    """
+    state = request.app.state
+    payloads = getattr(state, "reference_payloads", None)
+    if payloads is None:
+        from crj_engine.swara.mapper import _load_swarasthanas
+
+        matcher = getattr(state, "raga_matcher", None) or RagaMatcher()
+        payloads = build_reference_payloads(matcher, _load_swarasthanas())
+        state.reference_payloads = payloads
+    return payloads
+
+
+def _json_response(request: Request, key: str) -> Response:
+    return Response(
+        content=_reference_payloads(request)[key],
+        media_type="application/json",
+    )
+
+
+@router.get("/swarasthanas", response_model=list[SwarasthanaOut])
+async def get_swarasthanas(request: Request) -> Response:
+    """Return the 12 swarasthanas with multilingual names."""
+    return _json_response(request, "swarasthanas")
+
+
+@router.get("/tuning-presets", response_model=list[TuningPresetOut])
+async def get_tuning_presets(request: Request) -> Response:
+    """Return available Sa tuning presets."""
+    return _json_response(request, "tuning_presets")
+
+
+@router.get("/ragas")
+async def get_ragas(request: Request) -> Response:
+    """Return all 72 Melakarta ragas."""
+    return _json_response(request, "ragas")
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import smtplib
 import subprocess
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+from typing import TextIO
 
 _CONFIGS_DIR = Path(__file__).resolve().parents[2] / "configs"
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=1)
 def _load_config() -> dict:
+    # NB: lru_cache returns the dict by reference — callers must not mutate.
     with open(_CONFIGS_DIR / "notify.json", encoding="utf-8") as f:
         return json.load(f)
 
@@ -31,33 +38,151 @@ def _get_smtp_settings(config: dict) -> dict:
     }
 
 
-def _get_git_info() -> dict:
-    """Gather current git state for the notification."""
-    def run(cmd: list[str]) -> str:
+class _SMTPPool:
+    """Keeps one authenticated SMTP connection open across notifications.
+
+    Connecting, STARTTLS and AUTH cost several round-trips each, far more
+    than the message itself. The connection is checked with NOOP before
+    reuse and recycled after ``max_messages`` sends.
+    """
+
+    def __init__(self, max_messages: int = 100):
+        self.max_messages = max_messages
+        self._smtp: smtplib.SMTP | None = None
+        self._key: tuple | None = None
+        self._sent = 0
+
+    def get(self, settings: dict) -> smtplib.SMTP:
+        """Return a live connection for ``settings``, reconnecting if needed."""
+        key = (settings["host"], settings["port"], settings["username"])
+        if self._smtp is not None:
+            if key != self._key or self._sent >= self.max_messages:
+                self.close()
+            else:
+                try:
+                    self._smtp.noop()
+                except OSError:  # includes SMTPException / dropped sockets
+                    self.close()
+
+        if self._smtp is None:
+            server = smtplib.SMTP(settings["host"], settings["port"])
+            try:
+                if settings["use_tls"]:
+                    server.starttls()
+                server.login(settings["username"], settings["password"])
+            except Exception:
+                server.close()
+                raise
+            self._smtp, self._key, self._sent = server, key, 0
+        return self._smtp
+
+    def mark_sent(self) -> None:
+        self._sent += 1
+
+    def close(self) -> None:
+        """Quit the open connection, if any, ignoring errors."""
+        if self._smtp is None:
+            return
         try:
-            return subprocess.check_output(cmd, cwd=_PROJECT_ROOT, text=True).strip()
+            self._smtp.quit()
         except Exception:
-            return ""
+            self._smtp.close()
+        self._smtp, self._key = None, None
+
+
+_SMTP_POOL = _SMTPPool()
+atexit.register(_SMTP_POOL.close)
+
 
+def _git_info_pygit2() -> dict | None:
+    """Read the git state in-process with pygit2 (libgit2), if installed.
+
+    pygit2 is the optional ``git`` extra (``pip install crj-engine[git]``).
+
+    Returns None when pygit2 is unavailable or the repository can't be
+    read, so the caller can fall back to the ``git`` CLI.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+
+    try:
+        repo = pygit2.Repository(str(_PROJECT_ROOT))
+        commit = repo.head.peel(pygit2.Commit)
+        branch = "HEAD" if repo.head_is_detached else repo.head.shorthand
+        tag = ""
+        for name in sorted(repo.references):
+            if not name.startswith("refs/tags/"):
+                continue
+            if repo.references[name].peel(pygit2.Commit).id == commit.id:
+                tag = name[len("refs/tags/"):]
+                break
+    except Exception:
+        return None
+
+    # Same as git's %s: the first paragraph of the message on one line
+    subject = " ".join(commit.message.strip().split("\n\n", 1)[0].split())
     return {
-        "branch": run(["git", "rev-parse", "--abbrev-ref", "HEAD"]),
-        "commit": run(["git", "rev-parse", "--short", "HEAD"]),
-        "commit_msg": run(["git", "log", "-1", "--pretty=%s"]),
-        "author": run(["git", "log", "-1", "--pretty=%an"]),
-        "tag": run(["git", "describe", "--tags", "--exact-match", "HEAD"]),
+        "branch": branch,
+        "commit": commit.short_id,
+        "commit_msg": subject,
+        "author": commit.author.name,
+        "tag": tag,
     }
 
 
-def _build_html_body(
-    milestone_label: str,
-    tag: str,
-    details: str,
-    git_info: dict,
-) -> str:
-    """Build a clean HTML email body."""
-    now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
+@lru_cache(maxsize=1)
+def _get_git_info() -> dict:
+    """Gather current git state for the notification.
+
+    Uses pygit2 when it is installed, avoiding a git process entirely;
+    otherwise shells out to ``git log`` once. Cached for the life of the
+    process: HEAD does not move while a CLI run or CI job is sending its
+    milestone notifications.
+    """
+    info = _git_info_pygit2()
+    if info is not None:
+        return info
 
-    return f"""\
+    # One git process instead of five: %D lists the ref names at HEAD
+    # ("HEAD -> main, tag: v0.1.0, origin/main"), which yields both the
+    # branch and any exact tag. The subject goes last as it is free text.
+    try:
+        out = subprocess.run(
+            [
+                "git", "log", "-1", "--decorate=short",
+                "--pretty=format:%h%x1f%an%x1f%D%x1f%s",
+            ],
+            cwd=_PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        commit, author, refs, commit_msg = out.strip().split("\x1f", 3)
+    except Exception:
+        return {"branch": "", "commit": "", "commit_msg": "", "author": "", "tag": ""}
+
+    branch = ""
+    tag = ""
+    for ref in refs.split(", "):
+        if ref.startswith("HEAD -> "):
+            branch = ref[len("HEAD -> "):]
+        elif ref == "HEAD":
+            branch = "HEAD"  # detached, as `git rev-parse --abbrev-ref` reports
+        elif ref.startswith("tag: ") and not tag:
+            tag = ref[len("tag: "):]
+
+    return {
+        "branch": branch,
+        "commit": commit,
+        "commit_msg": commit_msg,
+        "author": author,
+        "tag": tag,
+    }
+
+
+_HTML_TEMPLATE = Template("""\
 <html>
 <body style="font-family: 'Segoe UI', Arial, sans-serif;
   max-width: 600px; margin: 0 auto; color: #333;">
@@ -69,38 +194,35 @@ def _build_html_body(
 
   <div style="border: 1px solid #e0e0e0; border-top: none;
     padding: 24px; border-radius: 0 0 8px 8px;">
-    <h2 style="color: #1a1a2e; margin-top: 0;">{milestone_label}</h2>
+    <h2 style="color: #1a1a2e; margin-top: 0;">$milestone_label</h2>
 
     <table style="width: 100%; border-collapse: collapse; margin: 16px 0;">
       <tr>
         <td style="padding: 8px 12px; background: #f5f5f5;
           font-weight: bold; width: 120px;">Tag</td>
-        <td style="padding: 8px 12px; background: #f5f5f5;"><code>{tag}</code></td>
+        <td style="padding: 8px 12px; background: #f5f5f5;"><code>$tag</code></td>
       </tr>
       <tr>
         <td style="padding: 8px 12px; font-weight: bold;">Branch</td>
-        <td style="padding: 8px 12px;">{git_info.get('branch', '—')}</td>
+        <td style="padding: 8px 12px;">$branch</td>
       </tr>
       <tr>
         <td style="padding: 8px 12px; background: #f5f5f5; font-weight: bold;">Commit</td>
         <td style="padding: 8px 12px; background: #f5f5f5;">
-          <code>{git_info.get('commit', '—')}</code> — {git_info.get('commit_msg', '')}
+          <code>$commit</code> — $commit_msg
         </td>
       </tr>
       <tr>
         <td style="padding: 8px 12px; font-weight: bold;">Author</td>
-        <td style="padding: 8px 12px;">{git_info.get('author', '—')}</td>
+        <td style="padding: 8px 12px;">$author</td>
       </tr>
       <tr>
         <td style="padding: 8px 12px; background: #f5f5f5; font-weight: bold;">Time</td>
-        <td style="padding: 8px 12px; background: #f5f5f5;">{now}</td>
+        <td style="padding: 8px 12px; background: #f5f5f5;">$now</td>
       </tr>
     </table>
 
-    {f'<div style="margin-top: 16px; padding: 16px; background: #f0f7ff;'
-     f' border-left: 4px solid #2196F3; border-radius: 4px;">'
-     f'<strong>Details:</strong><br/>{details}</div>'
-     if details else ''}
+    $details_block
 
     <hr style="border: none; border-top: 1px solid #e0e0e0; margin: 24px 0;" />
     <p style="color: #888; font-size: 12px; margin: 0;">
@@ -109,7 +231,65 @@ def _build_html_body(
     </p>
   </div>
 </body>
-</html>"""
+</html>""")
+
+_DETAILS_TEMPLATE = Template(
+    '<div style="margin-top: 16px; padding: 16px; background: #f0f7ff;'
+    ' border-left: 4px solid #2196F3; border-radius: 4px;">'
+    '<strong>Details:</strong><br/>$details</div>'
+)
+
+
+def _build_html_body(
+    milestone_label: str,
+    tag: str,
+    details: str,
+    git_info: dict,
+) -> str:
+    """Build a clean HTML email body from the module-level templates."""
+    now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
+
+    return _HTML_TEMPLATE.substitute(
+        milestone_label=milestone_label,
+        tag=tag,
+        branch=git_info.get("branch", "—"),
+        commit=git_info.get("commit", "—"),
+        commit_msg=git_info.get("commit_msg", ""),
+        author=git_info.get("author", "—"),
+        now=now,
+        details_block=_DETAILS_TEMPLATE.substitute(details=details) if details else "",
+    )
+
+
+def _build_message(
+    milestone_label: str,
+    tag: str,
+    details: str,
+    git_info: dict,
+    from_addr: str,
+    to_addr: str,
+) -> MIMEMultipart:
+    """Build the plain-text + HTML email for one milestone."""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = f"[CRJ Engine] {milestone_label}"
+    msg["From"] = from_addr
+    msg["To"] = to_addr
+
+    plain_text = (
+        f"CRJ Engine — Milestone Notification\n"
+        f"{'=' * 40}\n\n"
+        f"Milestone: {milestone_label}\n"
+        f"Tag:       {tag}\n"
+        f"Branch:    {git_info.get('branch', '—')}\n"
+        f"Commit:    {git_info.get('commit', '—')} — {git_info.get('commit_msg', '')}\n"
+        f"Author:    {git_info.get('author', '—')}\n\n"
+        f"{f'Details: {details}' if details else ''}\n"
+    )
+    html_body = _build_html_body(milestone_label, tag, details, git_info)
+
+    msg.attach(MIMEText(plain_text, "plain"))
+    msg.attach(MIMEText(html_body, "html"))
+    return msg
 
 
 def send_notification(
@@ -129,6 +309,33 @@ def send_notification(
     Returns:
         True if email was sent successfully, False otherwise.
     """
+    return send_notifications_batch(
+        [(milestone_label, tag, details)], recipient=recipient,
+    )[0]
+
+
+def send_notifications_batch(
+    milestones: Iterable[tuple[str, str, str]],
+    recipient: str | None = None,
+) -> list[bool]:
+    """Send several milestone notifications over one SMTP session.
+
+    The config, git info and SMTP connection are set up once and shared by
+    every message, so N milestones cost one connect/STARTTLS/AUTH rather
+    than N, and their log entries are appended in a single write. If a
+    send fails, the connection is dropped and the next message reconnects.
+
+    Args:
+        milestones: ``(milestone_label, tag, details)`` tuples, sent in order.
+        recipient: Override recipient email (defaults to config).
+
+    Returns:
+        One success flag per milestone, as from :func:`send_notification`.
+    """
+    milestones = list(milestones)
+    if not milestones:
+        return []
+
     config = _load_config()
     smtp = _get_smtp_settings(config)
     git_info = _get_git_info()
@@ -136,74 +343,89 @@ def send_notification(
     to_addr = recipient or os.environ.get("CRJ_NOTIFY_RECIPIENT", config["recipient"])
     from_addr = os.environ.get("CRJ_NOTIFY_SENDER", config["sender"])
 
+    entries = []
     if not smtp["host"] or not smtp["username"]:
-        print("[notify] SMTP not configured. Notification logged locally:")
-        print(f"  Milestone: {milestone_label}")
-        print(f"  Tag:       {tag}")
-        print(f"  Commit:    {git_info.get('commit', '?')} — {git_info.get('commit_msg', '')}")
-        print(f"  Details:   {details}")
-        _log_locally(milestone_label, tag, details, git_info)
-        return False
-
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = f"[CRJ Engine] {milestone_label}"
-    msg["From"] = from_addr
-    msg["To"] = to_addr
-
-    plain_text = (
-        f"CRJ Engine — Milestone Notification\n"
-        f"{'=' * 40}\n\n"
-        f"Milestone: {milestone_label}\n"
-        f"Tag:       {tag}\n"
-        f"Branch:    {git_info.get('branch', '—')}\n"
-        f"Commit:    {git_info.get('commit', '—')} — {git_info.get('commit_msg', '')}\n"
-        f"Author:    {git_info.get('author', '—')}\n\n"
-        f"{f'Details: {details}' if details else ''}\n"
-    )
-    html_body = _build_html_body(milestone_label, tag, details, git_info)
+        for milestone_label, tag, details in milestones:
+            print("[notify] SMTP not configured. Notification logged locally:")
+            print(f"  Milestone: {milestone_label}")
+            print(f"  Tag:       {tag}")
+            print(
+                f"  Commit:    {git_info.get('commit', '?')} — "
+                f"{git_info.get('commit_msg', '')}"
+            )
+            print(f"  Details:   {details}")
+            entries.append(_log_entry(milestone_label, tag, details, git_info))
+        _log_file().write("".join(entries))
+        return [False] * len(milestones)
+
+    results = []
+    server = None
+    for milestone_label, tag, details in milestones:
+        msg = _build_message(milestone_label, tag, details, git_info, from_addr, to_addr)
+        try:
+            if server is None:
+                server = _SMTP_POOL.get(smtp)
+            try:
+                server.sendmail(from_addr, [to_addr], msg.as_string())
+            except Exception:
+                _SMTP_POOL.close()  # don't reuse a connection in an unknown state
+                server = None
+                raise
+            _SMTP_POOL.mark_sent()
+        except Exception as e:
+            print(f"[notify] Failed to send email: {e}")
+            entries.append(
+                _log_entry(milestone_label, tag, details, git_info, error=str(e))
+            )
+            results.append(False)
+        else:
+            print(f"[notify] Email sent to {to_addr}: {milestone_label}")
+            entries.append(_log_entry(milestone_label, tag, details, git_info, sent=True))
+            results.append(True)
+
+    _log_file().write("".join(entries))
+    return results
+
+
+# Notification log, opened once per process on first use.
+_LOG_FH: TextIO | None = None
+
+
+def _log_file() -> TextIO:
+    """Return the shared append handle for ``data/notifications.log``.
+
+    Opened in append mode (``O_APPEND``, so concurrent processes interleave
+    whole writes) and line-buffered, so each entry still reaches the file
+    as soon as it is written.
+    """
+    global _LOG_FH  # noqa: PLW0603
+    if _LOG_FH is None:
+        log_path = _PROJECT_ROOT / "data" / "notifications.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _LOG_FH = open(log_path, "a", buffering=1, encoding="utf-8")  # noqa: SIM115
+        atexit.register(_LOG_FH.close)
+    return _LOG_FH
 
-    msg.attach(MIMEText(plain_text, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
 
-    try:
-        with smtplib.SMTP(smtp["host"], smtp["port"]) as server:
-            if smtp["use_tls"]:
-                server.starttls()
-            server.login(smtp["username"], smtp["password"])
-            server.sendmail(from_addr, [to_addr], msg.as_string())
-        print(f"[notify] Email sent to {to_addr}: {milestone_label}")
-        _log_locally(milestone_label, tag, details, git_info, sent=True)
-        return True
-    except Exception as e:
-        print(f"[notify] Failed to send email: {e}")
-        _log_locally(milestone_label, tag, details, git_info, sent=False, error=str(e))
-        return False
-
-
-def _log_locally(
+def _log_entry(
     milestone_label: str,
     tag: str,
     details: str,
     git_info: dict,
     sent: bool = False,
     error: str = "",
-) -> None:
-    """Append a record to the local notification log."""
-    log_path = _PROJECT_ROOT / "data" / "notifications.log"
+) -> str:
+    """Format one record of the local notification log."""
     now = datetime.now(UTC).isoformat()
     status = "SENT" if sent else ("FAILED" if error else "LOCAL_ONLY")
 
-    entry = (
+    return (
         f"[{now}] [{status}] {milestone_label} | tag={tag} "
         f"| commit={git_info.get('commit', '?')} "
         f"| {details}"
         f"{f' | error={error}' if error else ''}\n"
     )
 
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "a") as f:
-        f.write(entry)
-
 
 def notify_for_tag(tag: str, details: str = "") -> bool:
     """Look up a git tag in the milestone list and send notification if it matches."""
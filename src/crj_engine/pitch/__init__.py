@@ -1,7 +1,7 @@
 """Pitch detection, contour segmentation, and gamaka classification modules."""
 
 from crj_engine.pitch.detector import PitchAlgorithm, PitchContour, PitchFrame
-from crj_engine.pitch.gamaka import GamakaResult, GamakaType, classify_gamaka
+from crj_engine.pitch.gamaka import GamakaResult, GamakaType, classify_gamaka, classify_gamakas
 from crj_engine.pitch.segmenter import PitchSegment, segment_contour
 
 __all__ = [
@@ -12,5 +12,6 @@ __all__ = [
     "GamakaResult",
     "GamakaType",
     "classify_gamaka",
+    "classify_gamakas",
     "segment_contour",
 ]
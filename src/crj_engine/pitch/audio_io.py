@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
 from pathlib import Path
+from typing import BinaryIO
 
 import numpy as np
 
@@ -18,24 +21,70 @@ def load_config(config_name: str = "tuning.json") -> dict:
         return json.load(f)
 
 
+# ffmpeg demuxer names for container formats whose name differs
+_FFMPEG_DEMUXERS: dict[str, str] = {"wma": "asf"}
+
+
+def _load_via_ffmpeg(
+    file_path: Path | BinaryIO, target_sr: int, fmt: str | None = None,
+) -> tuple[np.ndarray, int]:
+    """Decode straight to mono float32 at ``target_sr`` through an ffmpeg pipe.
+
+    ffmpeg does the decode, down-mix and resample in one pass and streams raw
+    ``f32le`` samples to stdout, so there is no intermediate WAV encode/parse
+    and no separate resampling step.
+
+    A file-like source is fed on stdin through ffmpeg's ``cache:`` protocol,
+    which makes the pipe seekable (MP4/M4A files with the ``moov`` atom at
+    the end can't be decoded without seeking), with *fmt* as the demuxer
+    hint since a pipe can't be probed the way a file can.
+    """
+    if isinstance(file_path, Path):
+        input_args, stdin_data = ["-i", str(file_path)], None
+    else:
+        input_args = ["-read_ahead_limit", "-1", "-i", "cache:pipe:0"]
+        if fmt:
+            input_args = ["-f", _FFMPEG_DEMUXERS.get(fmt, fmt), *input_args]
+        stdin_data = file_path.read()
+
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            *input_args,
+            "-f", "f32le", "-acodec", "pcm_f32le",
+            "-ac", "1", "-ar", str(target_sr),
+            "pipe:1",
+        ],
+        input=stdin_data,
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        msg = proc.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg failed to decode audio: {msg}")
+    return np.frombuffer(proc.stdout, dtype="<f4").copy(), target_sr
+
+
 def _load_via_pydub(
-    file_path: Path, fmt: str, target_sr: int,
+    file_path: Path | BinaryIO, fmt: str, target_sr: int,
 ) -> tuple[np.ndarray, int]:
     """Load audio via pydub (requires ffmpeg). Works for MP3, M4A, AAC, OGG, etc."""
     import io
 
-    import librosa
     import soundfile as sf
     from pydub import AudioSegment
 
-    seg = AudioSegment.from_file(str(file_path), format=fmt)
+    source = str(file_path) if isinstance(file_path, Path) else file_path
+    seg = AudioSegment.from_file(source, format=fmt)
     seg = seg.set_channels(1)  # mono
     buf = io.BytesIO()
     seg.export(buf, format="wav")
     buf.seek(0)
     audio, sr_native = sf.read(buf, dtype="float32")
     if target_sr and target_sr != sr_native:
-        audio = librosa.resample(audio, orig_sr=sr_native, target_sr=target_sr)
+        import soxr
+
+        audio = soxr.resample(audio, sr_native, target_sr, quality="HQ")
         sr_native = target_sr
     return audio.astype(np.float32), sr_native
 
@@ -51,33 +100,55 @@ _PYDUB_FORMATS: dict[str, str] = {
 }
 
 
-def load_audio(file_path: str | Path, target_sr: int = 16000) -> tuple[np.ndarray, int]:
+def load_audio(
+    file_path: str | Path | BinaryIO,
+    target_sr: int = 16000,
+    format: str | None = None,
+) -> tuple[np.ndarray, int]:
     """Load an audio file and return (samples, sample_rate).
 
     Handles WAV, MP3, M4A, AAC, FLAC, OGG, WebM. Converts to mono and resamples to target_sr.
 
     Args:
-        file_path: Path to the audio file.
+        file_path: Path to the audio file, or a binary file-like object
+            (e.g. ``io.BytesIO``) holding the encoded audio.
         target_sr: Target sample rate in Hz (default 16kHz for pitch detection).
+        format: Container format of a file-like source (e.g. "wav" or ".wav").
+            Ignored for paths, whose suffix is used instead.
 
     Returns:
         Tuple of (audio_samples as float32 numpy array, sample_rate).
     """
-    import librosa
-
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {file_path}")
-
-    suffix = file_path.suffix.lower()
-
-    # MP3, M4A, AAC, OGG, WMA — convert via pydub (ffmpeg)
+    if isinstance(file_path, str | Path):
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        suffix = file_path.suffix.lower()
+        source = str(file_path)
+    else:
+        suffix = "." + format.lower().lstrip(".") if format else ""
+        source = file_path
+
+    # MP3, M4A, AAC, OGG, WMA — decode via an ffmpeg pipe, or pydub if the
+    # ffmpeg binary isn't on PATH (pydub can be pointed at one elsewhere)
     if suffix in _PYDUB_FORMATS:
+        if target_sr and shutil.which("ffmpeg"):
+            return _load_via_ffmpeg(file_path, target_sr, _PYDUB_FORMATS[suffix])
         return _load_via_pydub(file_path, _PYDUB_FORMATS[suffix], target_sr)
 
-    # WAV, FLAC — librosa handles natively via soundfile
-    audio, sr = librosa.load(str(file_path), sr=target_sr, mono=True)
-    return audio.astype(np.float32), sr
+    # WAV, FLAC — read with soundfile directly; librosa.load would only wrap
+    # the same calls after importing its whole stack
+    import soundfile as sf
+
+    data, sr = sf.read(source, dtype="float32", always_2d=True)
+    audio = data.mean(axis=1, dtype=np.float32) if data.shape[1] > 1 else data[:, 0]
+    if target_sr and target_sr != sr:
+        import soxr
+
+        # "HQ" matches librosa.load's default soxr_hq resampler
+        audio = soxr.resample(audio, sr, target_sr, quality="HQ")
+        sr = target_sr
+    return np.ascontiguousarray(audio, dtype=np.float32), sr
 
 
 def get_duration(audio: np.ndarray, sr: int) -> float:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -22,38 +23,133 @@ class PitchFrame:
     confidence: float
 
 
-@dataclass
+def _readonly_column(values) -> np.ndarray:
+    """float64 read-only view of *values* (no copy when already float64).
+
+    Only the view is locked, so an array handed in by the caller stays
+    writable on their side.
+    """
+    column = np.asarray(values, dtype=np.float64).view()
+    column.flags.writeable = False
+    return column
+
+
+@dataclass(init=False, eq=False)
 class PitchContour:
-    """Complete pitch contour from an audio analysis."""
+    """Complete pitch contour from an audio analysis.
+
+    Frames are stored column-wise as three parallel, read-only float64
+    arrays, so the ``timestamps`` / ``frequencies`` / ``confidences``
+    accessors hand out the backing buffers without copying. ``frames``
+    builds :class:`PitchFrame` objects on first access for code that walks
+    the contour frame by frame, and ``np.asarray(contour)`` gives a
+    ``(3, n)`` array of timestamps, frequencies and confidences.
+    """
 
-    frames: list[PitchFrame]
+    timestamps: np.ndarray
+    frequencies: np.ndarray
+    confidences: np.ndarray
     algorithm: PitchAlgorithm
     sample_rate: int
     hop_ms: float
 
-    @property
-    def timestamps(self) -> np.ndarray:
-        return np.array([f.timestamp_ms for f in self.frames])
-
-    @property
-    def frequencies(self) -> np.ndarray:
-        return np.array([f.frequency_hz for f in self.frames])
+    def __init__(
+        self,
+        frames: Sequence[PitchFrame],
+        algorithm: PitchAlgorithm,
+        sample_rate: int,
+        hop_ms: float,
+    ):
+        self.timestamps = _readonly_column([f.timestamp_ms for f in frames])
+        self.frequencies = _readonly_column([f.frequency_hz for f in frames])
+        self.confidences = _readonly_column([f.confidence for f in frames])
+        self.algorithm = algorithm
+        self.sample_rate = sample_rate
+        self.hop_ms = hop_ms
+        self._frames: list[PitchFrame] | None = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: np.ndarray,
+        frequencies: np.ndarray,
+        confidences: np.ndarray,
+        algorithm: PitchAlgorithm,
+        sample_rate: int,
+        hop_ms: float,
+    ) -> PitchContour:
+        """Build a contour directly from parallel per-frame arrays."""
+        contour = cls.__new__(cls)
+        contour.timestamps = _readonly_column(timestamps)
+        contour.frequencies = _readonly_column(frequencies)
+        contour.confidences = _readonly_column(confidences)
+        contour.algorithm = algorithm
+        contour.sample_rate = sample_rate
+        contour.hop_ms = hop_ms
+        contour._frames = None
+        return contour
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy is False:
+            raise ValueError("PitchContour columns cannot be stacked without a copy")
+        return np.stack([self.timestamps, self.frequencies, self.confidences]).astype(
+            dtype or np.float64, copy=False
+        )
 
     @property
-    def confidences(self) -> np.ndarray:
-        return np.array([f.confidence for f in self.frames])
+    def frames(self) -> list[PitchFrame]:
+        """Per-frame view of the contour, built once on first access."""
+        if self._frames is None:
+            self._frames = [
+                PitchFrame(timestamp_ms=t, frequency_hz=f, confidence=c)
+                for t, f, c in zip(
+                    self.timestamps.tolist(),
+                    self.frequencies.tolist(),
+                    self.confidences.tolist(),
+                    strict=True,
+                )
+            ]
+        return self._frames
 
     def filter_by_confidence(self, min_confidence: float = 0.5) -> PitchContour:
         """Return a new PitchContour with only frames above the confidence threshold."""
-        filtered = [f for f in self.frames if f.confidence >= min_confidence]
-        return PitchContour(
-            frames=filtered,
+        mask = self.confidences >= min_confidence
+        return PitchContour.from_arrays(
+            self.timestamps[mask],
+            self.frequencies[mask],
+            self.confidences[mask],
             algorithm=self.algorithm,
             sample_rate=self.sample_rate,
             hop_ms=self.hop_ms,
         )
 
 
+# Device the CREPE model has been loaded onto; None until first use.
+_CREPE_DEVICE: str | None = None
+
+
+def _crepe_device() -> str:
+    """Load the "full" CREPE weights once and return the device they live on.
+
+    Uses the first CUDA device when available, otherwise the CPU.
+    torchcrepe keeps the model on ``torchcrepe.infer`` between calls; loading
+    it here up front means every request reuses the same module instead of
+    depending on torchcrepe's lazy load inside the first ``predict``.
+    """
+    global _CREPE_DEVICE  # noqa: PLW0603
+    if _CREPE_DEVICE is None:
+        import torch
+        import torchcrepe
+
+        device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        torchcrepe.load.model(device, "full")
+        _CREPE_DEVICE = device
+    return _CREPE_DEVICE
+
+
 def detect_pitch_crepe(
     audio: np.ndarray,
     sr: int = 16000,
@@ -74,46 +170,56 @@ def detect_pitch_crepe(
     import torch
     import torchcrepe
 
-    # Convert to torch tensor
-    audio_tensor = torch.tensor(audio).unsqueeze(0).float()
+    device = _crepe_device()
+
+    # Wrap the samples without copying; on a GPU stage them through pinned
+    # memory so the host-to-device copy is asynchronous.
+    audio_tensor = torch.from_numpy(
+        np.ascontiguousarray(audio, dtype=np.float32)
+    ).unsqueeze(0)
+    if device != "cpu":
+        audio_tensor = audio_tensor.pin_memory().to(device, non_blocking=True)
 
     hop_length = int(sr * hop_ms / 1000)
 
-    # Run CREPE pitch detection
-    pitch, periodicity = torchcrepe.predict(
-        audio_tensor,
-        sr,
-        hop_length=hop_length,
-        fmin=50,   # Hz — below typical vocal range
-        fmax=2000,  # Hz — above typical vocal range
-        model="full",
-        batch_size=256,
-        return_periodicity=True,
-    )
+    # Run CREPE pitch detection. This is torchcrepe.predict unrolled so
+    # that only the network forward pass runs in reduced precision: on CUDA
+    # it is autocast to FP16, while the Viterbi decode (which goes through
+    # NumPy) always sees FP32 probabilities.
+    use_fp16 = device != "cpu"
+    pitches, periodicities = [], []
+    with torch.inference_mode():
+        for frames in torchcrepe.preprocess(
+            audio_tensor, sr, hop_length, batch_size=256, device=device
+        ):
+            with torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=use_fp16
+            ):
+                probabilities = torchcrepe.infer(frames, "full", device)
+            probabilities = probabilities.float().reshape(
+                1, -1, torchcrepe.PITCH_BINS
+            ).transpose(1, 2)
+            pitch, periodicity = torchcrepe.postprocess(
+                probabilities,
+                fmin=50,   # Hz — below typical vocal range
+                fmax=2000,  # Hz — above typical vocal range
+                return_periodicity=True,
+            )
+            pitches.append(pitch)
+            periodicities.append(periodicity)
 
     # Convert to numpy
-    pitch_np = pitch.squeeze().numpy()
-    confidence_np = periodicity.squeeze().numpy()
-
-    # Build frames
-    frames = []
-    for i in range(len(pitch_np)):
-        timestamp = i * hop_ms
-        freq = float(pitch_np[i])
-        conf = float(confidence_np[i])
-
-        # Mark unvoiced frames (below confidence) with freq = 0
-        if conf < min_confidence:
-            freq = 0.0
-
-        frames.append(PitchFrame(
-            timestamp_ms=timestamp,
-            frequency_hz=freq,
-            confidence=conf,
-        ))
-
-    return PitchContour(
-        frames=frames,
+    pitch_np = torch.cat(pitches, 1).squeeze().cpu().numpy()
+    confidence_np = torch.cat(periodicities, 1).squeeze().cpu().numpy()
+
+    # Mark unvoiced frames (below confidence) with freq = 0
+    frequencies = np.where(confidence_np < min_confidence, 0.0, pitch_np)
+    timestamps = np.arange(len(pitch_np), dtype=np.float64) * hop_ms
+
+    return PitchContour.from_arrays(
+        timestamps,
+        frequencies,
+        confidence_np,
         algorithm=PitchAlgorithm.CREPE,
         sample_rate=sr,
         hop_ms=hop_ms,
@@ -154,26 +260,17 @@ def detect_pitch_pyin(
         hop_length=hop_length,
     )
 
-    frames = []
-    for i in range(len(f0)):
-        timestamp = i * hop_ms
-        freq = float(f0[i]) if not np.isnan(f0[i]) else 0.0
-        if voiced_probs is not None:
-            conf = float(voiced_probs[i])
-        else:
-            conf = 1.0 if voiced_flag[i] else 0.0
-
-        if conf < min_confidence:
-            freq = 0.0
-
-        frames.append(PitchFrame(
-            timestamp_ms=timestamp,
-            frequency_hz=freq,
-            confidence=conf,
-        ))
-
-    return PitchContour(
-        frames=frames,
+    confidences = voiced_probs if voiced_probs is not None else voiced_flag.astype(np.float64)
+    # Unvoiced (NaN) and low-confidence frames are reported as freq = 0
+    frequencies = np.where(
+        np.isnan(f0) | (confidences < min_confidence), 0.0, f0,
+    )
+    timestamps = np.arange(len(f0), dtype=np.float64) * hop_ms
+
+    return PitchContour.from_arrays(
+        timestamps,
+        frequencies,
+        confidences,
         algorithm=PitchAlgorithm.PYIN,
         sample_rate=sr,
         hop_ms=hop_ms,
@@ -11,11 +11,13 @@ annotated Carnatic vocal data.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 
 import numpy as np
 
+from crj_engine._jit import HAVE_NUMBA, njit
 from crj_engine.pitch.segmenter import PitchSegment
 
 
@@ -47,11 +49,16 @@ class GamakaResult:
 # Internal feature extraction
 # ---------------------------------------------------------------------------
 
-def _clean_cents(cents: np.ndarray) -> np.ndarray:
+def _clean_cents(cents: np.ndarray, nans: np.ndarray | None = None) -> np.ndarray:
     """Return a copy with NaN values interpolated (linear) so downstream
-    calculations are not disrupted by occasional unvoiced frames."""
+    calculations are not disrupted by occasional unvoiced frames.
+
+    *nans* may be passed in when the caller has already computed the
+    ``np.isnan`` mask.
+    """
     clean = cents.copy()
-    nans = np.isnan(clean)
+    if nans is None:
+        nans = np.isnan(clean)
     if nans.all():
         return clean  # nothing to interpolate
     if nans.any():
@@ -71,10 +78,155 @@ def _zero_crossings(signal: np.ndarray) -> int:
     """Count zero-crossings (sign changes) in *signal*."""
     if len(signal) < 2:
         return 0
-    signs = np.sign(signal)
-    # Ignore exact zeros — treat them as continuation of previous sign
-    signs[signs == 0] = 1
-    return int(np.sum(np.diff(signs) != 0))
+    # Exact zeros count as positive; a crossing is any change in negativity.
+    # One bool pass + XOR instead of np.sign / mutate / np.diff on floats.
+    neg = signal < 0
+    return int(np.count_nonzero(neg[1:] ^ neg[:-1]))
+
+
+@njit(cache=True)
+def _gamaka_features_into(cents, clean, deriv):  # pragma: no cover - compiled by numba
+    """Fused NaN-interpolation, derivative, zero-crossing and min/max pass.
+
+    Computes exactly what ``_clean_cents`` / ``_first_derivative`` /
+    ``_zero_crossings`` and the nanmin/nanmax range do, in one loop,
+    writing into the preallocated *clean* and *deriv* buffers.
+    Returns ``(zc, pmin, pmax, n_valid)``.
+    """
+    n = cents.shape[0]
+    clean[:] = cents
+    deriv[:] = 0.0
+
+    # Linear interpolation over interior NaN runs, constant at the edges
+    # (np.interp semantics)
+    prev = -1
+    n_valid = 0
+    for i in range(n):
+        if np.isnan(cents[i]):
+            continue
+        n_valid += 1
+        if prev == -1:
+            for k in range(i):
+                clean[k] = cents[i]
+        elif i - prev > 1:
+            slope = (cents[i] - cents[prev]) / float(i - prev)
+            for k in range(prev + 1, i):
+                clean[k] = slope * float(k - prev) + cents[prev]
+        prev = i
+    if n_valid == 0:
+        return 0, np.nan, np.nan, 0
+    for k in range(prev + 1, n):
+        clean[k] = cents[prev]
+
+    zc = 0
+    pmin = clean[0]
+    pmax = clean[0]
+    prev_neg = False
+    for i in range(1, n):
+        d = clean[i] - clean[i - 1]
+        deriv[i] = d
+        neg = d < 0
+        if neg != prev_neg:
+            zc += 1
+        prev_neg = neg
+        if clean[i] < pmin:
+            pmin = clean[i]
+        if clean[i] > pmax:
+            pmax = clean[i]
+    return zc, pmin, pmax, n_valid
+
+
+@njit(cache=True)
+def _gamaka_features_kernel(cents):  # pragma: no cover - compiled by numba
+    """Single-segment wrapper around ``_gamaka_features_into``.
+
+    Returns ``(clean, deriv, zc, pmin, pmax, n_valid)``.
+    """
+    clean = np.empty_like(cents)
+    deriv = np.empty_like(cents)
+    zc, pmin, pmax, n_valid = _gamaka_features_into(cents, clean, deriv)
+    return clean, deriv, zc, pmin, pmax, n_valid
+
+
+@njit(cache=True)
+def _gamaka_features_batch_kernel(flat, offsets):  # pragma: no cover - compiled by numba
+    """Run ``_gamaka_features_into`` over every segment packed in *flat*.
+
+    Segment ``i`` occupies ``flat[offsets[i]:offsets[i + 1]]``. Returns the
+    packed ``clean`` and ``deriv`` buffers plus per-segment ``zc``, ``pmin``,
+    ``pmax`` and ``n_valid`` arrays.
+    """
+    n_segments = offsets.shape[0] - 1
+    clean = np.empty_like(flat)
+    deriv = np.empty_like(flat)
+    zc = np.zeros(n_segments, dtype=np.int64)
+    pmin = np.empty(n_segments)
+    pmax = np.empty(n_segments)
+    n_valid = np.zeros(n_segments, dtype=np.int64)
+    for i in range(n_segments):
+        lo = offsets[i]
+        hi = offsets[i + 1]
+        zc[i], pmin[i], pmax[i], n_valid[i] = _gamaka_features_into(
+            flat[lo:hi], clean[lo:hi], deriv[lo:hi]
+        )
+    return clean, deriv, zc, pmin, pmax, n_valid
+
+
+def _gamaka_features(
+    cents: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, int, float] | None:
+    """Return ``(clean_cents, deriv, zero_crossings, pitch_range)``.
+
+    Uses the fused Numba kernel when available. Returns None when the
+    segment has no voiced frames at all.
+    """
+    if HAVE_NUMBA:
+        cents = np.ascontiguousarray(cents, dtype=np.float64)
+        clean, deriv, zc, pmin, pmax, n_valid = _gamaka_features_kernel(cents)
+        if n_valid == 0:
+            return None
+        return clean, deriv, int(zc), float(pmax - pmin)
+
+    nans = np.isnan(cents)
+    if nans.all():
+        return None
+    # Fully voiced (the common case): no copy, no interpolation
+    clean = cents if not nans.any() else _clean_cents(cents, nans)
+    # clean is NaN-free here, so plain min/max suffice
+    deriv = _first_derivative(clean)
+    return clean, deriv, _zero_crossings(deriv), float(np.ptp(clean))
+
+
+def _gamaka_features_batch(
+    cents_list: Sequence[np.ndarray],
+) -> list[tuple[np.ndarray, np.ndarray, int, float] | None]:
+    """``_gamaka_features`` for many segments with a single kernel call.
+
+    The segments are packed into one flat buffer with an offsets index so
+    the whole batch costs one dispatch instead of one per segment. The
+    returned ``clean`` / ``deriv`` arrays are views into shared buffers.
+    """
+    if not HAVE_NUMBA or not cents_list:
+        return [_gamaka_features(cents) for cents in cents_list]
+
+    flat = np.concatenate(cents_list).astype(np.float64, copy=False)
+    offsets = np.zeros(len(cents_list) + 1, dtype=np.int64)
+    np.cumsum([len(cents) for cents in cents_list], out=offsets[1:])
+
+    clean, deriv, zc, pmin, pmax, n_valid = _gamaka_features_batch_kernel(flat, offsets)
+    pitch_range = pmax - pmin
+    bounds = offsets.tolist()
+    return [
+        (
+            clean[bounds[i] : bounds[i + 1]],
+            deriv[bounds[i] : bounds[i + 1]],
+            int(zc[i]),
+            float(pitch_range[i]),
+        )
+        if n_valid[i]
+        else None
+        for i in range(len(cents_list))
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -82,8 +234,6 @@ def _zero_crossings(signal: np.ndarray) -> int:
 # ---------------------------------------------------------------------------
 
 def _detect_kampita(
-    cents: np.ndarray,
-    deriv: np.ndarray,
     zc: int,
     pitch_range: float,
     duration_ms: float,
@@ -117,21 +267,21 @@ def _detect_kampita(
 
     return GamakaResult(
         gamaka_type=GamakaType.KAMPITA.value,
-        confidence=round(float(confidence), 3),
+        confidence=round(confidence, 3),
         details={
             "zero_crossings": zc,
-            "pitch_range_cents": round(float(pitch_range), 2),
+            "pitch_range_cents": round(pitch_range, 2),
             "duration_ms": round(duration_ms, 2),
         },
     )
 
 
 def _detect_jaru(
-    cents: np.ndarray,
-    deriv: np.ndarray,
+    first_cents: float,
+    last_cents: float,
+    n_frames: int,
     zc: int,
     pitch_range: float,
-    duration_ms: float,
 ) -> GamakaResult | None:
     """Jaru: smooth monotonic glide between two notes.
 
@@ -140,10 +290,10 @@ def _detect_jaru(
     - Few zero-crossings in the derivative (mostly one direction)
     - Pitch range dominated by net change (not oscillatory)
     """
-    if len(cents) < 3:
+    if n_frames < 3:
         return None
 
-    net_change = cents[-1] - cents[0]
+    net_change = last_cents - first_cents
     abs_net = abs(net_change)
 
     if abs_net < 50:
@@ -165,12 +315,12 @@ def _detect_jaru(
 
     return GamakaResult(
         gamaka_type=GamakaType.JARU.value,
-        confidence=round(float(confidence), 3),
+        confidence=round(confidence, 3),
         details={
-            "net_change_cents": round(float(net_change), 2),
+            "net_change_cents": round(net_change, 2),
             "direction": direction,
-            "monotonicity": round(float(monotonicity), 3),
-            "pitch_range_cents": round(float(pitch_range), 2),
+            "monotonicity": round(monotonicity, 3),
+            "pitch_range_cents": round(pitch_range, 2),
         },
     )
 
@@ -200,40 +350,35 @@ def _detect_sphuritham(
         return None
 
     base_pitch = float(np.median(cents))
-    deviation = cents - base_pitch
+    abs_dev = np.abs(cents - base_pitch)
 
     # Identify spike frames: > 50 cents from base
-    spike_mask = np.abs(deviation) > 50
-    if not np.any(spike_mask):
+    spike_indices = np.flatnonzero(abs_dev > 50)
+    if spike_indices.size == 0:
         return None
 
-    # Find contiguous spike runs and check their duration
-    spike_indices = np.where(spike_mask)[0]
-    runs: list[tuple[int, int]] = []
-    run_start = spike_indices[0]
-    for i in range(1, len(spike_indices)):
-        if spike_indices[i] != spike_indices[i - 1] + 1:
-            runs.append((run_start, spike_indices[i - 1]))
-            run_start = spike_indices[i]
-    runs.append((run_start, spike_indices[-1]))
+    # Contiguous spike runs: split wherever the index sequence jumps
+    breaks = np.flatnonzero(np.diff(spike_indices) != 1) + 1
+    run_starts = spike_indices[np.r_[0, breaks]].tolist()
+    run_ends = spike_indices[np.r_[breaks - 1, spike_indices.size - 1]].tolist()
 
     # Check each run: must be short (<100ms) and segment must return to base
     best_spike: dict | None = None
-    for rs, re in runs:
+    for rs, re in zip(run_starts, run_ends, strict=True):
         run_duration = (re - rs + 1) * hop_ms
         if run_duration >= 100:
             continue  # spike too long
 
-        peak_deviation = float(np.max(np.abs(deviation[rs : re + 1])))
+        peak_deviation = float(np.max(abs_dev[rs : re + 1]))
 
         # Check that the segment returns to base after the spike
         # (within 25 cents of base in the tail after the spike)
         tail_start = re + 1
         if tail_start < len(cents):
-            tail_mean_dev = float(np.mean(np.abs(deviation[tail_start:])))
+            tail_mean_dev = float(np.mean(abs_dev[tail_start:]))
         else:
             # Spike at the very end; check the head instead
-            tail_mean_dev = float(np.mean(np.abs(deviation[: rs]))) if rs > 0 else 999.0
+            tail_mean_dev = float(np.mean(abs_dev[: rs])) if rs > 0 else 999.0
 
         if tail_mean_dev > 25:
             continue
@@ -285,20 +430,51 @@ def classify_gamaka(
     Returns:
         A GamakaResult describing the detected ornament.
     """
-    cents = _clean_cents(segment.cents_from_sa)
+    return _classify_features(
+        _gamaka_features(segment.cents_from_sa), segment.duration_ms, hop_ms
+    )
+
+
+def classify_gamakas(
+    segments: Sequence[PitchSegment],
+    hop_ms: float = 10.0,
+) -> list[GamakaResult]:
+    """Classify many pitch segments at once.
+
+    Gives the same results as calling :func:`classify_gamaka` on each
+    segment, but extracts the features for the whole batch in one pass,
+    which is considerably cheaper for the hundreds of short segments a
+    typical recording produces.
+
+    Args:
+        segments: PitchSegments produced by the segmenter.
+        hop_ms: The hop size in milliseconds between successive frames.
+
+    Returns:
+        One GamakaResult per segment, in order.
+    """
+    features = _gamaka_features_batch([seg.cents_from_sa for seg in segments])
+    return [
+        _classify_features(f, seg.duration_ms, hop_ms)
+        for f, seg in zip(features, segments, strict=True)
+    ]
+
 
+def _classify_features(
+    features: tuple[np.ndarray, np.ndarray, int, float] | None,
+    duration_ms: float,
+    hop_ms: float,
+) -> GamakaResult:
+    """Run the classifiers in priority order on precomputed features."""
     # If the segment is entirely NaN (all unvoiced), return steady with 0 confidence
-    if np.isnan(cents).all():
+    if features is None:
         return GamakaResult(
             gamaka_type=GamakaType.STEADY.value,
             confidence=0.0,
             details={"reason": "all_unvoiced"},
         )
 
-    deriv = _first_derivative(cents)
-    zc = _zero_crossings(deriv)
-    pitch_range = float(np.nanmax(cents) - np.nanmin(cents))
-    duration_ms = segment.duration_ms
+    cents, deriv, zc, pitch_range = features
 
     # Priority order: Sphuritham > Kampita > Jaru > Steady
     # Sphuritham is the most specific (short spike + return); test first.
@@ -306,11 +482,11 @@ def classify_gamaka(
     if result is not None:
         return result
 
-    result = _detect_kampita(cents, deriv, zc, pitch_range, duration_ms)
+    result = _detect_kampita(zc, pitch_range, duration_ms)
     if result is not None:
         return result
 
-    result = _detect_jaru(cents, deriv, zc, pitch_range, duration_ms)
+    result = _detect_jaru(float(cents[0]), float(cents[-1]), len(cents), zc, pitch_range)
     if result is not None:
         return result
 
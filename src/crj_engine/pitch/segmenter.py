@@ -56,6 +56,8 @@ def segment_contour(
     min_voiced_ratio: float = 0.7,
     confidence_threshold: float = 0.5,
     reference_sa_hz: float = 261.63,
+    *,
+    copy: bool = False,
 ) -> list[PitchSegment]:
     """Segment a pitch contour into overlapping windows for gamaka classification.
 
@@ -73,57 +75,75 @@ def segment_contour(
         confidence_threshold: Frames with confidence below this are considered
             unvoiced.
         reference_sa_hz: The tonic Sa frequency in Hz for cents calculation.
+        copy: Give each segment its own arrays. By default segments hold
+            read-only views into shared contour-length buffers.
 
     Returns:
         List of PitchSegment instances, one per valid window.
     """
-    if not contour.frames:
+    if len(contour) == 0:
         return []
 
     timestamps = contour.timestamps
     frequencies = contour.frequencies
     confidences = contour.confidences
 
-    total_duration = timestamps[-1]
-    segments: list[PitchSegment] = []
-
-    start = timestamps[0]
-    while start + window_ms <= total_duration + contour.hop_ms:
-        end = start + window_ms
-
-        # Select frames within [start, end)
-        mask = (timestamps >= start) & (timestamps < end)
-        window_freqs = frequencies[mask]
-        window_confs = confidences[mask]
-
-        if len(window_freqs) == 0:
-            start += hop_ms
-            continue
-
-        # Check voiced ratio
-        voiced_count = np.sum(window_confs >= confidence_threshold)
-        voiced_ratio = voiced_count / len(window_confs)
-
-        if voiced_ratio < min_voiced_ratio:
-            start += hop_ms
-            continue
+    # Cents for every frame, computed once: windows overlap, so converting
+    # per window would redo most frames several times. Unvoiced and
+    # non-positive frames are NaN.
+    voiced = (confidences >= confidence_threshold) & (frequencies > 0)
+    if reference_sa_hz > 0:
+        ratios = np.where(voiced, frequencies / reference_sa_hz, 1.0)
+        all_cents = np.where(voiced, 1200.0 * np.log2(ratios), np.nan)
+    else:
+        all_cents = np.full(len(frequencies), np.nan)
+    # Overlapping segments share this buffer, so nobody may write to it
+    all_cents.flags.writeable = False
+
+    if hop_ms <= 0:
+        raise ValueError(f"hop_ms must be positive, got {hop_ms}")
+
+    # Window start times as a running sum of hop_ms (np.cumsum adds
+    # sequentially, so these match repeated ``start += hop_ms`` exactly),
+    # keeping every window that ends within one frame of the contour's end.
+    limit = timestamps[-1] + contour.hop_ms
+    n_max = max(0, math.floor((limit - window_ms - timestamps[0]) / hop_ms) + 2)
+    starts = np.cumsum(np.r_[timestamps[0], np.full(n_max, hop_ms)])
+    starts = starts[: np.count_nonzero(starts + window_ms <= limit)]
+    if len(starts) == 0:
+        return []
 
-        # Convert voiced frequencies to cents from Sa; unvoiced frames get NaN
-        cents = np.array([
-            _freq_to_cents(f, reference_sa_hz)
-            if conf >= confidence_threshold
-            else float("nan")
-            for f, conf in zip(window_freqs, window_confs, strict=True)
-        ])
+    # Timestamps are ascending, so each window [start, end) is a contiguous
+    # run of frames: find its bounds by binary search rather than building
+    # a boolean mask over the whole contour per window. (Strided
+    # sliding-window views would assume evenly spaced frames, which a
+    # confidence-filtered contour does not have.)
+    lo = np.searchsorted(timestamps, starts, side="left")
+    hi = np.searchsorted(timestamps, starts + window_ms, side="left")
+
+    # Voiced frames per window from a running count
+    confident_count = np.concatenate(
+        ([0], np.cumsum(confidences >= confidence_threshold))
+    )
+    n_frames = hi - lo
+    voiced_ratio = np.divide(
+        confident_count[hi] - confident_count[lo],
+        n_frames,
+        out=np.zeros(len(starts)),
+        where=n_frames > 0,
+    )
+    keep = (n_frames > 0) & (voiced_ratio >= min_voiced_ratio)
 
+    segments: list[PitchSegment] = []
+    for i, i0, i1 in zip(
+        np.flatnonzero(keep).tolist(), lo[keep].tolist(), hi[keep].tolist(), strict=True
+    ):
         segments.append(PitchSegment(
-            start_ms=start,
-            end_ms=end,
-            frequencies=window_freqs.copy(),
+            start_ms=starts[i],
+            end_ms=starts[i] + window_ms,
+            frequencies=frequencies[i0:i1].copy() if copy else frequencies[i0:i1],
             reference_sa_hz=reference_sa_hz,
-            cents_from_sa=cents,
+            cents_from_sa=all_cents[i0:i1].copy() if copy else all_cents[i0:i1],
         ))
 
-        start += hop_ms
-
     return segments
@@ -118,14 +118,8 @@ def _voiced_freqs_from_audio(
     contour = detect_pitch_pyin(
         audio, sr=sr, hop_ms=10.0, min_confidence=min_confidence, fmin=fmin
     )
-    return np.array(
-        [
-            f.frequency_hz
-            for f in contour.frames
-            if f.confidence >= min_confidence and f.frequency_hz > 0
-        ],
-        dtype=np.float64,
-    )
+    voiced = (contour.confidences >= min_confidence) & (contour.frequencies > 0)
+    return contour.frequencies[voiced]
 
 
 def _spectrum_band_energy(
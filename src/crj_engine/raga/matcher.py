@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from crj_engine._jit import HAVE_NUMBA, njit
+
 _CONFIGS_DIR = Path(__file__).resolve().parents[3] / "configs"
 
 # Canonical swara ordering (chromatic position, 0-11)
@@ -23,9 +29,128 @@ ENHARMONIC_MAP = {
 }
 
 
+# Name -> position lookup accepted in detected sequences (upper octave Sa too)
+_NAME_TO_POSITION = {**SWARA_POSITION, "Sa'": 0}
+
+
+def _swara_positions(swaras: list[str]) -> list[int]:
+    """Convert swara names to chromatic positions (0-11) in one pass.
+
+    Does one bound ``dict.get`` per name and validates afterwards.
+
+    Raises:
+        ValueError: If a name is not a known swara.
+    """
+    get = _NAME_TO_POSITION.get
+    positions = [get(s, -1) for s in swaras]
+    if -1 in positions:
+        raise ValueError(f"Unknown swara: {swaras[positions.index(-1)]}")
+    return positions
+
+
+def _positions_mask(positions) -> int:
+    """Pack chromatic positions (0-11) into a 12-bit mask."""
+    mask = 0
+    for p in positions:
+        mask |= 1 << p
+    return mask
+
+
+def _triple_keys(positions: tuple[int, ...]) -> frozenset[int]:
+    """Every run of three consecutive positions, each packed into one int.
+
+    A run ``(a, b, c)`` of 4-bit positions becomes ``a << 8 | b << 4 | c``,
+    which hashes and compares much faster than the tuple.
+    """
+    return frozenset(
+        a << 8 | b << 4 | c
+        for a, b, c in zip(positions, positions[1:], positions[2:], strict=False)
+    )
+
+
+@njit(cache=True)
+def _popcount(x):  # pragma: no cover - compiled by numba
+    """Number of set bits in a (12-bit) position mask."""
+    n = 0
+    while x:
+        x &= x - 1
+        n += 1
+    return n
+
+
+@njit(cache=True)
+def _count_windows(triples, keys, counts):  # pragma: no cover - compiled by numba
+    """Sum ``counts`` of every packed triple in *triples* found in sorted *keys*."""
+    matches = 0
+    for k in triples:
+        j = np.searchsorted(keys, k)
+        if j < keys.shape[0] and keys[j] == k:
+            matches += counts[j]
+    return matches
+
+
+@njit(cache=True)
+def _score_all_ragas(
+    detected_mask, n_detected, n_sequence,
+    raga_masks, raga_sizes,
+    asc_keys, asc_counts, desc_keys, desc_counts,
+    aro_triples, aro_offsets, ava_triples, ava_offsets,
+):  # pragma: no cover - compiled by numba
+    """Set scores and sequence bonuses for every raga in one loop.
+
+    Computes exactly what ``RagaMatcher._set_match_scores`` and
+    ``RagaMatcher._sequence_bonus`` do. Raga ``i``'s packed triples are
+    ``aro_triples[aro_offsets[i]:aro_offsets[i + 1]]`` (likewise for the
+    avarohana); the query windows come as sorted keys with their counts.
+    Returns ``(set_scores, sequence_bonuses)``.
+    """
+    n_ragas = raga_masks.shape[0]
+    set_scores = np.zeros(n_ragas)
+    bonuses = np.zeros(n_ragas)
+    total_windows = max(1, n_sequence - 2)
+    for i in range(n_ragas):
+        size = raga_sizes[i]
+        if size > 0:
+            common = _popcount(detected_mask & raga_masks[i])
+            coverage = common / size
+            purity = common / n_detected if n_detected else 0.0
+            score = (0.6 * coverage + 0.4 * purity) - (n_detected - common) * 0.15
+            score -= (size - common) * 0.05
+            set_scores[i] = min(1.0, max(0.0, score))
+
+        if n_sequence >= 3:
+            matches = _count_windows(
+                aro_triples[aro_offsets[i]:aro_offsets[i + 1]], asc_keys, asc_counts
+            )
+            matches += _count_windows(
+                ava_triples[ava_offsets[i]:ava_offsets[i + 1]], desc_keys, desc_counts
+            )
+            bonuses[i] = min(0.3, matches / total_windows * 0.3)
+    return set_scores, bonuses
+
+
+def _packed_triples(triple_sets: list[frozenset[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack per-raga triple sets into one sorted-per-row array plus offsets."""
+    offsets = np.zeros(len(triple_sets) + 1, dtype=np.int64)
+    np.cumsum([len(t) for t in triple_sets], out=offsets[1:])
+    flat = np.array(
+        [k for triples in triple_sets for k in sorted(triples)], dtype=np.int64
+    )
+    return flat, offsets
+
+
 @dataclass
 class RagaDefinition:
-    """A raga from the Melakarta database."""
+    """A raga from the Melakarta database.
+
+    The chromatic positions of the arohana/avarohana are derived once at
+    construction (``swara_positions``, ``arohana_positions``,
+    ``avarohana_positions``) since every identify() call scores against them.
+    ``swara_mask`` holds the same set as a 12-bit mask (bit ``p`` set for
+    position ``p``), and ``arohana_triples`` / ``avarohana_triples`` every
+    run of three consecutive positions (packed as by ``_triple_keys``), for
+    the sequence bonus.
+    """
 
     number: int
     name: str
@@ -35,15 +160,27 @@ class RagaDefinition:
     ri_ga: list[str]
     dha_ni: list[str]
     aliases: list[str] = field(default_factory=list)
+    swara_positions: frozenset[int] = field(init=False, repr=False, compare=False)
+    arohana_positions: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    avarohana_positions: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    swara_mask: int = field(init=False, repr=False, compare=False)
+    arohana_triples: frozenset[int] = field(init=False, repr=False, compare=False)
+    avarohana_triples: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.swara_positions = frozenset(
+            SWARA_POSITION[s] for s in self.arohana if s in SWARA_POSITION
+        )
+        self.arohana_positions = tuple(_swara_positions(self.arohana))
+        self.avarohana_positions = tuple(_swara_positions(self.avarohana))
+        self.swara_mask = _positions_mask(self.swara_positions)
+        self.arohana_triples = _triple_keys(self.arohana_positions)
+        self.avarohana_triples = _triple_keys(self.avarohana_positions)
 
     @property
     def swara_set(self) -> set[int]:
         """Return the set of chromatic positions used by this raga."""
-        positions = set()
-        for swara in self.arohana:
-            if swara in SWARA_POSITION:
-                positions.add(SWARA_POSITION[swara])
-        return positions
+        return set(self.swara_positions)
 
     @property
     def swara_names(self) -> set[str]:
@@ -69,8 +206,11 @@ class RagaMatcher:
 
     def __init__(self, db_path: str | Path | None = None):
         self.ragas: list[RagaDefinition] = []
+        self._by_number: dict[int, RagaDefinition] = {}
+        self._by_name: dict[str, RagaDefinition] = {}
         path = Path(db_path) if db_path else _CONFIGS_DIR / "ragas" / "melakarta_72.json"
         self._load_database(path)
+        self._build_presence_matrix()
 
     def _load_database(self, path: Path) -> None:
         """Load the Melakarta raga database from JSON."""
@@ -89,89 +229,115 @@ class RagaMatcher:
                 aliases=entry.get("aliases", []),
             ))
 
-    def _normalize_swara(self, swara: str) -> int:
-        """Convert a swara name to its chromatic position (0-11)."""
-        # Handle upper octave Sa
-        if swara == "Sa" or swara == "Sa'":
-            return 0
-        if swara in SWARA_POSITION:
-            return SWARA_POSITION[swara]
-        raise ValueError(f"Unknown swara: {swara}")
-
-    def _swara_set_from_names(self, swaras: list[str]) -> set[int]:
-        """Convert a list of swara names to a set of chromatic positions."""
-        return {self._normalize_swara(s) for s in swaras}
-
-    def _compute_set_match(
-        self, detected_positions: set[int], raga: RagaDefinition
-    ) -> float:
-        """Compute how well the detected swara set matches a raga.
-
-        Returns a score between 0.0 and 1.0.
-        """
-        raga_positions = raga.swara_set
-
-        # Intersection: swaras present in both detected and raga
-        common = detected_positions & raga_positions
-        # Swaras in detected but not in raga (foreign notes)
-        foreign = detected_positions - raga_positions
-        # Swaras in raga but not detected (missing notes — less penalized)
-        missing = raga_positions - detected_positions
+        # Lookup indexes; setdefault keeps the first raga for a repeated key,
+        # matching a front-to-back scan of the list
+        for raga in self.ragas:
+            self._by_number.setdefault(raga.number, raga)
+            for name in (raga.name, *raga.aliases):
+                self._by_name.setdefault(name.lower(), raga)
 
-        if len(raga_positions) == 0:
-            return 0.0
+    def _build_presence_matrix(self) -> None:
+        """Precompute the (n_ragas, 12) swara presence matrix used for scoring.
 
-        # Coverage: what fraction of the raga's swaras did we detect?
-        coverage = len(common) / len(raga_positions)
+        Row ``i`` has a 1 at every chromatic position in ``ragas[i].swara_set``,
+        so the set-match terms for all ragas reduce to one matrix-vector
+        product per query. The same sets as bit masks, and the arohana /
+        avarohana triples packed row by row, feed ``_score_all_ragas``.
+        """
+        self.presence_matrix = np.zeros((len(self.ragas), 12), dtype=np.int8)
+        for i, raga in enumerate(self.ragas):
+            self.presence_matrix[i, sorted(raga.swara_positions)] = 1
+        self._raga_sizes = self.presence_matrix.sum(axis=1, dtype=np.int64)
+        self._raga_masks = np.array([raga.swara_mask for raga in self.ragas], dtype=np.int64)
+        self._arohana_triples = _packed_triples([r.arohana_triples for r in self.ragas])
+        self._avarohana_triples = _packed_triples([r.avarohana_triples for r in self.ragas])
+
+    def _set_match_scores(self, detected_positions: set[int]) -> np.ndarray:
+        """Score how well the detected swara set matches every raga at once.
+
+        Rewards coverage of the raga's swaras and purity of the detected
+        ones, penalizing foreign notes (0.15 each) more than missing ones
+        (0.05 each). Returns one score in [0, 1] per raga.
+        """
+        query = np.zeros(12, dtype=np.int8)
+        query[sorted(detected_positions)] = 1
+        n_detected = len(detected_positions)
 
-        # Purity: what fraction of detected swaras belong to the raga?
-        purity = len(common) / len(detected_positions) if detected_positions else 0.0
+        common = self.presence_matrix.astype(np.int64) @ query
+        sizes = self._raga_sizes
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = np.where(sizes > 0, common / sizes, 0.0)
+        purity = common / n_detected if n_detected else np.zeros(len(sizes))
 
-        # Foreign note penalty: stronger than missing note penalty
-        foreign_penalty = len(foreign) * 0.15
-        missing_penalty = len(missing) * 0.05
+        foreign_penalty = (n_detected - common) * 0.15
+        missing_penalty = (sizes - common) * 0.05
 
         score = (0.6 * coverage + 0.4 * purity) - foreign_penalty - missing_penalty
-        return max(0.0, min(1.0, score))
-
-    def _compute_sequence_match(
-        self, detected_swaras: list[str], raga: RagaDefinition
+        score = np.clip(score, 0.0, 1.0)
+        score[sizes == 0] = 0.0
+        return score
+
+    @staticmethod
+    def _directional_windows(
+        detected_positions: list[int],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Strictly ascending and descending windows as sorted keys and counts.
+
+        Each window of three consecutive positions is packed as in
+        ``_triple_keys``. The windows are taken as a strided view over an
+        ``int8`` array, so a long query is classified and packed with a
+        handful of array ops. Returns ``(asc_keys, asc_counts, desc_keys,
+        desc_counts)``.
+        """
+        if len(detected_positions) < 3:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty, empty
+
+        windows = sliding_window_view(np.asarray(detected_positions, dtype=np.int8), 3)
+        a, b, c = windows[:, 0], windows[:, 1], windows[:, 2]
+        keys = (a.astype(np.int64) << 8) | (b.astype(np.int64) << 4) | c
+        asc_keys, asc_counts = np.unique(keys[(a < b) & (b < c)], return_counts=True)
+        desc_keys, desc_counts = np.unique(keys[(a > b) & (b > c)], return_counts=True)
+        return asc_keys, asc_counts, desc_keys, desc_counts
+
+    @classmethod
+    def _directional_triples(
+        cls, detected_positions: list[int],
+    ) -> tuple[Counter[int], Counter[int]]:
+        """Count the strictly ascending and strictly descending windows.
+
+        This depends only on the query, so identify() computes it once and
+        shares it across all ragas.
+        """
+        asc_keys, asc_counts, desc_keys, desc_counts = cls._directional_windows(
+            detected_positions
+        )
+        return (
+            Counter(dict(zip(asc_keys.tolist(), asc_counts.tolist(), strict=True))),
+            Counter(dict(zip(desc_keys.tolist(), desc_counts.tolist(), strict=True))),
+        )
+
+    @staticmethod
+    def _sequence_bonus(
+        ascending: Counter[int],
+        descending: Counter[int],
+        n_detected: int,
+        raga: RagaDefinition,
     ) -> float:
-        """Compute how well the detected swara sequence matches raga phrases.
+        """Sequence bonus from the query's precounted windows.
 
-        Looks for arohana/avarohana subsequence patterns.
-        Returns a bonus score between 0.0 and 0.3.
+        An ascending window scores if it occurs in the arohana, a descending
+        one if it occurs in the avarohana, so only the raga's own (few)
+        triples need looking up.
         """
-        if len(detected_swaras) < 3:
+        if n_detected < 3:
             return 0.0
 
-        detected_positions = [self._normalize_swara(s) for s in detected_swaras]
-        arohana_positions = [self._normalize_swara(s) for s in raga.arohana]
-        avarohana_positions = [self._normalize_swara(s) for s in raga.avarohana]
-
-        # Check for ascending runs matching arohana
-        ascending_matches = 0
-        for i in range(len(detected_positions) - 2):
-            window = detected_positions[i : i + 3]
-            if window[0] < window[1] < window[2]:
-                # Check if this ascending triple exists in arohana
-                for j in range(len(arohana_positions) - 2):
-                    if arohana_positions[j : j + 3] == window:
-                        ascending_matches += 1
-                        break
-
-        # Check for descending runs matching avarohana
-        descending_matches = 0
-        for i in range(len(detected_positions) - 2):
-            window = detected_positions[i : i + 3]
-            if window[0] > window[1] > window[2]:
-                for j in range(len(avarohana_positions) - 2):
-                    if avarohana_positions[j : j + 3] == window:
-                        descending_matches += 1
-                        break
-
-        total_windows = max(1, len(detected_positions) - 2)
-        sequence_score = (ascending_matches + descending_matches) / total_windows
+        matches = sum(ascending[k] for k in raga.arohana_triples if k in ascending)
+        matches += sum(descending[k] for k in raga.avarohana_triples if k in descending)
+
+        total_windows = max(1, n_detected - 2)
+        sequence_score = matches / total_windows
         return min(0.3, sequence_score * 0.3)
 
     def identify(
@@ -192,28 +358,72 @@ class RagaMatcher:
         if not detected_swaras:
             return []
 
-        detected_positions = self._swara_set_from_names(detected_swaras)
+        # Names -> positions once per query; both scores work on positions
+        detected_sequence = _swara_positions(detected_swaras)
+        detected_positions = set(detected_sequence)
+
+        # Score the whole database as arrays, then build candidates only for
+        # the top_n that are returned
+        if HAVE_NUMBA:
+            set_scores, seq_bonuses = _score_all_ragas(
+                _positions_mask(detected_positions),
+                len(detected_positions),
+                len(detected_sequence),
+                self._raga_masks,
+                self._raga_sizes,
+                *self._directional_windows(detected_sequence),
+                *self._arohana_triples,
+                *self._avarohana_triples,
+            )
+        else:
+            ascending, descending = self._directional_triples(detected_sequence)
+            n_detected = len(detected_sequence)
+            set_scores = self._set_match_scores(detected_positions)
+            seq_bonuses = np.array([
+                self._sequence_bonus(ascending, descending, n_detected, raga)
+                for raga in self.ragas
+            ])
+        totals = np.clip(set_scores + seq_bonuses, 0.0, 1.0)
+
+        # Filter out very low matches, then rank by rounded confidence with
+        # database order on ties. Rounding stays with Python's round():
+        # np.round scales by 10**3 first and disagrees on a few halfway
+        # values, which would change reported confidences. Rounding is
+        # monotonic, so only the raw-order prefix up to the last tie with
+        # the top_n-th confidence needs rounding and re-sorting.
+        kept = np.flatnonzero(totals > 0.1)
+        if 0 < top_n < len(kept):
+            # Partial selection: nothing more than a rounding step (plus
+            # margin) below the top_n-th raw total can tie its confidence
+            threshold = np.partition(totals[kept], -top_n)[-top_n]
+            kept = kept[totals[kept] >= threshold - 0.002]
+        order = kept[np.argsort(-totals[kept], kind="stable")].tolist()
+        confidences: dict[int, float] = {}
+        cutoff = None
+        for i, total in zip(order, totals[order].tolist(), strict=True):
+            confidence = round(total, 3)
+            if cutoff is not None and confidence < cutoff:
+                break
+            confidences[i] = confidence
+            if len(confidences) == top_n:
+                cutoff = confidence
+        ranked = sorted(confidences, key=lambda i: (-confidences[i], i))
+
+        detected_sorted = sorted(detected_positions)
         candidates = []
-
-        for raga in self.ragas:
-            set_score = self._compute_set_match(detected_positions, raga)
-            seq_bonus = self._compute_sequence_match(detected_swaras, raga)
-            total = min(1.0, set_score + seq_bonus)
-
-            if total > 0.1:  # filter out very low matches
-                candidates.append(RagaCandidate(
-                    raga=raga,
-                    confidence=round(total, 3),
-                    match_details={
-                        "set_score": round(set_score, 3),
-                        "sequence_bonus": round(seq_bonus, 3),
-                        "detected_positions": sorted(detected_positions),
-                        "raga_positions": sorted(raga.swara_set),
-                    },
-                ))
-
-        candidates.sort(key=lambda c: c.confidence, reverse=True)
-        return candidates[:top_n]
+        for i in ranked[:top_n]:
+            raga = self.ragas[i]
+            candidates.append(RagaCandidate(
+                raga=raga,
+                confidence=confidences[i],
+                match_details={
+                    "set_score": round(float(set_scores[i]), 3),
+                    "sequence_bonus": round(float(seq_bonuses[i]), 3),
+                    "detected_positions": list(detected_sorted),
+                    "raga_positions": sorted(raga.swara_positions),
+                },
+            ))
+        return candidates
 
     def resolve_enharmonic(
         self,
@@ -242,17 +452,8 @@ class RagaMatcher:
 
     def get_raga_by_number(self, number: int) -> RagaDefinition | None:
         """Look up a Melakarta raga by its number (1-72)."""
-        for raga in self.ragas:
-            if raga.number == number:
-                return raga
-        return None
+        return self._by_number.get(number)
 
     def get_raga_by_name(self, name: str) -> RagaDefinition | None:
         """Look up a raga by name or alias (case-insensitive)."""
-        name_lower = name.lower()
-        for raga in self.ragas:
-            if raga.name.lower() == name_lower:
-                return raga
-            if any(a.lower() == name_lower for a in raga.aliases):
-                return raga
-        return None
+        return self._by_name.get(name.lower())
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 import json
 import math
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 _CONFIGS_DIR = Path(__file__).resolve().parents[3] / "configs"
 
 # Western note names in chromatic order
 _WESTERN_NOTES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
+# Equal-tempered frequency of every MIDI note at A4 = 440 Hz, computed with
+# the same expression freq_to_western would otherwise evaluate per call
+_TEMPERED_MIDI_440 = tuple(440.0 * (2 ** ((m - 69) / 12)) for m in range(128))
+
 
 @dataclass
 class WesternNote:
@@ -58,7 +67,10 @@ def freq_to_western(freq_hz: float, a4_hz: float = 440.0) -> WesternNote:
     octave = (midi_number // 12) - 1
 
     # Exact frequency of the nearest note
-    exact_freq = a4_hz * (2 ** ((midi_number - 69) / 12))
+    if a4_hz == 440.0 and 0 <= midi_number < 128:
+        exact_freq = _TEMPERED_MIDI_440[midi_number]
+    else:
+        exact_freq = a4_hz * (2 ** ((midi_number - 69) / 12))
     cents_deviation = 1200 * math.log2(freq_hz / exact_freq)
 
     return WesternNote(
@@ -73,7 +85,7 @@ def freq_to_swara(
     freq_hz: float,
     reference_sa_hz: float = 261.63,
     tolerance_cents: float = 25.0,
-    swarasthanas: list[dict] | None = None,
+    swarasthanas: Sequence[dict] | None = None,
 ) -> SwaraMatch | None:
     """Convert a frequency to the nearest Indian classical swara.
 
@@ -97,25 +109,17 @@ def freq_to_swara(
     # Normalize to within one octave (0–1200)
     cents_in_octave = cents_from_sa % 1200
 
-    # Find the closest swara
-    best_match = None
-    best_deviation = float("inf")
-
-    for swara in swarasthanas:
-        swara_cents = swara["cents"]
-        deviation = cents_in_octave - swara_cents
-
-        # Handle wrap-around (e.g., 1190 cents is close to Sa at 0)
-        if deviation > 600:
-            deviation -= 1200
-        elif deviation < -600:
-            deviation += 1200
-
-        abs_deviation = abs(deviation)
-        if abs_deviation < best_deviation:
-            best_deviation = abs_deviation
-            best_match = swara
-            best_cents_deviation = deviation
+    # Find the closest swara: binary search over the configured table
+    # (indexed once), a plain scan for caller-supplied ones
+    lookup = _default_nearest_lookup() if swarasthanas is _load_swarasthanas() else None
+    if lookup is None:
+        best_match, best_deviation, best_cents_deviation = _nearest_swara_linear(
+            cents_in_octave, swarasthanas
+        )
+    else:
+        best_match, best_deviation, best_cents_deviation = _nearest_swara_sorted(
+            cents_in_octave, swarasthanas, *lookup
+        )
 
     if best_match is None or best_deviation > tolerance_cents:
         return None
@@ -123,21 +127,240 @@ def freq_to_swara(
     # Confidence: 1.0 at exact match, 0.0 at tolerance boundary
     confidence = max(0.0, 1.0 - (best_deviation / tolerance_cents))
 
+    # Copies: the match is the caller's to modify, the cached config is not
     return SwaraMatch(
         swara_id=best_match["id"],
         cents_from_sa=cents_in_octave,
         cents_deviation=best_cents_deviation,
         frequency_hz=freq_hz,
-        names=best_match["names"],
-        full_names=best_match["full_names"],
-        aliases=best_match.get("aliases", []),
+        names=dict(best_match["names"]),
+        full_names=dict(best_match["full_names"]),
+        aliases=list(best_match.get("aliases", [])),
         confidence=confidence,
     )
 
 
-def _load_swarasthanas() -> list[dict]:
-    """Load swarasthana definitions from the config file."""
+def _nearest_lookup(
+    swarasthanas: Sequence[dict],
+) -> tuple[list[float], list[int]] | None:
+    """Sorted distinct swara cents and, for each, the first swara at it.
+
+    Returns None when the table is empty or has positions outside one
+    octave, where the circular-neighbour search below doesn't apply.
+    """
+    first_at: dict[float, int] = {}
+    for i, swara in enumerate(swarasthanas):
+        first_at.setdefault(swara["cents"], i)
+    if not first_at or not all(0 <= c < 1200 for c in first_at):
+        return None
+    cents_sorted = sorted(first_at)
+    return cents_sorted, [first_at[c] for c in cents_sorted]
+
+
+@lru_cache(maxsize=1)
+def _default_nearest_lookup() -> tuple[list[float], list[int]] | None:
+    """:func:`_nearest_lookup` for the configured swarasthanas, built once."""
+    return _nearest_lookup(_load_swarasthanas())
+
+
+def _wrapped_deviation(cents_in_octave: float, swara_cents: float) -> float:
+    """Signed distance to a swara, wrapped so 1190 cents is close to Sa at 0."""
+    deviation = cents_in_octave - swara_cents
+    if deviation > 600:
+        deviation -= 1200
+    elif deviation < -600:
+        deviation += 1200
+    return deviation
+
+
+def _nearest_swara_sorted(
+    cents_in_octave: float,
+    swarasthanas: Sequence[dict],
+    cents_sorted: list[float],
+    first_index: list[int],
+) -> tuple[dict | None, float, float]:
+    """Nearest swara by binary search: ``(swara, |deviation|, deviation)``.
+
+    On a circle the nearest position is one of the two neighbours of the
+    insertion point (wrapping at the ends). Ties go to the swara listed
+    first, as in the linear scan.
+    """
+    if math.isnan(cents_in_octave):
+        return None, float("inf"), 0.0
+    n = len(cents_sorted)
+    i = bisect_left(cents_sorted, cents_in_octave)
+    best_key = None
+    best_deviation = 0.0
+    for j in ((i - 1) % n, i % n):
+        deviation = _wrapped_deviation(cents_in_octave, cents_sorted[j])
+        key = (abs(deviation), first_index[j])
+        if best_key is None or key < best_key:
+            best_key, best_deviation = key, deviation
+    abs_deviation, index = best_key
+    return swarasthanas[index], abs_deviation, best_deviation
+
+
+def _nearest_swara_linear(
+    cents_in_octave: float, swarasthanas: Sequence[dict]
+) -> tuple[dict | None, float, float]:
+    """Nearest swara by scanning every entry: ``(swara, |deviation|, deviation)``."""
+    best_match = None
+    best_deviation = float("inf")
+    best_cents_deviation = 0.0
+    for swara in swarasthanas:
+        deviation = _wrapped_deviation(cents_in_octave, swara["cents"])
+        abs_deviation = abs(deviation)
+        if abs_deviation < best_deviation:
+            best_deviation = abs_deviation
+            best_match = swara
+            best_cents_deviation = deviation
+    return best_match, best_deviation, best_cents_deviation
+
+
+def freq_to_swara_batch(
+    freqs: np.ndarray,
+    reference_sa_hz: float = 261.63,
+    tolerance_cents: float = 25.0,
+    swarasthanas: Sequence[dict] | None = None,
+) -> np.ndarray:
+    """Map an array of frequencies to swara ids in one vectorized pass.
+
+    Equivalent to calling :func:`freq_to_swara` per element and keeping
+    only ``swara_id``, but without the per-frame Python loop.
+
+    Args:
+        freqs: Frequencies in Hz (any shape is flattened to 1-D).
+        reference_sa_hz: Frequency of the tonic Sa in Hz.
+        tolerance_cents: Maximum allowed deviation in cents for a match.
+        swarasthanas: Swara definitions (loaded from config if None).
+
+    Returns:
+        String array of swara ids, one per input frequency. Entries that
+        are non-positive or outside tolerance are the empty string.
+    """
+    if swarasthanas is None or swarasthanas is _load_swarasthanas():
+        (table, ids), lut = _default_swara_table(), _default_swara_lut()
+    else:
+        (table, ids), lut = _swara_table(swarasthanas), None
+
+    freqs = np.asarray(freqs, dtype=np.float64).ravel()
+    idx, _ = _nearest_swaras(freqs, reference_sa_hz, tolerance_cents, table, lut)
+    return ids[idx]
+
+
+def _nearest_swaras(
+    freqs: np.ndarray,
+    reference_sa_hz: float,
+    tolerance_cents: float,
+    table: np.ndarray,
+    lut: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`freq_to_swara` matching against a cents *table*.
+
+    Returns ``(index, deviation)`` per frequency: the position of the
+    nearest swara in *table* (``len(table)`` where nothing is within
+    tolerance or the frequency is non-positive) and its signed deviation
+    in cents. Deviations wrap as in :func:`_wrapped_deviation` and ties go
+    to the swara listed first, as in the scalar lookup.
+
+    With *lut* from :func:`_swara_lut` for the same table, the nearest
+    swara is read per whole cent instead of searched, and only frames in
+    a cent that straddles a boundary between two swaras are searched.
+    """
+    voiced = freqs > 0
+    cents = np.zeros_like(freqs)
+    cents[voiced] = np.mod(1200.0 * np.log2(freqs[voiced] / reference_sa_hz), 1200.0)
+
+    if lut is None:
+        idx = np.argmin(np.abs(_wrap_deviation(cents[:, None] - table[None, :])), axis=1)
+    else:
+        # np.mod can round a tiny negative up to exactly 1200.0
+        idx = lut[np.minimum(cents.astype(np.intp), 1199)]
+        straddling = np.flatnonzero(idx < 0)
+        if len(straddling):
+            near = _wrap_deviation(cents[straddling, None] - table[None, :])
+            idx[straddling] = np.argmin(np.abs(near), axis=1)
+    best = _wrap_deviation(cents - table[idx])
+
+    idx[~voiced | (np.abs(best) > tolerance_cents)] = len(table)
+    return idx, best
+
+
+def _wrap_deviation(deviation: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`_wrapped_deviation`: wrap into [-600, 600] cents."""
+    return np.where(
+        deviation > 600,
+        deviation - 1200,
+        np.where(deviation < -600, deviation + 1200, deviation),
+    )
+
+
+def _swara_lut(table: np.ndarray) -> np.ndarray:
+    """Nearest swara in *table* for each whole cent ``[k, k + 1)`` of the octave.
+
+    Between two boundaries (the midpoints between neighbouring swaras) the
+    nearest swara doesn't change, so one lookup per cent is exact except
+    in the cents containing a boundary, which hold ``-1``.
+    """
+    centres = np.arange(1200) + 0.5
+    lut = np.argmin(np.abs(_wrap_deviation(centres[:, None] - table[None, :])), axis=1)
+    positions = np.unique(table % 1200)
+    following = np.append(positions[1:], positions[0] + 1200)
+    boundaries = ((positions + following) / 2) % 1200
+    lut[np.floor(boundaries).astype(np.intp)] = -1
+    return lut
+
+
+@lru_cache(maxsize=1)
+def _default_swara_lut() -> np.ndarray:
+    """:func:`_swara_lut` for the configured swarasthanas, built once."""
+    # NB: lru_cache returns the array by reference — it is read-only.
+    lut = _swara_lut(_default_swara_table()[0])
+    lut.flags.writeable = False
+    return lut
+
+
+def _swara_table(swarasthanas: Sequence[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(cents, ids)`` arrays for *swarasthanas*.
+
+    ``ids`` has one extra trailing ``""`` entry used for "no match".
+    """
+    table = np.array([s["cents"] for s in swarasthanas], dtype=np.float64)
+    ids = np.array([s["id"] for s in swarasthanas] + [""])
+    return table, ids
+
+
+@lru_cache(maxsize=1)
+def _default_swara_table() -> tuple[np.ndarray, np.ndarray]:
+    """:func:`_swara_table` for the configured swarasthanas, built once."""
+    return _swara_table(_load_swarasthanas())
+
+
+@lru_cache(maxsize=1)
+def _load_swarasthanas() -> tuple[dict, ...]:
+    """Load swarasthana definitions from the config file.
+
+    Parsed once per process; a tuple so the shared table can't be
+    appended to or reordered.
+    """
+    # NB: lru_cache returns the dicts by reference — callers must not mutate.
     config_path = _CONFIGS_DIR / "swarasthanas.json"
     with open(config_path, encoding="utf-8") as f:
         data = json.load(f)
-    return data["swarasthanas"]
+    return tuple(data["swarasthanas"])
+
+
+def swara_names(script: str = "iast") -> dict[str, str]:
+    """Display name of every configured swarasthana in *script*, by swara id.
+
+    Args:
+        script: One of the configured scripts ("iast", "devanagari",
+            "kannada", "tamil", "telugu").
+
+    Returns:
+        A new dict mapping swara_id -> short name; swaras without a name in
+        *script* are left out.
+    """
+    return {
+        s["id"]: s["names"][script] for s in _load_swarasthanas() if script in s["names"]
+    }
@@ -6,7 +6,9 @@ from crj_engine.synthesis.render import (
     generate_tanpura,
     render_bar_audio,
     render_composition,
+    render_composition_to_wav,
     save_wav,
+    save_wav_pcm16,
 )
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     "generate_tanpura",
     "render_bar_audio",
     "render_composition",
+    "render_composition_to_wav",
     "save_wav",
+    "save_wav_pcm16",
 ]
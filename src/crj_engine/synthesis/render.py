@@ -10,46 +10,37 @@ All tones use ADSR envelopes for natural note shaping.
 
 from __future__ import annotations
 
-import json
+import math
+import wave
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 
+from crj_engine._jit import HAVE_NUMBA, njit
+from crj_engine.swara.mapper import _load_swarasthanas
 from crj_engine.tala.models import (
     Bar,
     Composition,
+    Line,
     Octave,
     SwaraNote,
 )
 
-_CONFIGS_DIR = Path(__file__).resolve().parents[3] / "configs"
-
-# Cache for swara cent values
-_SWARA_CENTS: dict[str, float] | None = None
-
 
+@lru_cache(maxsize=1)
 def _load_swara_cents() -> dict[str, float]:
-    """Load swara id -> cents mapping from swarasthanas.json."""
-    global _SWARA_CENTS  # noqa: PLW0603
-    if _SWARA_CENTS is not None:
-        return _SWARA_CENTS
-
-    path = _CONFIGS_DIR / "swarasthanas.json"
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    cents = {}
-    for s in data["swarasthanas"]:
-        cents[s["id"]] = s["cents"]
-        # Also add aliases
-        for alias in s.get("aliases", []):
-            if alias not in cents:
-                cents[alias] = s["cents"]
-
-    _SWARA_CENTS = cents
-    return cents
+    """Swara id (and alias) -> cents, from the cached swarasthanas config."""
+    # NB: lru_cache returns the dict by reference — callers must not mutate.
+    swarasthanas = _load_swarasthanas()
+    aliases = {
+        alias: s["cents"] for s in swarasthanas for alias in s.get("aliases", [])
+    }
+    # Canonical ids take precedence over aliases of the same name
+    return aliases | {s["id"]: s["cents"] for s in swarasthanas}
 
 
 class ToneType(Enum):
@@ -73,10 +64,10 @@ class ADSREnvelope:
     sustain: float = 0.8    # sustain amplitude (0-1)
     release: float = 0.15   # fraction for release ramp
 
-    def apply(self, signal: np.ndarray) -> np.ndarray:
-        """Apply the ADSR envelope to a signal."""
-        n = len(signal)
-        envelope = np.ones(n, dtype=np.float32)
+    def build(self, n: int) -> np.ndarray:
+        """The float32 envelope for a note of *n* samples."""
+        # Every sample is written by one of the stages below
+        envelope = np.empty(n, dtype=np.float32)
 
         a_end = int(n * self.attack)
         d_end = a_end + int(n * self.decay)
@@ -97,13 +88,30 @@ class ADSREnvelope:
             envelope[r_start:] = np.linspace(
                 self.sustain, 0, n - r_start,
             )
+        return envelope
 
+    def apply(self, signal: np.ndarray) -> np.ndarray:
+        """Apply the ADSR envelope to a signal."""
+        envelope = self.build(len(signal))
+        # Multiply into the envelope buffer when the product stays float32,
+        # saving a second note-length allocation
+        if np.result_type(signal, envelope) == envelope.dtype:
+            return np.multiply(signal, envelope, out=envelope)
         return signal * envelope
 
 
 # ---------------------------------------------------------------------------
 # Tone generators
 # ---------------------------------------------------------------------------
+#
+# Every generator takes the note frequency, the sample times ``t`` of one
+# note (shared by all notes of the same length, see ``_time_axis``) and the
+# sample rate.
+
+def _sample_times(n: int, sr: int) -> np.ndarray:
+    """Times in seconds of the first *n* samples at rate *sr*."""
+    return np.arange(n, dtype=np.float64) / sr
+
 
 def _swara_to_freq(
     note: SwaraNote, reference_sa_hz: float,
@@ -112,92 +120,186 @@ def _swara_to_freq(
 
     Returns None for rests ("-") and sustains (",").
     """
-    if note.swara_id in ("-", ","):
+    return _swara_freq_cached(note.swara_id, note.octave, reference_sa_hz)
+
+
+@lru_cache(maxsize=128)
+def _swara_freq_cached(
+    swara_id: str, octave: Octave, reference_sa_hz: float,
+) -> float | None:
+    """:func:`_swara_to_freq` memoized per (swara, octave, Sa).
+
+    A composition only uses a handful of distinct swara/octave pairs, so
+    nearly every position is a cache hit.
+    """
+    if swara_id in ("-", ","):
         return None
 
     cents_map = _load_swara_cents()
-    if note.swara_id not in cents_map:
+    if swara_id not in cents_map:
         return None
 
-    cents = cents_map[note.swara_id]
+    cents = cents_map[swara_id]
 
     # Apply octave offset
-    if note.octave == Octave.MANDRA:
+    if octave == Octave.MANDRA:
         cents -= 1200
-    elif note.octave == Octave.TARA:
+    elif octave == Octave.TARA:
         cents += 1200
 
     return reference_sa_hz * (2 ** (cents / 1200.0))
 
 
-def _generate_sine(
-    freq_hz: float, duration_s: float, sr: int,
+def _harmonic_sum(
+    phase: np.ndarray, weights: Sequence[float], dtype: type = np.float64,
 ) -> np.ndarray:
+    """``sum(weights[h - 1] * sin(h * phase))`` over harmonics ``h = 1, 2, ...``.
+
+    Only the fundamental needs ``np.sin`` / ``np.cos``: each higher harmonic
+    follows from the two below it, ``sin(h*x) = 2*cos(x)*sin((h-1)*x) -
+    sin((h-2)*x)``, i.e. one multiply and one subtract per sample. The
+    recurrence runs in *dtype*; the fundamental is always evaluated from the
+    float64 *phase*.
+    """
+    if not weights:
+        return np.zeros(len(phase), dtype=dtype)
+    two_cos = (2 * np.cos(phase)).astype(dtype, copy=False)
+    current = np.sin(phase).astype(dtype, copy=False)
+    signal = dtype(weights[0]) * current
+    # Three rotating buffers: no allocation inside the loop
+    below = np.zeros_like(signal)
+    scratch = np.empty_like(signal)
+    for weight in weights[1:]:
+        np.multiply(two_cos, current, out=scratch)
+        np.subtract(scratch, below, out=below)
+        below, current = current, below
+        np.multiply(current, dtype(weight), out=scratch)
+        signal += scratch
+    return signal
+
+
+def _generate_sine(freq_hz: float, t: np.ndarray, sr: int) -> np.ndarray:
     """Pure sine wave."""
-    t = np.linspace(0, duration_s, int(sr * duration_s), endpoint=False)
     return np.sin(2 * np.pi * freq_hz * t).astype(np.float32)
 
 
-def _generate_voice(
-    freq_hz: float, duration_s: float, sr: int,
-) -> np.ndarray:
-    """Voice-like tone: fundamental + harmonics + gentle vibrato."""
-    n = int(sr * duration_s)
-    t = np.linspace(0, duration_s, n, endpoint=False)
+# Harmonic weights of the voice tone (fundamental first)
+_VOICE_HARMONICS = (1.0, 0.5, 0.25, 0.15, 0.08)
+
 
+@njit(cache=True)
+def _voice_kernel(
+    freq_hz, vibrato_depth, vibrato_hz, t, weights,
+):  # pragma: no cover - compiled by numba
+    """Vibrato phase and harmonic recurrence of ``_generate_voice``, fused.
+
+    Scalar ``math.sin`` / ``math.cos`` per sample: voice notes are short
+    (a few thousand samples), where per-call ufunc dispatch and the
+    temporaries of the NumPy path dominate.
+    """
+    signal = np.empty(t.shape[0], dtype=np.float32)
+    for i in range(t.shape[0]):
+        vibrato = vibrato_depth * math.sin(2 * math.pi * vibrato_hz * t[i])
+        phase = 2 * math.pi * (freq_hz + vibrato) * t[i]
+        two_cos = 2 * math.cos(phase)
+        below = 0.0
+        current = math.sin(phase)
+        total = weights[0] * current
+        for h in range(1, len(weights)):
+            below, current = current, two_cos * current - below
+            total += weights[h] * current
+        signal[i] = total
+    return signal
+
+
+def _generate_voice(freq_hz: float, t: np.ndarray, sr: int) -> np.ndarray:
+    """Voice-like tone: fundamental + harmonics + gentle vibrato."""
     # Vibrato: 5 Hz, ±8 cents (subtle)
     vibrato_hz = 5.0
     vibrato_depth = freq_hz * (2 ** (8 / 1200.0) - 1)
-    vibrato = vibrato_depth * np.sin(2 * np.pi * vibrato_hz * t)
 
-    # Fundamental + harmonics (decreasing amplitude)
-    signal = np.zeros(n, dtype=np.float64)
-    harmonic_weights = [1.0, 0.5, 0.25, 0.15, 0.08]
-    for i, weight in enumerate(harmonic_weights):
-        h = i + 1
-        signal += weight * np.sin(
-            2 * np.pi * (freq_hz * h + vibrato * h) * t
+    # Fundamental + harmonics (decreasing amplitude); harmonic h of the
+    # vibrato-modulated tone is h times its phase
+    if HAVE_NUMBA:
+        signal = _voice_kernel(
+            freq_hz, vibrato_depth, vibrato_hz, t, _VOICE_HARMONICS,
         )
+    else:
+        # The phase stays float64, the harmonics are summed in float32 (the
+        # output precision)
+        vibrato = vibrato_depth * np.sin(2 * np.pi * vibrato_hz * t)
+        phase = 2 * np.pi * (freq_hz + vibrato) * t
+        signal = _harmonic_sum(phase, _VOICE_HARMONICS, np.float32)
 
     # Normalize
     peak = np.max(np.abs(signal))
     if peak > 0:
         signal /= peak
 
-    return signal.astype(np.float32)
+    return signal
 
 
-def _generate_string(
-    freq_hz: float, duration_s: float, sr: int,
-) -> np.ndarray:
-    """String-like tone: band-limited sawtooth approximation."""
-    n = int(sr * duration_s)
-    t = np.linspace(0, duration_s, n, endpoint=False)
+# Samples per wavetable cycle; linear interpolation error stays below
+# a 16-bit LSB at this size
+_WAVETABLE_SIZE = 8192
 
-    # Band-limited sawtooth (sum of harmonics)
-    signal = np.zeros(n, dtype=np.float64)
-    max_harmonic = min(20, int(sr / 2 / freq_hz))
-    for h in range(1, max_harmonic + 1):
-        signal += ((-1) ** (h + 1)) * np.sin(
-            2 * np.pi * h * freq_hz * t
-        ) / h
 
-    signal *= 2 / np.pi  # normalize sawtooth amplitude
+@lru_cache(maxsize=32)
+def _sawtooth_table(n_harmonics: int) -> np.ndarray:
+    """One cycle of the sawtooth summed up to *n_harmonics*.
+
+    Has ``_WAVETABLE_SIZE + 1`` samples (the last repeats the first) so
+    interpolation never needs to wrap.
+    """
+    # NB: lru_cache returns the array by reference — it is read-only.
+    phase = 2 * np.pi * np.arange(_WAVETABLE_SIZE + 1) / _WAVETABLE_SIZE
+    weights = [(1 if h % 2 else -1) / h for h in range(1, n_harmonics + 1)]
+    table = _harmonic_sum(phase, weights)
+    table.flags.writeable = False
+    return table
+
+
+@njit(cache=True)
+def _wavetable_kernel(freq_hz, t, table):  # pragma: no cover - compiled by numba
+    """Interpolated one-cycle *table* lookup of ``_generate_string``, fused."""
+    size = table.shape[0] - 1
+    signal = np.empty(t.shape[0], dtype=np.float32)
+    for i in range(t.shape[0]):
+        position = (freq_hz * t[i] % 1.0) * size
+        index = int(position)
+        below = table[index]
+        signal[i] = below + (position - index) * (table[index + 1] - below)
+    return signal
+
+
+def _generate_string(freq_hz: float, t: np.ndarray, sr: int) -> np.ndarray:
+    """String-like tone: band-limited sawtooth approximation."""
+    # Band-limited sawtooth (sum of harmonics), read from a one-cycle table
+    # with linear interpolation
+    table = _sawtooth_table(min(20, int(sr / 2 / freq_hz)))
+    if HAVE_NUMBA:
+        signal = _wavetable_kernel(freq_hz, t, table)
+    else:
+        position = (freq_hz * t % 1.0) * _WAVETABLE_SIZE
+        index = position.astype(np.intp)
+        below = table[index]
+        signal = (below + (position - index) * (table[index + 1] - below)).astype(
+            np.float32,
+        )
+
+    signal *= np.float32(2 / np.pi)  # normalize sawtooth amplitude
 
     # Normalize
     peak = np.max(np.abs(signal))
     if peak > 0:
         signal /= peak
 
-    return signal.astype(np.float32)
+    return signal
 
 
-def _generate_flute(
-    freq_hz: float, duration_s: float, sr: int,
-) -> np.ndarray:
+def _generate_flute(freq_hz: float, t: np.ndarray, sr: int) -> np.ndarray:
     """Flute-like tone: sine + weak harmonics + gentle vibrato + breathy noise."""
-    n = int(sr * duration_s)
-    t = np.linspace(0, duration_s, n, endpoint=False)
+    n = len(t)
 
     # Gentle vibrato: 4 Hz, ±6 cents
     vibrato_hz = 4.0
@@ -247,6 +349,46 @@ _ADSR_PRESETS = {
 }
 
 
+@lru_cache(maxsize=8)
+def _time_axis(duration_s: float, sr: int) -> np.ndarray:
+    """Sample times of one note lasting *duration_s* seconds."""
+    # NB: lru_cache returns the array by reference — it is read-only.
+    t = _sample_times(int(sr * duration_s), sr)
+    t.flags.writeable = False
+    return t
+
+
+@lru_cache(maxsize=16)
+def _tone_envelope(tone: ToneType, n: int) -> np.ndarray:
+    """ADSR envelope of *tone* for notes of *n* samples.
+
+    Every note of a bar has the same length, so one envelope is shared by
+    all distinct notes at that speed.
+    """
+    # NB: lru_cache returns the array by reference — it is read-only.
+    envelope = _ADSR_PRESETS[tone].build(n)
+    envelope.flags.writeable = False
+    return envelope
+
+
+@lru_cache(maxsize=256)
+def _note_waveform(
+    tone: ToneType, freq_hz: float, duration_s: float, sr: int, enveloped: bool,
+) -> np.ndarray:
+    """Synthesized (and, if *enveloped*, ADSR-shaped) samples of one note.
+
+    Compositions repeat the same few swaras at the same speed many times,
+    so each distinct note is synthesized once and reused.
+    """
+    # NB: lru_cache returns the array by reference — it is read-only;
+    # scale it into a new array rather than in place.
+    seg = _TONE_GENERATORS[tone](freq_hz, _time_axis(duration_s, sr), sr)
+    if enveloped:
+        seg *= _tone_envelope(tone, len(seg))
+    seg.flags.writeable = False
+    return seg
+
+
 # ---------------------------------------------------------------------------
 # Tanpura drone
 # ---------------------------------------------------------------------------
@@ -258,6 +400,70 @@ _SHRUTI_PATTERN_CENTS = {
 }
 
 
+# Samples per block in _sum_of_sines
+_SINE_BLOCK = 4096
+
+
+def _sum_of_sines(
+    omegas: np.ndarray, weights: np.ndarray, n: int, sr: int, start: int = 0,
+) -> np.ndarray:
+    """``sum(weights[p] * sin(omegas[p] * t))`` at *n* sample times from *start*.
+
+    Every block of ``_SINE_BLOCK`` samples starting at ``t0`` is
+    ``sin(w*(t0 + tau)) = cos(w*t0) * sin(w*tau) + sin(w*t0) * cos(w*tau)``,
+    so ``sin`` / ``cos`` are only evaluated over the first block and at
+    each block start; the whole signal is then two matrix products. Block
+    start phases are computed directly, so no rounding error accumulates
+    along the signal.
+    """
+    n_blocks = -(-n // _SINE_BLOCK)
+    block_phase = np.multiply.outer(omegas, _sample_times(_SINE_BLOCK, sr))
+    start_phase = np.multiply.outer(
+        (start + np.arange(n_blocks, dtype=np.float64) * _SINE_BLOCK) / sr, omegas,
+    )
+    signal = (np.cos(start_phase) * weights) @ np.sin(block_phase)
+    signal += (np.sin(start_phase) * weights) @ np.cos(block_phase)
+    return signal.ravel()[:n]
+
+
+def _tanpura_partials(
+    reference_sa_hz: float, pattern: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Angular frequencies and weights of every tanpura string harmonic."""
+    if pattern not in _SHRUTI_PATTERN_CENTS:
+        raise ValueError(
+            f"Unknown shruti pattern: {pattern}. "
+            f"Expected one of {list(_SHRUTI_PATTERN_CENTS)}."
+        )
+
+    first_string_cents = _SHRUTI_PATTERN_CENTS[pattern]
+    first_string_hz = reference_sa_hz * (2 ** (first_string_cents / 1200.0))
+    sa_upper = reference_sa_hz * 2  # upper octave Sa
+
+    # 4 strings of tanpura: <pattern>, Sa(upper), Sa(upper), Sa(lower),
+    # each with rich harmonics (characteristic jivari buzz), weighted down
+    # as h**1.2 and slightly detuned for warmth
+    string_hz = np.array([first_string_hz, sa_upper, sa_upper, reference_sa_hz])
+    string_amp = np.array([0.3, 0.35, 0.35, 0.25])
+    h = np.arange(1, 8)
+    omegas = (2 * np.pi * np.outer(string_hz, h * (1 + (h - 1) * 0.001))).ravel()
+    weights = np.outer(string_amp, 1 / h ** 1.2).ravel()
+    return omegas, weights
+
+
+def _tanpura_samples(
+    partials: tuple[np.ndarray, np.ndarray], start: int, n: int, sr: int,
+) -> np.ndarray:
+    """The un-normalized drone over samples ``[start, start + n)``."""
+    drone = _sum_of_sines(*partials, n, sr, start)
+
+    # Slow amplitude modulation (tanpura "breathing")
+    drone *= 0.85 + _sum_of_sines(
+        np.array([2 * np.pi * 0.15]), np.array([0.15]), n, sr, start,
+    )
+    return drone
+
+
 def generate_tanpura(
     reference_sa_hz: float = 261.63,
     duration_s: float = 10.0,
@@ -281,42 +487,8 @@ def generate_tanpura(
     Returns:
         Audio samples as float32 numpy array.
     """
-    if pattern not in _SHRUTI_PATTERN_CENTS:
-        raise ValueError(
-            f"Unknown shruti pattern: {pattern}. "
-            f"Expected one of {list(_SHRUTI_PATTERN_CENTS)}."
-        )
-
-    n = int(sr * duration_s)
-    t = np.linspace(0, duration_s, n, endpoint=False)
-
-    first_string_cents = _SHRUTI_PATTERN_CENTS[pattern]
-    first_string_hz = reference_sa_hz * (2 ** (first_string_cents / 1200.0))
-    sa_upper = reference_sa_hz * 2  # upper octave Sa
-
-    drone = np.zeros(n, dtype=np.float64)
-
-    # 4 strings of tanpura: <pattern>, Sa(upper), Sa(upper), Sa(lower)
-    strings = [
-        (first_string_hz, 0.3),
-        (sa_upper, 0.35),
-        (sa_upper, 0.35),
-        (reference_sa_hz, 0.25),
-    ]
-
-    for freq, amp in strings:
-        # Each string has rich harmonics (characteristic jivari buzz)
-        for h in range(1, 8):
-            weight = amp / (h ** 1.2)
-            # Slight detuning for warmth
-            detune = 1 + (h - 1) * 0.001
-            drone += weight * np.sin(
-                2 * np.pi * freq * h * detune * t
-            )
-
-    # Slow amplitude modulation (tanpura "breathing")
-    breathing = 0.85 + 0.15 * np.sin(2 * np.pi * 0.15 * t)
-    drone *= breathing
+    partials = _tanpura_partials(reference_sa_hz, pattern)
+    drone = _tanpura_samples(partials, 0, int(sr * duration_s), sr)
 
     # Normalize to -6 dB (leave headroom for melody)
     peak = np.max(np.abs(drone))
@@ -389,7 +561,7 @@ def generate_click_track(
             n = min(int(dur_s * sr), total_samples - start)
             if n <= 0:
                 continue
-            t = np.linspace(0, dur_s, n, endpoint=False)
+            t = _sample_times(n, sr)
             tick = np.sin(2 * np.pi * freq * t).astype(np.float32)
             # Quick decay envelope
             env = np.exp(-t * 40).astype(np.float32)
@@ -403,6 +575,71 @@ def generate_click_track(
 # Bar and Composition rendering
 # ---------------------------------------------------------------------------
 
+def _position_duration_s(bar: Bar, tempo_bpm: float) -> float:
+    """Duration of one position of *bar* (1 akshara = 1 beat)."""
+    beat_duration_s = 60.0 / tempo_bpm
+    # Each position duration depends on speed
+    return beat_duration_s / bar.speed.value
+
+
+def _bar_samples(bar: Bar, tempo_bpm: float, sr: int) -> int:
+    """Number of samples ``render_bar_audio`` produces for *bar*."""
+    return len(bar.swaras) * int(sr * _position_duration_s(bar, tempo_bpm))
+
+
+def _bar_frequencies(
+    bar: Bar, reference_sa_hz: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Frequency sounding at each position of *bar*, and which positions attack.
+
+    Each swara's frequency comes from the memoized per-swara lookup. A
+    sustain (",") carries the frequency of the last note before it and does
+    not attack; rests ("-"), unknown swaras and sustains of either are NaN.
+    """
+    # None (rest, sustain, unknown swara) becomes NaN in a float64 array
+    freqs = np.array(
+        [
+            _swara_freq_cached(note.swara_id, note.octave, reference_sa_hz)
+            for note in bar.swaras
+        ],
+        dtype=np.float64,
+    )
+
+    attacks = np.array([note.swara_id != "," for note in bar.swaras], dtype=bool)
+    # Index of the last attacked position at or before each position
+    source = np.maximum.accumulate(np.where(attacks, np.arange(len(attacks)), -1))
+    freqs = np.where(source >= 0, freqs[np.maximum(source, 0)], np.nan)
+    return freqs, attacks
+
+
+def _render_bar_into(
+    out: np.ndarray,
+    bar: Bar,
+    reference_sa_hz: float,
+    tempo_bpm: float,
+    tone: ToneType,
+    sr: int,
+    amplitude: float,
+) -> None:
+    """Render *bar* into the zeroed buffer *out* of ``_bar_samples`` length.
+
+    Rests (and notes without a frequency) are left as the zeros already
+    in *out*.
+    """
+    position_duration_s = _position_duration_s(bar, tempo_bpm)
+    rows = out.reshape(len(bar.swaras), int(sr * position_duration_s))
+    freqs, attacks = _bar_frequencies(bar, reference_sa_hz)
+    freqs_list = freqs.tolist()
+    attacks_list = attacks.tolist()
+
+    # Sustains get no ADSR — just a smooth continuation of the previous note
+    for i in np.flatnonzero(~np.isnan(freqs)).tolist():
+        seg = _note_waveform(
+            tone, freqs_list[i], position_duration_s, sr, attacks_list[i],
+        )
+        np.multiply(seg, amplitude, out=rows[i])
+
+
 def render_bar_audio(
     bar: Bar,
     reference_sa_hz: float = 261.63,
@@ -424,47 +661,29 @@ def render_bar_audio(
     Returns:
         Audio samples as float32 numpy array.
     """
-    beat_duration_s = 60.0 / tempo_bpm
+    out = np.zeros(_bar_samples(bar, tempo_bpm, sr), dtype=np.float32)
+    _render_bar_into(out, bar, reference_sa_hz, tempo_bpm, tone, sr, amplitude)
+    return out
 
-    # Each position duration depends on speed
-    position_duration_s = beat_duration_s / bar.speed.value
 
-    generator = _TONE_GENERATORS[tone]
-    adsr = _ADSR_PRESETS[tone]
-
-    segments = []
-    prev_freq: float | None = None
-
-    for note in bar.swaras:
-        n_samples = int(sr * position_duration_s)
-
-        if note.swara_id == ",":
-            # Sustain: continue previous note
-            if prev_freq is not None:
-                seg = generator(prev_freq, position_duration_s, sr)
-                # No ADSR on sustain — just smooth continuation
-                segments.append(seg * amplitude)
-            else:
-                segments.append(np.zeros(n_samples, dtype=np.float32))
-        elif note.swara_id == "-":
-            # Rest: silence
-            segments.append(np.zeros(n_samples, dtype=np.float32))
-            prev_freq = None
-        else:
-            freq = _swara_to_freq(note, reference_sa_hz)
-            if freq is not None:
-                seg = generator(freq, position_duration_s, sr)
-                seg = adsr.apply(seg)
-                segments.append(seg * amplitude)
-                prev_freq = freq
-            else:
-                segments.append(np.zeros(n_samples, dtype=np.float32))
-                prev_freq = None
-
-    if not segments:
-        return np.zeros(0, dtype=np.float32)
-
-    return np.concatenate(segments)
+def _render_line_into(
+    out: np.ndarray,
+    line: Line,
+    reference_sa_hz: float,
+    tempo_bpm: float,
+    tone: ToneType,
+    sr: int,
+    amplitude: float,
+) -> None:
+    """Render one pass of *line* bar by bar into the float32 buffer *out*."""
+    offset = 0
+    for bar in line.bars:
+        n_bar = _bar_samples(bar, tempo_bpm, sr)
+        _render_bar_into(
+            out[offset:offset + n_bar], bar, reference_sa_hz,
+            tempo_bpm, tone, sr, amplitude,
+        )
+        offset += n_bar
 
 
 def render_composition(
@@ -488,52 +707,190 @@ def render_composition(
     Returns:
         Audio samples as float32 numpy array.
     """
-    melody_parts = []
-
-    for section in comp.sections:
-        for line in section.lines:
-            # Render each repeat
-            line_audio_parts = []
-            for bar in line.bars:
-                bar_audio = render_bar_audio(
-                    bar, comp.reference_sa_hz, tempo_bpm, tone, sr,
-                    amplitude,
-                )
-                line_audio_parts.append(bar_audio)
-
-            line_audio = np.concatenate(line_audio_parts)
-
-            # Repeat the line
-            for _ in range(line.repeat):
-                melody_parts.append(line_audio)
-
-    if not melody_parts:
-        return np.zeros(0, dtype=np.float32)
+    lines = [line for section in comp.sections for line in section.lines]
+    line_samples = [
+        sum(_bar_samples(bar, tempo_bpm, sr) for bar in line.bars)
+        for line in lines
+    ]
+    # A non-positive repeat plays the line zero times; the buffer size and
+    # the offsets below both use these clamped counts
+    repeats = [max(line.repeat, 0) for line in lines]
+
+    # Bar lengths are known up front, so every bar is rendered straight into
+    # one melody buffer and repeats are copied from the first rendering
+    melody = np.zeros(
+        sum(n * r for n, r in zip(line_samples, repeats, strict=True)),
+        dtype=np.float32,
+    )
+    if len(melody) == 0:
+        return melody
+
+    offset = 0
+    for line, n_line, repeat in zip(lines, line_samples, repeats, strict=True):
+        if repeat == 0:
+            continue
+        start = offset
+        _render_line_into(
+            melody[offset:offset + n_line], line, comp.reference_sa_hz,
+            tempo_bpm, tone, sr, amplitude,
+        )
+        offset += n_line
 
-    melody = np.concatenate(melody_parts)
+        # Repeat the line: broadcast the first rendering into every repeat
+        n_repeats = repeat - 1
+        melody[offset:offset + n_repeats * n_line].reshape(n_repeats, n_line)[:] = (
+            melody[start:start + n_line]
+        )
+        offset += n_repeats * n_line
 
     if include_tanpura:
         duration_s = len(melody) / sr
         tanpura = generate_tanpura(
             comp.reference_sa_hz, duration_s, sr,
         )
-        # Mix: melody + tanpura
-        min_len = min(len(melody), len(tanpura))
-        mixed = np.zeros(max(len(melody), len(tanpura)),
-                         dtype=np.float32)
-        mixed[:len(melody)] += melody
-        mixed[:len(tanpura)] += tanpura[:min_len]
-
-        # Soft-clip to prevent clipping
-        peak = np.max(np.abs(mixed))
-        if peak > 0.95:
-            mixed = mixed / peak * 0.95
+        # Mix: melody + tanpura, in the melody buffer (the drone is never
+        # longer than the melody it was sized from)
+        melody[:len(tanpura)] += tanpura
 
-        return mixed
+        # Soft-clip to prevent clipping, scaling in place; the peak is taken
+        # from max/min so no |melody| temporary is allocated
+        peak = max(float(melody.max()), -float(melody.min()))
+        if peak > 0.95:
+            melody /= peak
+            melody *= 0.95
 
     return melody
 
 
+# Samples of drone generated at a time while streaming a composition
+_STREAM_BLOCK = 1 << 18
+
+
+def _melody_chunks(
+    comp: Composition,
+    tempo_bpm: float,
+    tone: ToneType,
+    sr: int,
+    amplitude: float,
+) -> Iterator[np.ndarray]:
+    """Yield the melody of *comp* one line performance at a time.
+
+    A repeated line is rendered once and the same (read-only) buffer is
+    yielded for every repeat.
+    """
+    for section in comp.sections:
+        for line in section.lines:
+            if line.repeat <= 0:
+                continue
+            audio = np.zeros(
+                sum(_bar_samples(bar, tempo_bpm, sr) for bar in line.bars),
+                dtype=np.float32,
+            )
+            _render_line_into(
+                audio, line, comp.reference_sa_hz, tempo_bpm, tone, sr, amplitude,
+            )
+            audio.flags.writeable = False
+            for _ in range(line.repeat):
+                yield audio
+
+
+def _mixed_chunks(
+    comp: Composition,
+    tempo_bpm: float,
+    tone: ToneType,
+    sr: int,
+    include_tanpura: bool,
+    amplitude: float,
+) -> Iterator[np.ndarray]:
+    """Yield the melody of *comp* mixed with its tanpura, chunk by chunk.
+
+    The chunks match ``render_composition`` before its final soft-clip.
+    The drone is normalized by its peak over the whole composition, which
+    is found first by generating it block by block.
+    """
+    if not include_tanpura:
+        yield from _melody_chunks(comp, tempo_bpm, tone, sr, amplitude)
+        return
+
+    n_total = sum(
+        sum(_bar_samples(bar, tempo_bpm, sr) for bar in line.bars) * line.repeat
+        for section in comp.sections
+        for line in section.lines
+        if line.repeat > 0
+    )
+    # Sized like render_composition's drone (never longer than the melody)
+    n_drone = int(sr * (n_total / sr))
+    partials = _tanpura_partials(comp.reference_sa_hz, "sa_pa")
+    drone_peak = 0.0
+    for start in range(0, n_drone, _STREAM_BLOCK):
+        block = _tanpura_samples(
+            partials, start, min(_STREAM_BLOCK, n_drone - start), sr,
+        )
+        drone_peak = max(drone_peak, float(np.max(np.abs(block))))
+
+    offset = 0
+    for audio in _melody_chunks(comp, tempo_bpm, tone, sr, amplitude):
+        mixed = audio.copy()
+        n = max(0, min(len(audio), n_drone - offset))
+        if n:
+            drone = _tanpura_samples(partials, offset, n, sr)
+            if drone_peak > 0:
+                drone = drone / drone_peak * 0.5
+            mixed[:n] += drone.astype(np.float32)
+        offset += len(audio)
+        yield mixed
+
+
+def render_composition_to_wav(
+    comp: Composition,
+    path: str | Path,
+    tempo_bpm: float = 60.0,
+    tone: ToneType = ToneType.VOICE,
+    sr: int = 44100,
+    include_tanpura: bool = True,
+    amplitude: float = 0.7,
+) -> None:
+    """Render a composition straight to a float WAV file.
+
+    Produces the same audio as ``save_wav(render_composition(...))`` but
+    writes it one line performance at a time, so memory stays bounded by
+    the longest line rather than the whole composition. The soft-clip
+    needs the peak of the full mix, so the mix is generated twice: once
+    to measure it and once to write it.
+
+    Args:
+        comp: The Composition to render.
+        path: Output file path.
+        tempo_bpm: Tempo in BPM.
+        tone: Tone type for melody.
+        sr: Sample rate.
+        include_tanpura: Whether to add tanpura drone background.
+        amplitude: Melody amplitude.
+    """
+    import soundfile as sf
+
+    chunks = (tempo_bpm, tone, sr, include_tanpura, amplitude)
+    scale = 1.0
+    if include_tanpura:
+        peak = 0.0
+        for mixed in _mixed_chunks(comp, *chunks):
+            if len(mixed):
+                peak = max(peak, float(mixed.max()), -float(mixed.min()))
+        if peak > 0.95:
+            scale = peak
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with sf.SoundFile(
+        str(path), mode="w", samplerate=sr, channels=1, subtype="FLOAT",
+    ) as out:
+        for mixed in _mixed_chunks(comp, *chunks):
+            if scale != 1.0:
+                mixed = mixed / np.float32(scale)
+                mixed *= 0.95
+            out.write(mixed)
+
+
 def save_wav(
     audio: np.ndarray,
     path: str | Path,
@@ -551,3 +908,33 @@ def save_wav(
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     sf.write(str(path), audio, sr, subtype="FLOAT")
+
+
+def save_wav_pcm16(
+    audio: np.ndarray,
+    path: str | Path,
+    sr: int = 44100,
+) -> None:
+    """Save mono audio to a 16-bit PCM WAV file.
+
+    The RIFF header and sample payload are written directly with the stdlib
+    ``wave`` module, skipping libsndfile. Samples are clipped to [-1, 1]
+    before quantization.
+
+    Args:
+        audio: Audio samples as float32 numpy array.
+        path: Output file path.
+        sr: Sample rate.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Clip into a fresh float32 buffer, scale it in place, then narrow once —
+    # no second full-size float temporary, and the caller's array is untouched.
+    scaled = np.clip(audio, -1.0, 1.0).astype(np.float32, copy=False)
+    scaled *= np.float32(32767)
+    pcm = scaled.astype("<i2")
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sr)
+        f.writeframes(pcm.data)
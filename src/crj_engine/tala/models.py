@@ -87,7 +87,7 @@ class TalaDefinition:
         return self.jati_count_override or self.jati.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SwaraNote:
     """A single swara in a composition bar.
 
@@ -101,7 +101,7 @@ class SwaraNote:
     octave: Octave = Octave.MADHYA
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SaahityaSyllable:
     """A single lyric syllable aligned to a swara position.
 
@@ -113,7 +113,7 @@ class SaahityaSyllable:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     """A single bar (one tala cycle) within a composition line.
 
@@ -159,7 +159,7 @@ class Bar:
                 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """A line of composition — typically 4 bars, repeated twice.
 
@@ -172,7 +172,7 @@ class Line:
     repeat: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section of a composition (pallavi, anupallavi, charanam).
 
@@ -185,7 +185,7 @@ class Section:
     lines: list[Line]
 
 
-@dataclass
+@dataclass(slots=True)
 class Composition:
     """A complete Carnatic music composition.
 
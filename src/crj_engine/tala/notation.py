@@ -12,40 +12,25 @@ This module uses Unicode combining characters:
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from functools import lru_cache
 
+from crj_engine.swara.mapper import _load_swarasthanas
 from crj_engine.tala.models import Bar, Octave, SwaraNote
 
-_CONFIGS_DIR = Path(__file__).resolve().parents[3] / "configs"
-
 # Unicode combining marks
 _DOT_BELOW = "\u0323"  # combining dot below (mandra)
 _DOT_ABOVE = "\u0307"  # combining dot above (tara)
 
-# Cache for swara name lookups
-_SWARA_NAMES_CACHE: dict[str, dict[str, str]] | None = None
-
 
+@lru_cache(maxsize=1)
 def _load_swara_names() -> dict[str, dict[str, str]]:
-    """Load swara display names from swarasthanas.json.
+    """Load swara display names from the cached swarasthanas config.
 
     Returns a dict mapping swara_id -> {script -> short_name}.
     """
-    global _SWARA_NAMES_CACHE  # noqa: PLW0603
-    if _SWARA_NAMES_CACHE is not None:
-        return _SWARA_NAMES_CACHE
-
-    config_path = _CONFIGS_DIR / "swarasthanas.json"
-    with open(config_path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    names: dict[str, dict[str, str]] = {}
-    for swara in data["swarasthanas"]:
-        names[swara["id"]] = swara["names"]
-
-    _SWARA_NAMES_CACHE = names
-    return names
+    # NB: lru_cache returns the dict by reference — callers must not mutate.
+    # The per-swara dicts are copied so this cache never aliases the config.
+    return {swara["id"]: dict(swara["names"]) for swara in _load_swarasthanas()}
 
 
 def _apply_octave_mark(text: str, octave: Octave) -> str:
@@ -65,12 +50,17 @@ def _apply_octave_mark(text: str, octave: Octave) -> str:
         return text
 
 
+@lru_cache(maxsize=1024)
 def render_swara(
     note: SwaraNote,
     script: str = "iast",
 ) -> str:
     """Render a single swara note with octave marking.
 
+    Memoized: notes are frozen values and only a few hundred
+    (swara, octave, script) combinations exist, so bar rendering is
+    mostly cache hits.
+
     Args:
         note: The SwaraNote to render.
         script: Which script to use for display
@@ -17,25 +17,13 @@ from crj_engine.tala.models import (
 )
 
 
-def _swara_to_dict(note: SwaraNote) -> dict:
-    return {
-        "swara_id": note.swara_id,
-        "octave": note.octave.value,
-    }
-
-
-def _swara_from_dict(d: dict) -> SwaraNote:
-    return SwaraNote(
-        swara_id=d["swara_id"],
-        octave=Octave(d["octave"]),
-    )
-
-
 def _bar_to_dict(bar: Bar) -> dict:
     return {
         "tala_id": bar.tala_id,
         "speed": bar.speed.value,
-        "swaras": [_swara_to_dict(s) for s in bar.swaras],
+        "swaras": [
+            {"swara_id": s.swara_id, "octave": s.octave.value} for s in bar.swaras
+        ],
         "saahitya": [s.text for s in bar.saahitya],
     }
 
@@ -44,7 +32,7 @@ def _bar_from_dict(d: dict) -> Bar:
     return Bar(
         tala_id=d["tala_id"],
         speed=Speed(d["speed"]),
-        swaras=[_swara_from_dict(s) for s in d["swaras"]],
+        swaras=[SwaraNote(s["swara_id"], Octave(s["octave"])) for s in d["swaras"]],
         saahitya=[SaahityaSyllable(text=t) for t in d["saahitya"]],
     )
 
@@ -110,9 +98,9 @@ def save_composition(comp: Composition, path: str | Path) -> None:
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = composition_to_dict(comp)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # One encode and one write: json.dump streams many small chunks
+    text = json.dumps(composition_to_dict(comp), indent=2, ensure_ascii=False)
+    path.write_text(text, encoding="utf-8")
 
 
 def load_composition(path: str | Path) -> Composition:
@@ -7,13 +7,18 @@ tala-aligned notation and free-form (e.g. Vedic chanting) transcription.
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
 import numpy as np
 
+from crj_engine._jit import HAVE_NUMBA, njit
 from crj_engine.pitch.detector import PitchContour
-from crj_engine.swara.mapper import SwaraMatch, freq_to_swara
+from crj_engine.swara.mapper import (
+    _default_swara_lut,
+    _default_swara_table,
+    _nearest_swaras,
+)
 from crj_engine.tala.models import Octave, SwaraNote
 from crj_engine.tala.notation import render_swara
 
@@ -22,6 +27,9 @@ _BAR_LINE = "|"
 _DOT_BELOW = "\u0323"
 _DOT_ABOVE = "\u0307"
 
+# Octave registers by the index _freqs_to_octaves returns
+_OCTAVES = (Octave.MANDRA, Octave.MADHYA, Octave.TARA)
+
 
 @dataclass
 class TranscribedNote:
@@ -58,25 +66,246 @@ class TranscribedPhrase:
 
 
 @dataclass
+class NoteColumns:
+    """Transcribed notes stored column-wise, one array entry per note.
+
+    ``swara_idx`` indexes ``swara_names`` and ``octave`` indexes
+    ``_OCTAVES``; the remaining columns are float64 like the pitch contour
+    they are averaged from.
+    """
+
+    start_ms: np.ndarray
+    end_ms: np.ndarray
+    freq_hz: np.ndarray
+    cents_dev: np.ndarray
+    confidence: np.ndarray
+    swara_idx: np.ndarray
+    octave: np.ndarray
+    swara_names: np.ndarray
+
+    @classmethod
+    def from_notes(cls, notes: Sequence[TranscribedNote]) -> NoteColumns:
+        """Columns for a list of :class:`TranscribedNote` objects."""
+        names, swara_idx = np.unique(
+            np.array([n.swara_id for n in notes], dtype=str), return_inverse=True,
+        )
+        return cls(
+            start_ms=np.array([n.start_ms for n in notes], dtype=np.float64),
+            end_ms=np.array([n.end_ms for n in notes], dtype=np.float64),
+            freq_hz=np.array([n.frequency_hz for n in notes], dtype=np.float64),
+            cents_dev=np.array([n.cents_deviation for n in notes], dtype=np.float64),
+            confidence=np.array([n.confidence for n in notes], dtype=np.float64),
+            swara_idx=swara_idx.astype(np.int8),
+            octave=np.array([_OCTAVES.index(n.octave) for n in notes], dtype=np.int8),
+            swara_names=names,
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    @property
+    def swara_ids(self) -> np.ndarray:
+        """Swara id of every note, as one string array."""
+        return self.swara_names[self.swara_idx]
+
+    @property
+    def octaves(self) -> list[Octave]:
+        """Octave register of every note, as :class:`Octave` members."""
+        return [_OCTAVES[i] for i in self.octave.tolist()]
+
+    def notes(self, start: int = 0, stop: int | None = None) -> list[TranscribedNote]:
+        """Build :class:`TranscribedNote` objects for the notes in ``[start, stop)``."""
+        span = slice(start, stop)
+        return [
+            TranscribedNote(
+                start_ms=t0,
+                end_ms=t1,
+                swara_id=swara_id,
+                octave=_OCTAVES[octave],
+                frequency_hz=freq,
+                cents_deviation=dev,
+                confidence=conf,
+            )
+            for t0, t1, swara_id, octave, freq, dev, conf in zip(
+                self.start_ms[span].tolist(),
+                self.end_ms[span].tolist(),
+                self.swara_ids[span].tolist(),
+                self.octave[span].tolist(),
+                self.freq_hz[span].tolist(),
+                self.cents_dev[span].tolist(),
+                self.confidence[span].tolist(),
+                strict=True,
+            )
+        ]
+
+
+@dataclass(init=False, eq=False)
 class Transcription:
-    """Complete transcription of an audio recording."""
+    """Complete transcription of an audio recording.
+
+    Notes are stored column-wise in ``columns``; ``phrase_bounds`` holds the
+    index of each phrase's first note plus a final end offset, so phrase
+    ``i`` spans notes ``phrase_bounds[i]:phrase_bounds[i + 1]``. ``phrases``
+    builds the :class:`TranscribedPhrase` / :class:`TranscribedNote` objects
+    on first access for code that walks the transcription note by note.
+    """
 
-    phrases: list[TranscribedPhrase]
+    columns: NoteColumns
+    phrase_bounds: np.ndarray
     reference_sa_hz: float
     duration_s: float
-    unique_swaras: list[str] = field(default_factory=list)
+    unique_swaras: list[str]
+
+    def __init__(
+        self,
+        phrases: list[TranscribedPhrase],
+        reference_sa_hz: float,
+        duration_s: float,
+        unique_swaras: list[str] | None = None,
+    ):
+        self.columns = NoteColumns.from_notes([n for p in phrases for n in p.notes])
+        self.phrase_bounds = np.cumsum([0] + [len(p.notes) for p in phrases])
+        self.reference_sa_hz = reference_sa_hz
+        self.duration_s = duration_s
+        self.unique_swaras = unique_swaras if unique_swaras is not None else []
+        # The caller's list is not kept: ``phrases`` is rebuilt from the
+        # columns, so later edits to that list can't diverge from them
+        self._phrases: list[TranscribedPhrase] | None = None
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: NoteColumns,
+        phrase_bounds: np.ndarray,
+        reference_sa_hz: float,
+        duration_s: float,
+        unique_swaras: list[str] | None = None,
+    ) -> Transcription:
+        """Build a transcription directly from note columns and phrase offsets."""
+        transcription = cls.__new__(cls)
+        transcription.columns = columns
+        transcription.phrase_bounds = phrase_bounds
+        transcription.reference_sa_hz = reference_sa_hz
+        transcription.duration_s = duration_s
+        transcription.unique_swaras = unique_swaras if unique_swaras is not None else []
+        transcription._phrases = None
+        return transcription
+
+    @property
+    def phrases(self) -> list[TranscribedPhrase]:
+        """Per-phrase view of the notes, built once on first access."""
+        if self._phrases is None:
+            bounds = self.phrase_bounds.tolist()
+            self._phrases = [
+                TranscribedPhrase(notes=self.columns.notes(start, stop))
+                for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+            ]
+        return self._phrases
+
+    @property
+    def all_swara_ids(self) -> np.ndarray:
+        """Swara ids of every note across all phrases, as one string array."""
+        return self.columns.swara_ids
 
 
-def _freq_to_octave(freq_hz: float, reference_sa_hz: float) -> Octave:
-    """Determine the octave register of a frequency relative to Sa."""
-    if freq_hz <= 0 or reference_sa_hz <= 0:
-        return Octave.MADHYA
-    cents = 1200 * math.log2(freq_hz / reference_sa_hz)
-    if cents < -300:
-        return Octave.MANDRA
-    elif cents > 900:
-        return Octave.TARA
-    return Octave.MADHYA
+def _freqs_to_octaves(freq_hz: np.ndarray, reference_sa_hz: float) -> np.ndarray:
+    """Octave register of each frequency relative to Sa, as ``_OCTAVES`` indices.
+
+    Below -300 cents is mandra, above 900 cents tara, anything else
+    (including non-positive frequencies) madhya.
+    """
+    octaves = np.ones(len(freq_hz), dtype=np.int8)
+    if reference_sa_hz <= 0:
+        return octaves
+    voiced = freq_hz > 0
+    cents = 1200 * np.log2(freq_hz[voiced] / reference_sa_hz)
+    octaves[voiced] = np.select([cents < -300, cents > 900], [0, 2], default=1)
+    return octaves
+
+
+def _note_runs(
+    swara_idx: np.ndarray,
+    timestamps: np.ndarray,
+    freqs: np.ndarray,
+    deviations: np.ndarray,
+    confidences: np.ndarray,
+    no_match: int,
+    hop_ms: float,
+    min_note_ms: float,
+) -> tuple[np.ndarray, ...]:
+    """Runs of equal swara index that make notes, with per-run means.
+
+    Runs of *no_match* frames and runs shorter than *min_note_ms* are
+    dropped. Returns ``(starts, start_ms, end_ms, mean_freqs, mean_devs,
+    mean_confs)`` for the kept runs, ``starts`` being each run's first frame.
+    """
+    if len(swara_idx) == 0:
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=np.int64), empty, empty, empty, empty, empty
+
+    changes = np.flatnonzero(swara_idx[1:] != swara_idx[:-1]) + 1
+    starts = np.concatenate(([0], changes))
+    ends = np.append(changes, len(swara_idx))
+    start_ms = timestamps[starts]
+    end_ms = timestamps[ends - 1] + hop_ms
+    keep = (swara_idx[starts] != no_match) & (end_ms - start_ms >= min_note_ms)
+
+    # Per-run means: run sums over run lengths, for the kept runs
+    lengths = (ends - starts)[keep]
+    return (
+        starts[keep],
+        start_ms[keep],
+        end_ms[keep],
+        *(np.add.reduceat(values, starts)[keep] / lengths
+          for values in (freqs, deviations, confidences)),
+    )
+
+
+@njit(cache=True)
+def _note_runs_kernel(
+    swara_idx, timestamps, freqs, deviations, confidences,
+    no_match, hop_ms, min_note_ms,
+):  # pragma: no cover - compiled by numba
+    """``_note_runs`` as a single pass over the frames.
+
+    Runs are summed front to back rather than pairwise as ``np.add.reduceat``
+    does, so the means can differ from the NumPy path in the last bits.
+    """
+    n = swara_idx.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    start_ms = np.empty(n)
+    end_ms = np.empty(n)
+    mean_freqs = np.empty(n)
+    mean_devs = np.empty(n)
+    mean_confs = np.empty(n)
+    n_notes = 0
+    i = 0
+    while i < n:
+        k = swara_idx[i]
+        sum_freq = freqs[i]
+        sum_dev = deviations[i]
+        sum_conf = confidences[i]
+        j = i + 1
+        while j < n and swara_idx[j] == k:
+            sum_freq += freqs[j]
+            sum_dev += deviations[j]
+            sum_conf += confidences[j]
+            j += 1
+        end = timestamps[j - 1] + hop_ms
+        if k != no_match and end - timestamps[i] >= min_note_ms:
+            length = j - i
+            starts[n_notes] = i
+            start_ms[n_notes] = timestamps[i]
+            end_ms[n_notes] = end
+            mean_freqs[n_notes] = sum_freq / length
+            mean_devs[n_notes] = sum_dev / length
+            mean_confs[n_notes] = sum_conf / length
+            n_notes += 1
+        i = j
+    return (
+        starts[:n_notes], start_ms[:n_notes], end_ms[:n_notes],
+        mean_freqs[:n_notes], mean_devs[:n_notes], mean_confs[:n_notes],
+    )
 
 
 def transcribe_contour(
@@ -105,82 +334,62 @@ def transcribe_contour(
     """
     hop_ms = contour.hop_ms
 
-    # Step 1: Map each frame to a swara
-    frame_swaras: list[tuple[float, SwaraMatch | None, float]] = []
-    for frame in contour.frames:
-        if frame.frequency_hz <= 0 or frame.confidence < min_confidence:
-            frame_swaras.append((frame.timestamp_ms, None, frame.confidence))
-        else:
-            match = freq_to_swara(
-                frame.frequency_hz,
-                reference_sa_hz=reference_sa_hz,
-                tolerance_cents=tolerance_cents,
-            )
-            frame_swaras.append((frame.timestamp_ms, match, frame.confidence))
-
-    # Step 2: Run-length encode into note segments
-    raw_notes: list[TranscribedNote] = []
-    i = 0
-    while i < len(frame_swaras):
-        ts, match, conf = frame_swaras[i]
-        if match is None:
-            i += 1
-            continue
-
-        # Start a new note run
-        swara_id = match.swara_id
-        octave = _freq_to_octave(match.frequency_hz, reference_sa_hz)
-        start_ms = ts
-        freqs = [match.frequency_hz]
-        devs = [match.cents_deviation]
-        confs = [conf]
-
-        j = i + 1
-        while j < len(frame_swaras):
-            ts_j, match_j, conf_j = frame_swaras[j]
-            if match_j is None or match_j.swara_id != swara_id:
-                break
-            freqs.append(match_j.frequency_hz)
-            devs.append(match_j.cents_deviation)
-            confs.append(conf_j)
-            j += 1
-
-        end_ms = frame_swaras[j - 1][0] + hop_ms
-        duration = end_ms - start_ms
-
-        if duration >= min_note_ms:
-            raw_notes.append(TranscribedNote(
-                start_ms=start_ms,
-                end_ms=end_ms,
-                swara_id=swara_id,
-                octave=octave,
-                frequency_hz=float(np.mean(freqs)),
-                cents_deviation=float(np.mean(devs)),
-                confidence=float(np.mean(confs)),
-            ))
-
-        i = j
+    # Step 1: Map every frame to a swara in one vectorized pass. Frames that
+    # are unvoiced or below min_confidence are matched as 0 Hz (no swara).
+    timestamps = contour.timestamps
+    freqs = contour.frequencies
+    confidences = contour.confidences
+    skipped = (freqs <= 0) | (confidences < min_confidence)
+    table, ids = _default_swara_table()
+    swara_idx, deviations = _nearest_swaras(
+        np.where(skipped, 0.0, freqs), reference_sa_hz, tolerance_cents, table,
+        _default_swara_lut(),
+    )
+    no_match = len(table)
+
+    # Step 2: Run-length encode into note segments. A run starts wherever
+    # the swara index changes; runs of unmatched frames are dropped, and so
+    # are notes shorter than min_note_ms.
+    if HAVE_NUMBA:
+        starts, start_ms, end_ms, mean_freqs, mean_devs, mean_confs = _note_runs_kernel(
+            swara_idx, timestamps, freqs, deviations, confidences,
+            no_match, hop_ms, min_note_ms,
+        )
+    else:
+        starts, start_ms, end_ms, mean_freqs, mean_devs, mean_confs = _note_runs(
+            swara_idx, timestamps, freqs, deviations, confidences,
+            no_match, hop_ms, min_note_ms,
+        )
+
+    columns = NoteColumns(
+        start_ms=start_ms,
+        end_ms=end_ms,
+        freq_hz=mean_freqs,
+        cents_dev=mean_devs,
+        confidence=mean_confs,
+        swara_idx=swara_idx[starts].astype(np.int8),
+        # Register of each note's first frame
+        octave=_freqs_to_octaves(freqs[starts], reference_sa_hz),
+        swara_names=ids,
+    )
 
-    # Step 3: Group notes into phrases (separated by gaps)
-    phrases: list[TranscribedPhrase] = []
-    if raw_notes:
-        current_phrase: list[TranscribedNote] = [raw_notes[0]]
-        for note in raw_notes[1:]:
-            gap = note.start_ms - current_phrase[-1].end_ms
-            if gap > phrase_gap_ms:
-                phrases.append(TranscribedPhrase(notes=current_phrase))
-                current_phrase = [note]
-            else:
-                current_phrase.append(note)
-        phrases.append(TranscribedPhrase(notes=current_phrase))
+    # Step 3: Group notes into phrases, breaking wherever the silence
+    # between one note's end and the next note's start exceeds phrase_gap_ms
+    breaks = np.flatnonzero(start_ms[1:] - end_ms[:-1] > phrase_gap_ms) + 1
+    phrase_bounds = (
+        np.concatenate(([0], breaks, [len(columns)]))
+        if len(columns)
+        else np.zeros(1, dtype=np.int64)
+    )
 
     # Unique swaras
-    all_ids = sorted({n.swara_id for p in phrases for n in p.notes})
+    all_ids = sorted(ids[np.unique(columns.swara_idx)].tolist())
 
-    duration_s = contour.frames[-1].timestamp_ms / 1000 if contour.frames else 0
+    duration_s = float(contour.timestamps[-1]) / 1000 if len(contour) else 0
 
-    return Transcription(
-        phrases=phrases,
+    return Transcription.from_columns(
+        columns,
+        phrase_bounds,
         reference_sa_hz=reference_sa_hz,
         duration_s=duration_s,
         unique_swaras=all_ids,
@@ -191,6 +400,63 @@ def transcribe_contour(
 # Notation rendering
 # ---------------------------------------------------------------------------
 
+def _sustain_marks(beats: int) -> str:
+    """Sustain commas written after a note lasting *beats* beats."""
+    return (" " + ",  " * (beats - 1)).rstrip()
+
+
+def _compact_sustain_marks(beats: int) -> str:
+    """:func:`_sustain_marks` for the compact single-line notation."""
+    return " ," * (beats - 1)
+
+
+# Sustain marks indexed by beat count; longer notes are marked on the fly
+_SUSTAIN_MARKS = tuple(_sustain_marks(b) for b in range(33))
+_COMPACT_SUSTAIN_MARKS = tuple(_compact_sustain_marks(b) for b in range(33))
+
+
+def _note_texts(
+    columns: NoteColumns,
+    script: str,
+    marks: tuple[str, ...],
+    build_marks: Callable[[int], str],
+) -> list[str]:
+    """Rendered swara plus sustain marks for every note in *columns*.
+
+    A note is marked with one sustain per 250 ms beat beyond its first;
+    *marks* is the precomputed table and *build_marks* covers longer notes.
+    """
+    # render_swara is memoized per (note, script), so repeated swaras are
+    # cache hits
+    beats = np.maximum(np.rint((columns.end_ms - columns.start_ms) / 250), 1)
+    return [
+        render_swara(SwaraNote(swara_id=swara_id, octave=octave), script=script)
+        + (marks[n] if n < len(marks) else build_marks(n))
+        for swara_id, octave, n in zip(
+            columns.swara_ids.tolist(),
+            columns.octaves,
+            beats.astype(np.int64).tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _phrase_spans(transcription: Transcription) -> list[tuple[int, int]]:
+    """``(start, stop)`` note offsets of each phrase."""
+    bounds = transcription.phrase_bounds.tolist()
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
+
+
+def _notation_row(chunk: list[str]) -> str:
+    """One indented row of notes, split by a bar line when it holds more than 4."""
+    if len(chunk) > 4:
+        bar_mid = len(chunk) // 2
+        first_half = "  ".join(chunk[:bar_mid])
+        second_half = "  ".join(chunk[bar_mid:])
+        return f"    {first_half}  {_BAR_LINE}  {second_half}"
+    return f"    {'  '.join(chunk)}"
+
+
 def render_transcription(
     transcription: Transcription,
     script: str = "iast",
@@ -208,38 +474,23 @@ def render_transcription(
     Returns:
         Multi-line formatted notation string.
     """
+    columns = transcription.columns
+    note_strs = _note_texts(columns, script, _SUSTAIN_MARKS, _sustain_marks)
     lines: list[str] = []
 
-    for pi, phrase in enumerate(transcription.phrases):
+    for pi, (start, stop) in enumerate(_phrase_spans(transcription)):
         if show_timing:
-            t_start = phrase.start_ms / 1000
-            t_end = phrase.end_ms / 1000
+            t_start = float(columns.start_ms[start]) / 1000 if stop > start else 0.0
+            t_end = float(columns.end_ms[stop - 1]) / 1000 if stop > start else 0.0
             lines.append(f"  Phrase {pi + 1}  [{t_start:.1f}s – {t_end:.1f}s]")
         else:
             lines.append(f"  Phrase {pi + 1}")
 
         # Render notes in rows of notes_per_line
-        note_strs: list[str] = []
-        for note in phrase.notes:
-            sn = note.to_swara_note()
-            rendered = render_swara(sn, script=script)
-            # Indicate sustain with duration markers
-            beats = max(1, round(note.duration_ms / 250))
-            if beats > 1:
-                rendered += " " + ",  " * (beats - 1)
-            note_strs.append(rendered.strip())
-
-        # Group into lines
-        for i in range(0, len(note_strs), notes_per_line):
-            chunk = note_strs[i : i + notes_per_line]
-            bar_mid = len(chunk) // 2
-            if len(chunk) > 4:
-                first_half = "  ".join(chunk[:bar_mid])
-                second_half = "  ".join(chunk[bar_mid:])
-                lines.append(f"    {first_half}  {_BAR_LINE}  {second_half}")
-            else:
-                lines.append(f"    {'  '.join(chunk)}")
-
+        lines.extend(
+            _notation_row(note_strs[i : min(i + notes_per_line, stop)])
+            for i in range(start, stop, notes_per_line)
+        )
         lines.append("")
 
     return "\n".join(lines)
@@ -253,17 +504,9 @@ def render_transcription_compact(
 
     Uses commas for sustain and dashes for gaps between phrases.
     """
-    parts: list[str] = []
-
-    for phrase in transcription.phrases:
-        phrase_notes: list[str] = []
-        for note in phrase.notes:
-            sn = note.to_swara_note()
-            rendered = render_swara(sn, script=script)
-            beats = max(1, round(note.duration_ms / 250))
-            phrase_notes.append(rendered)
-            for _ in range(beats - 1):
-                phrase_notes.append(",")
-        parts.append(" ".join(phrase_notes))
-
-    return "  ||  ".join(parts)
+    note_strs = _note_texts(
+        transcription.columns, script, _COMPACT_SUSTAIN_MARKS, _compact_sustain_marks,
+    )
+    return "  ||  ".join(
+        " ".join(note_strs[start:stop]) for start, stop in _phrase_spans(transcription)
+    )
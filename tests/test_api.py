@@ -78,6 +78,16 @@ class TestReferenceEndpoints:
         names = [r["name"] for r in data]
         assert "Dheerasankarabharanam" in names
 
+    def test_served_without_lifespan(self):
+        app = create_app()
+        c = TestClient(app)  # no `with`: startup never runs
+        r = c.get("/api/v1/ragas")
+        assert r.status_code == 200
+        assert len(r.json()) == 72
+        payloads = app.state.reference_payloads
+        assert c.get("/api/v1/swarasthanas").status_code == 200
+        assert app.state.reference_payloads is payloads
+
 
 # ---------------------------------------------------------------------------
 # Analyze
@@ -159,6 +169,38 @@ class TestAnalyzeEndpoint:
         )
         assert r.status_code == 400
 
+    def test_rejects_mislabelled_content(self, client):
+        r = client.post(
+            "/api/v1/analyze",
+            files={"file": ("photo.wav", b"\xff\xd8\xff\xe0" + b"\x00" * 64, "audio/wav")},
+        )
+        assert r.status_code == 400
+
+    @pytest.mark.parametrize(
+        ("head", "suffix"),
+        [
+            (b"\xff\xfb\x90\x00", ".mp3"),  # MPEG-1 layer III
+            (b"\xff\xf3\x40\x00", ".mp3"),  # MPEG-2 layer III
+            (b"\xff\xe3\x18\x00", ".mp3"),  # MPEG-2.5 layer III (low-bitrate voice)
+            (b"\xff\xf1\x50\x80", ".aac"),  # ADTS, MPEG-4
+            (b"\xff\xf9\x50\x80", ".aac"),  # ADTS, MPEG-2
+            (b"\xff\xeb\x90\x00", None),  # reserved MPEG version
+            (b"\xff\xe1\x00\x00", None),  # layer 00 without the 12-bit sync
+            (b"\xff\xd8\xff\xe0", None),  # JPEG
+        ],
+    )
+    def test_sniffs_mpeg_frame_sync(self, head, suffix):
+        from crj_engine.api.routes.analyze import _sniff_suffix
+
+        assert _sniff_suffix(head + b"\x00" * 8) == suffix
+
+    def test_sniffs_wav_uploaded_under_other_extension(self, client, sample_wav_bytes):
+        r = client.post(
+            "/api/v1/analyze",
+            files={"file": ("test.webm", sample_wav_bytes, "audio/webm")},
+        )
+        assert r.status_code == 200
+
     def test_rejects_short_audio(self, client):
         """Audio shorter than 0.5s should be rejected."""
         sr = 16000
@@ -0,0 +1,103 @@
+"""Tests for audio loading through the ffmpeg pipe."""
+
+import io
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from crj_engine.pitch import audio_io
+from crj_engine.pitch.audio_io import load_audio
+
+
+@pytest.fixture()
+def ffmpeg(monkeypatch):
+    """Pretend ffmpeg is installed and record every ``subprocess.run`` call.
+
+    Set ``ffmpeg.result`` to the CompletedProcess the fake run returns.
+    """
+
+    class FakeFfmpeg:
+        calls: list[tuple[list[str], dict]] = []
+        result = subprocess.CompletedProcess([], 0, stdout=b"", stderr=b"")
+
+        @classmethod
+        def run(cls, args, **kwargs):
+            cls.calls.append((args, kwargs))
+            return cls.result
+
+    FakeFfmpeg.calls = []
+    monkeypatch.setattr(shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(subprocess, "run", FakeFfmpeg.run)
+    return FakeFfmpeg
+
+
+class TestFfmpegLoader:
+    def test_decodes_pipe_output_at_target_sr(self, ffmpeg, tmp_path):
+        path = tmp_path / "alapana.mp3"
+        path.write_bytes(b"ID3 not really an mp3")
+        expected = np.array([0.0, 0.25, -0.5, 1.0, -1.0], dtype=np.float32)
+        ffmpeg.result = subprocess.CompletedProcess(
+            [], 0, stdout=expected.astype("<f4").tobytes(), stderr=b"",
+        )
+
+        audio, sr = load_audio(path, target_sr=22050)
+
+        assert sr == 22050
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, expected)
+        assert audio.flags.writeable
+
+        (args, kwargs), = ffmpeg.calls
+        assert args[0] == "ffmpeg"
+        assert args[args.index("-i") + 1] == str(path)
+        assert args[args.index("-ar") + 1] == "22050"
+        assert args[args.index("-ac") + 1] == "1"
+        assert args[args.index("-f") + 1] == "f32le"
+        assert kwargs["input"] is None
+
+    @pytest.mark.parametrize(
+        ("fmt", "demuxer"), [("ogg", "ogg"), (".m4a", "m4a"), ("wma", "asf")],
+    )
+    def test_file_like_source_is_piped_seekably(self, ffmpeg, fmt, demuxer):
+        data = b"encoded bytes"
+        ffmpeg.result = subprocess.CompletedProcess(
+            [], 0, stdout=np.zeros(3, dtype="<f4").tobytes(), stderr=b"",
+        )
+
+        audio, sr = load_audio(io.BytesIO(data), target_sr=16000, format=fmt)
+
+        assert (len(audio), sr) == (3, 16000)
+        (args, kwargs), = ffmpeg.calls
+        # Input options precede -i: the container hint, then the cache:
+        # protocol that lets ffmpeg seek in stdin (non-faststart M4A files
+        # keep their moov atom at the end)
+        i = args.index("-i")
+        assert args[i + 1] == "cache:pipe:0"
+        assert args[i - 4:i] == ["-f", demuxer, "-read_ahead_limit", "-1"]
+        assert kwargs["input"] == data
+
+    def test_nonzero_exit_raises(self, ffmpeg, tmp_path):
+        path = tmp_path / "broken.m4a"
+        path.write_bytes(b"\x00\x01")
+        ffmpeg.result = subprocess.CompletedProcess(
+            [], 1, stdout=b"", stderr=b"broken.m4a: Invalid data found\n",
+        )
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            load_audio(path, target_sr=16000)
+
+    def test_falls_back_to_pydub_without_ffmpeg(self, monkeypatch, tmp_path):
+        path = tmp_path / "kriti.mp3"
+        path.write_bytes(b"ID3")
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+        monkeypatch.setattr(
+            audio_io,
+            "_load_via_pydub",
+            lambda source, fmt, target_sr: (np.ones(2, dtype=np.float32), target_sr),
+        )
+
+        audio, sr = load_audio(path, target_sr=16000)
+        assert sr == 16000
+        np.testing.assert_array_equal(audio, [1.0, 1.0])
@@ -7,8 +7,9 @@ files or heavy ML dependencies are required.
 import numpy as np
 import pytest
 
+from crj_engine.pitch import gamaka
 from crj_engine.pitch.detector import PitchAlgorithm, PitchContour, PitchFrame
-from crj_engine.pitch.gamaka import GamakaType, classify_gamaka
+from crj_engine.pitch.gamaka import GamakaType, classify_gamaka, classify_gamakas
 from crj_engine.pitch.segmenter import PitchSegment, segment_contour
 
 # ---------------------------------------------------------------------------
@@ -115,6 +116,18 @@ class TestSegmenter:
             valid = seg.cents_from_sa[~np.isnan(seg.cents_from_sa)]
             assert np.all(np.abs(valid) < 1.0)
 
+    def test_segments_are_read_only_views_unless_copied(self):
+        contour = _make_contour(np.full(50, REFERENCE_SA_HZ))
+        views = segment_contour(contour, reference_sa_hz=REFERENCE_SA_HZ)
+        copies = segment_contour(contour, reference_sa_hz=REFERENCE_SA_HZ, copy=True)
+        assert len(views) == len(copies) > 1
+        assert np.shares_memory(views[0].cents_from_sa, views[1].cents_from_sa)
+        assert not views[0].cents_from_sa.flags.writeable
+        assert copies[0].cents_from_sa.flags.writeable
+        for view, copied in zip(views, copies, strict=True):
+            np.testing.assert_array_equal(view.cents_from_sa, copied.cents_from_sa)
+            np.testing.assert_array_equal(view.frequencies, copied.frequencies)
+
     def test_low_confidence_frames_excluded(self):
         """Segments where most frames are unvoiced should be dropped."""
         n_frames = 50
@@ -388,3 +401,45 @@ class TestSegmenterClassifierIntegration:
             for seg in segments
         )
         assert jaru_found, "Expected at least one segment classified as Jaru"
+
+
+class TestFeatureKernel:
+    """The fused feature pass must agree with the step-by-step NumPy helpers."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_numpy_helpers(self, seed):
+        rng = np.random.default_rng(seed)
+        cents = rng.normal(0, 60, 40)
+        cents[[0, 1, 7, 8, 9, 20, 39]] = np.nan
+
+        clean, deriv, zc, pitch_range = gamaka._gamaka_features(cents)
+
+        expected = gamaka._clean_cents(cents)
+        expected_deriv = gamaka._first_derivative(expected)
+        np.testing.assert_array_equal(clean, expected)
+        np.testing.assert_array_equal(deriv, expected_deriv)
+        assert zc == gamaka._zero_crossings(expected_deriv)
+        assert pitch_range == float(np.nanmax(expected) - np.nanmin(expected))
+
+    def test_all_nan_returns_none(self):
+        assert gamaka._gamaka_features(np.full(5, np.nan)) is None
+
+
+class TestBatchClassification:
+    """classify_gamakas must match classify_gamaka segment by segment."""
+
+    def test_matches_per_segment(self):
+        rng = np.random.default_rng(0)
+        segments = []
+        for n in (1, 5, 12, 30, 30, 40):
+            cents = rng.normal(0, 60, n)
+            if n > 5:
+                cents[[1, 3]] = np.nan
+            segments.append(_make_segment(cents))
+        segments.append(_make_segment(np.full(10, np.nan)))
+
+        batch = classify_gamakas(segments, hop_ms=HOP_MS)
+        assert batch == [classify_gamaka(seg, hop_ms=HOP_MS) for seg in segments]
+
+    def test_empty_batch(self):
+        assert classify_gamakas([], hop_ms=HOP_MS) == []
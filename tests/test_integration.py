@@ -369,6 +369,21 @@ class TestWavFilePipeline:
             f"Only {sa_count}/{len(voiced.frames)} frames mapped to Sa"
         )
 
+    def test_load_from_memory_matches_path(self, test_audio_dir):
+        """Decoding WAV bytes from a BytesIO matches decoding the file on disk."""
+        import io
+
+        wav_path = test_audio_dir / "test_sa_261hz.wav"
+        if not wav_path.exists():
+            pytest.skip("Test audio not generated — run scripts/generate_test_audio.py")
+
+        from_path, sr_path = load_audio(wav_path, target_sr=16000)
+        from_mem, sr_mem = load_audio(
+            io.BytesIO(wav_path.read_bytes()), target_sr=16000, format="wav",
+        )
+        assert sr_mem == sr_path
+        np.testing.assert_array_equal(from_mem, from_path)
+
     def test_shankarabharanam_wav_to_raga(self, test_audio_dir):
         """Load Shankarabharanam scale WAV and identify the raga."""
         wav_path = test_audio_dir / "test_shankarabharanam_scale.wav"
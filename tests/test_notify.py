@@ -0,0 +1,306 @@
+"""Tests for the milestone notification module."""
+
+import smtplib
+import subprocess
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from crj_engine import notify
+
+
+@pytest.fixture()
+def log_path(tmp_path, monkeypatch):
+    """Point the notification log at a temporary directory."""
+    monkeypatch.setattr(notify, "_PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(notify, "_LOG_FH", None)
+    yield tmp_path / "data" / "notifications.log"
+    if notify._LOG_FH is not None:
+        notify._LOG_FH.close()
+
+
+@pytest.fixture()
+def git_cli(monkeypatch):
+    """Force the ``git`` CLI path of ``_get_git_info`` with a fresh cache."""
+    monkeypatch.setattr(notify, "_git_info_pygit2", lambda: None)
+    notify._get_git_info.cache_clear()
+    yield
+    notify._get_git_info.cache_clear()
+
+
+class _FakeSMTP:
+    """Stands in for ``smtplib.SMTP``; every instance is one connection."""
+
+    instances: list["_FakeSMTP"] = []
+    reject = ""  # sendmail fails for messages containing this text
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.sent: list[str] = []
+        self.dropped = False
+        self.closed = False
+        self.logins = 0
+        _FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def noop(self):
+        if self.dropped:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return 250, b"OK"
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if _FakeSMTP.reject and _FakeSMTP.reject in msg:
+            raise smtplib.SMTPDataError(554, b"Message rejected")
+        self.sent.append(msg)
+
+    def quit(self):
+        if self.dropped:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def smtp(log_path, monkeypatch):
+    """Configure SMTP through the environment against ``_FakeSMTP``."""
+    monkeypatch.setenv("CRJ_SMTP_HOST", "smtp.example.org")
+    monkeypatch.setenv("CRJ_SMTP_USERNAME", "crj")
+    monkeypatch.setenv("CRJ_SMTP_PASSWORD", "secret")
+    monkeypatch.setattr(notify, "_get_git_info", lambda: {"commit": "abc1234"})
+    monkeypatch.setattr(smtplib, "SMTP", _FakeSMTP)
+    monkeypatch.setattr(notify, "_SMTP_POOL", notify._SMTPPool())
+    _FakeSMTP.instances = []
+    _FakeSMTP.reject = ""
+    yield _FakeSMTP.instances
+    notify._SMTP_POOL.close()
+
+
+def _fake_git_log(refs: str, subject: str = "Fix the tuner"):
+    def run(args, **kwargs):
+        assert args[:2] == ["git", "log"]
+        out = "\x1f".join(["abc1234", "Asha", refs, subject])
+        return subprocess.CompletedProcess(args, 0, stdout=out, stderr="")
+
+    return run
+
+
+class TestGitInfo:
+    @pytest.mark.parametrize(
+        ("refs", "branch", "tag"),
+        [
+            ("HEAD -> main, tag: v0.1.0-pitch, origin/main", "main", "v0.1.0-pitch"),
+            ("HEAD -> feature/tala, origin/feature/tala", "feature/tala", ""),
+            ("HEAD, tag: v0.2.0, tag: v0.2.0-rc1", "HEAD", "v0.2.0"),
+            ("HEAD", "HEAD", ""),
+            ("", "", ""),
+        ],
+    )
+    def test_parses_refs(self, git_cli, monkeypatch, refs, branch, tag):
+        monkeypatch.setattr(subprocess, "run", _fake_git_log(refs))
+        info = notify._get_git_info()
+        assert info == {
+            "branch": branch,
+            "commit": "abc1234",
+            "commit_msg": "Fix the tuner",
+            "author": "Asha",
+            "tag": tag,
+        }
+
+    def test_subject_may_contain_separators(self, git_cli, monkeypatch):
+        subject = "Parse %D, tag: lines \x1f and more"
+        monkeypatch.setattr(subprocess, "run", _fake_git_log("HEAD -> main", subject))
+        assert notify._get_git_info()["commit_msg"] == subject
+
+    def test_git_failure_gives_empty_info(self, git_cli, monkeypatch):
+        def run(args, **kwargs):
+            raise subprocess.CalledProcessError(128, args)
+
+        monkeypatch.setattr(subprocess, "run", run)
+        info = notify._get_git_info()
+        assert set(info.values()) == {""}
+
+
+def _fake_pygit2(
+    message: str = "Fix the tuner\n\nLonger body.",
+    branch: str | None = "main",
+    tags: dict[str, str] | None = None,
+) -> ModuleType:
+    """A stand-in ``pygit2`` module over one commit ``abc1234``.
+
+    *branch* None makes HEAD detached; *tags* maps tag name -> commit id.
+    """
+    module = ModuleType("pygit2")
+    module.Commit = type("Commit", (), {})
+    commit = SimpleNamespace(
+        id="abc1234ffff",
+        short_id="abc1234",
+        message=message,
+        author=SimpleNamespace(name="Asha"),
+    )
+
+    def ref_to(commit_id):
+        target = SimpleNamespace(id=commit_id)
+        return SimpleNamespace(peel=lambda cls: target)
+
+    references = {"refs/heads/main": ref_to(commit.id)}
+    for name, commit_id in (tags or {}).items():
+        references[f"refs/tags/{name}"] = ref_to(commit_id)
+
+    repo = SimpleNamespace(
+        head=SimpleNamespace(peel=lambda cls: commit, shorthand=branch or "HEAD"),
+        head_is_detached=branch is None,
+        references=references,
+    )
+    module.Repository = lambda path: repo
+    return module
+
+
+class TestGitInfoPygit2:
+    def test_branch_and_tag(self, monkeypatch):
+        tags = {"v0.0.9": "0000000", "v0.1.0-pitch": "abc1234ffff"}
+        monkeypatch.setitem(sys.modules, "pygit2", _fake_pygit2(tags=tags))
+        assert notify._git_info_pygit2() == {
+            "branch": "main",
+            "commit": "abc1234",
+            "commit_msg": "Fix the tuner",
+            "author": "Asha",
+            "tag": "v0.1.0-pitch",
+        }
+
+    def test_detached_head_without_tag(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pygit2", _fake_pygit2(branch=None))
+        info = notify._git_info_pygit2()
+        assert (info["branch"], info["tag"]) == ("HEAD", "")
+
+    def test_subject_is_first_paragraph_on_one_line(self, monkeypatch):
+        message = "Fix the\ntuner  drift\n\nDetails here.\n"
+        monkeypatch.setitem(sys.modules, "pygit2", _fake_pygit2(message=message))
+        assert notify._git_info_pygit2()["commit_msg"] == "Fix the tuner drift"
+
+    def test_missing_pygit2_returns_none(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pygit2", None)  # import raises ImportError
+        assert notify._git_info_pygit2() is None
+
+    def test_unreadable_repository_falls_back_to_cli(self, monkeypatch):
+        module = _fake_pygit2()
+
+        def repository(path):
+            raise OSError("not a git repository")
+
+        module.Repository = repository
+        monkeypatch.setitem(sys.modules, "pygit2", module)
+        monkeypatch.setattr(subprocess, "run", _fake_git_log("HEAD -> dev"))
+        notify._get_git_info.cache_clear()
+        try:
+            assert notify._get_git_info()["branch"] == "dev"
+        finally:
+            notify._get_git_info.cache_clear()
+
+
+class TestHtmlBody:
+    def test_values_are_inserted_verbatim(self):
+        git_info = {
+            "branch": "main",
+            "commit": "abc1234",
+            "commit_msg": "Use ${tag} and {} in $templates",
+            "author": "Asha",
+        }
+        body = notify._build_html_body(
+            "Costs $5 {not a field}", "v$1", "a $b {c} $$", git_info,
+        )
+        assert "Costs $5 {not a field}" in body
+        assert "<code>v$1</code>" in body
+        assert "Use ${tag} and {} in $templates" in body
+        assert "a $b {c} $$" in body
+
+    def test_details_block_omitted_when_empty(self):
+        body = notify._build_html_body("Label", "v1", "", {})
+        assert "Details:" not in body
+
+
+class TestLocalLog:
+    def test_unconfigured_smtp_logs_locally(self, log_path, monkeypatch, capsys):
+        monkeypatch.delenv("CRJ_SMTP_HOST", raising=False)
+        monkeypatch.delenv("CRJ_SMTP_USERNAME", raising=False)
+        monkeypatch.setattr(notify, "_get_git_info", lambda: {"commit": "abc1234"})
+
+        assert notify.send_notification("Pitch Done", tag="v0.1.0-pitch") is False
+        assert notify.send_notification("Raga Done") is False
+        assert "SMTP not configured" in capsys.readouterr().out
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert "[LOCAL_ONLY] Pitch Done | tag=v0.1.0-pitch | commit=abc1234 | " in lines[0]
+        assert "[LOCAL_ONLY] Raga Done | tag= | commit=abc1234" in lines[1]
+
+
+class TestSMTPPool:
+    def test_reuses_one_connection(self, smtp):
+        assert notify.send_notification("Pitch Done", tag="v0.1.0-pitch")
+        assert notify.send_notification("Swara Done", tag="v0.1.0-swara")
+        assert len(smtp) == 1
+        assert smtp[0].logins == 1
+        assert len(smtp[0].sent) == 2
+
+    def test_reconnects_after_server_disconnect(self, smtp):
+        assert notify.send_notification("Pitch Done")
+        smtp[0].dropped = True
+        assert notify.send_notification("Swara Done")
+        assert len(smtp) == 2
+        assert smtp[0].closed
+        assert len(smtp[0].sent) == 1
+        assert len(smtp[1].sent) == 1
+
+    def test_recycles_after_max_messages(self, smtp, monkeypatch):
+        monkeypatch.setattr(notify, "_SMTP_POOL", notify._SMTPPool(max_messages=2))
+        for label in ("One", "Two", "Three"):
+            assert notify.send_notification(label)
+        assert [len(c.sent) for c in smtp] == [2, 1]
+        assert smtp[0].closed
+
+
+class TestBatch:
+    _MILESTONES = [
+        ("Pitch Done", "v0.1.0-pitch", "95%"),
+        ("Swara Done", "v0.1.0-swara", ""),
+        ("Raga Done", "v0.1.0-raga", ""),
+    ]
+
+    def test_one_session_and_one_log_write(self, smtp, log_path, monkeypatch):
+        log = notify._log_file()
+        writes = []
+        monkeypatch.setattr(log, "write", lambda text: writes.append(text))
+
+        assert notify.send_notifications_batch(self._MILESTONES) == [True] * 3
+        assert len(smtp) == 1
+        assert smtp[0].logins == 1
+        assert len(smtp[0].sent) == 3
+        assert len(writes) == 1
+        lines = writes[0].splitlines()
+        assert [line.split("] [")[1].split("]")[0] for line in lines] == ["SENT"] * 3
+
+    def test_failed_send_reconnects_for_the_rest(self, smtp, log_path):
+        _FakeSMTP.reject = "Swara Done"
+        results = notify.send_notifications_batch(self._MILESTONES)
+        assert results == [True, False, True]
+        assert len(smtp) == 2
+        assert smtp[0].closed
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert "[SENT] Pitch Done | tag=v0.1.0-pitch | commit=abc1234 | 95%" in lines[0]
+        assert "[FAILED] Swara Done" in lines[1]
+        assert "Message rejected" in lines[1]
+        assert "[SENT] Raga Done" in lines[2]
+
+    def test_empty_batch_sends_nothing(self, smtp, log_path):
+        assert notify.send_notifications_batch([]) == []
+        assert smtp == []
+        assert not log_path.exists()
@@ -1,10 +1,15 @@
 """Tests for pitch detection module using synthetic tones at known frequencies."""
 
+import subprocess
+import sys
+
 import numpy as np
+import pytest
 
 from crj_engine.pitch.detector import (
     PitchAlgorithm,
     PitchContour,
+    PitchFrame,
     detect_pitch,
     detect_pitch_pyin,
 )
@@ -84,3 +89,77 @@ class TestPitchDetectionPYIN:
                     f"Frequency {expected_freq} Hz: detected {median_freq:.1f} Hz "
                     f"({cents_error:.1f} cents error)"
                 )
+
+
+class TestPitchContourStorage:
+    """PitchContour keeps frames as parallel arrays."""
+
+    def test_frames_round_trip_through_columns(self):
+        frames = [
+            PitchFrame(timestamp_ms=0.0, frequency_hz=261.63, confidence=0.9),
+            PitchFrame(timestamp_ms=10.0, frequency_hz=0.0, confidence=0.1),
+            PitchFrame(timestamp_ms=20.0, frequency_hz=392.0, confidence=0.8),
+        ]
+        contour = PitchContour(
+            frames=frames, algorithm=PitchAlgorithm.PYIN, sample_rate=16000, hop_ms=10.0
+        )
+        assert len(contour) == 3
+        assert contour.frequencies.tolist() == [261.63, 0.0, 392.0]
+        assert contour.frames == frames
+
+    def test_filter_by_confidence_masks_all_columns(self):
+        contour = PitchContour.from_arrays(
+            np.array([0.0, 10.0, 20.0]),
+            np.array([261.63, 0.0, 392.0]),
+            np.array([0.9, 0.1, 0.8]),
+            algorithm=PitchAlgorithm.PYIN,
+            sample_rate=16000,
+            hop_ms=10.0,
+        )
+        voiced = contour.filter_by_confidence(0.5)
+        assert voiced.timestamps.tolist() == [0.0, 20.0]
+        assert voiced.frequencies.tolist() == [261.63, 392.0]
+        assert [f.confidence for f in voiced.frames] == [0.9, 0.8]
+
+    def test_columns_are_read_only_views(self):
+        freqs = np.array([261.63, 0.0, 392.0])
+        contour = PitchContour.from_arrays(
+            np.array([0.0, 10.0, 20.0]),
+            freqs,
+            np.array([0.9, 0.1, 0.8]),
+            algorithm=PitchAlgorithm.PYIN,
+            sample_rate=16000,
+            hop_ms=10.0,
+        )
+        assert np.shares_memory(contour.frequencies, freqs)
+        with pytest.raises(ValueError):
+            contour.frequencies[0] = 1.0
+        freqs[1] = 300.0  # the caller's array stays writable
+        assert contour.frequencies[1] == 300.0
+
+    def test_asarray_stacks_columns(self):
+        contour = PitchContour.from_arrays(
+            [0.0, 10.0], [261.63, 392.0], [0.9, 0.8],
+            algorithm=PitchAlgorithm.PYIN,
+            sample_rate=16000,
+            hop_ms=10.0,
+        )
+        stacked = np.asarray(contour)
+        assert stacked.shape == (3, 2)
+        np.testing.assert_array_equal(stacked[1], contour.frequencies)
+
+
+class TestLazyImports:
+    """The heavy audio/ML stacks load only when a detector actually runs."""
+
+    def test_pitch_modules_do_not_import_librosa_or_torch(self):
+        code = (
+            "import sys\n"
+            "import crj_engine.pitch.audio_io, crj_engine.pitch.detector, "
+            "crj_engine.pitch.gamaka\n"
+            "print(sorted(m for m in ('librosa', 'torch', 'torchcrepe') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
@@ -2,7 +2,7 @@
 
 import pytest
 
-from crj_engine.raga.matcher import RagaMatcher
+from crj_engine.raga.matcher import SWARA_POSITION, RagaDefinition, RagaMatcher
 
 
 @pytest.fixture
@@ -10,6 +10,46 @@ def matcher():
     return RagaMatcher()
 
 
+def _position(swara: str) -> int:
+    return 0 if swara == "Sa'" else SWARA_POSITION[swara]
+
+
+def _set_match_oracle(detected_positions: set[int], raga: RagaDefinition) -> float:
+    """Straightforward set-arithmetic form of the raga set-match score."""
+    raga_positions = raga.swara_set
+    common = detected_positions & raga_positions
+    foreign = detected_positions - raga_positions
+    missing = raga_positions - detected_positions
+    if not raga_positions:
+        return 0.0
+    coverage = len(common) / len(raga_positions)
+    purity = len(common) / len(detected_positions) if detected_positions else 0.0
+    score = (0.6 * coverage + 0.4 * purity) - len(foreign) * 0.15 - len(missing) * 0.05
+    return max(0.0, min(1.0, score))
+
+
+def _sequence_match_oracle(detected_swaras: list[str], raga: RagaDefinition) -> float:
+    """Window-by-window form of the arohana/avarohana sequence bonus."""
+    if len(detected_swaras) < 3:
+        return 0.0
+    detected = [_position(s) for s in detected_swaras]
+    arohana = [_position(s) for s in raga.arohana]
+    avarohana = [_position(s) for s in raga.avarohana]
+
+    def contains(phrase: list[int], window: list[int]) -> bool:
+        return any(phrase[j:j + 3] == window for j in range(len(phrase) - 2))
+
+    ascending = descending = 0
+    for i in range(len(detected) - 2):
+        window = detected[i:i + 3]
+        if window[0] < window[1] < window[2]:
+            ascending += contains(arohana, window)
+        elif window[0] > window[1] > window[2]:
+            descending += contains(avarohana, window)
+    matches = ascending + descending
+    return min(0.3, matches / max(1, len(detected) - 2) * 0.3)
+
+
 class TestRagaDatabase:
     def test_loads_72_ragas(self, matcher):
         assert len(matcher.ragas) == 72
@@ -107,6 +147,51 @@ class TestRagaIdentification:
         for c in candidates:
             assert 0.0 <= c.confidence <= 1.0
 
+    def test_presence_matrix_matches_swara_sets(self, matcher):
+        assert matcher.presence_matrix.shape == (72, 12)
+        for row, raga in zip(matcher.presence_matrix, matcher.ragas, strict=True):
+            assert set(row.nonzero()[0].tolist()) == raga.swara_set
+
+    def test_swara_mask_matches_swara_set(self, matcher):
+        for raga in matcher.ragas:
+            assert {p for p in range(12) if raga.swara_mask >> p & 1} == raga.swara_set
+
+    def test_vectorized_set_scores_match_oracle(self, matcher):
+        for detected in ({0, 2, 4, 5, 7, 9, 11, 6}, {0, 7}, set(range(12))):
+            scores = matcher._set_match_scores(detected)
+            for score, raga in zip(scores, matcher.ragas, strict=True):
+                assert score == pytest.approx(_set_match_oracle(detected, raga), abs=1e-12)
+
+    @pytest.mark.parametrize("jit", [True, False])
+    def test_identify_scores_match_oracles(self, matcher, monkeypatch, jit):
+        import crj_engine.raga.matcher as matcher_module
+
+        monkeypatch.setattr(matcher_module, "HAVE_NUMBA", jit and matcher_module.HAVE_NUMBA)
+        detected = ["Sa", "Ri2", "Ga3", "Ma1", "Pa", "Dha2", "Ni3", "Sa'",
+                    "Ni3", "Dha2", "Pa", "Ma1", "Ga3", "Ri2", "Sa", "Ma2"]
+        positions = {_position(s) for s in detected}
+        candidates = matcher.identify(detected, top_n=72)
+        assert any(c.match_details["sequence_bonus"] > 0 for c in candidates)
+        for candidate in candidates:
+            details = candidate.match_details
+            raga = candidate.raga
+            assert details["set_score"] == round(_set_match_oracle(positions, raga), 3)
+            assert details["sequence_bonus"] == round(
+                _sequence_match_oracle(detected, raga), 3,
+            )
+
+    def test_jit_scoring_matches_python_path(self, matcher, monkeypatch):
+        import crj_engine.raga.matcher as matcher_module
+
+        detected = ["Sa", "Ri2", "Ga3", "Ma1", "Pa", "Dha2", "Ni3", "Sa'",
+                    "Ni3", "Dha2", "Pa", "Ma2", "Ga3", "Ri2", "Sa"]
+        jit = matcher.identify(detected, top_n=72)
+        monkeypatch.setattr(matcher_module, "HAVE_NUMBA", False)
+        python = matcher.identify(detected, top_n=72)
+        assert [(c.raga.number, c.confidence, c.match_details) for c in jit] == [
+            (c.raga.number, c.confidence, c.match_details) for c in python
+        ]
+
 
 class TestEnharmonicResolution:
     def test_ri2_in_shankarabharanam(self, matcher):
@@ -1,6 +1,17 @@
 """Tests for the swara mapper module."""
 
-from crj_engine.swara.mapper import freq_to_swara, freq_to_western
+import numpy as np
+
+from crj_engine.swara.mapper import (
+    _default_swara_lut,
+    _default_swara_table,
+    _load_swarasthanas,
+    _nearest_swaras,
+    freq_to_swara,
+    freq_to_swara_batch,
+    freq_to_western,
+    swara_names,
+)
 
 
 class TestWesternMapping:
@@ -68,6 +79,33 @@ class TestSwaraMapping:
         for script in ["iast", "devanagari", "kannada", "tamil", "telugu"]:
             assert script in match.names
 
+    def test_match_does_not_share_config_state(self):
+        """Editing a returned match must not leak into later matches."""
+        match = freq_to_swara(261.63, reference_sa_hz=261.63)
+        assert match is not None
+        original_iast = match.names["iast"]
+        match.names["iast"] = "XX"
+        match.full_names.clear()
+        match.aliases.append("Bogus")
+
+        again = freq_to_swara(261.63, reference_sa_hz=261.63)
+        assert again is not None
+        assert again.names["iast"] == original_iast
+        assert again.full_names
+        assert "Bogus" not in again.aliases
+        assert _load_swarasthanas()[0]["names"]["iast"] == original_iast
+
+    def test_binary_search_matches_linear_scan(self):
+        """The indexed lookup for the config table agrees with a scan of a copy."""
+        sa = 261.63
+        table_copy = [dict(s) for s in _load_swarasthanas()]
+        # 0.5-cent steps hit every exact midpoint between swaras
+        for cents in np.arange(-1200, 2400, 0.5):
+            f = sa * 2 ** (cents / 1200)
+            indexed = freq_to_swara(f, reference_sa_hz=sa)
+            scanned = freq_to_swara(f, reference_sa_hz=sa, swarasthanas=table_copy)
+            assert indexed == scanned
+
     def test_ri2_ga1_enharmonic(self):
         """Ri2/Ga1 at 200 cents should report aliases."""
         sa = 261.63
@@ -76,3 +114,42 @@ class TestSwaraMapping:
         assert match is not None
         assert match.swara_id == "Ri2"
         assert "Ga1" in match.aliases
+
+    def test_swara_names_match_matches(self):
+        """``swara_names`` gives the same short names a match reports."""
+        match = freq_to_swara(261.63, reference_sa_hz=261.63)
+        assert match is not None
+        for script in ["iast", "kannada"]:
+            names = swara_names(script)
+            assert names["Sa"] == match.names[script]
+            assert len(names) == len(_load_swarasthanas())
+
+
+class TestSwaraBatchMapping:
+    def test_matches_scalar_mapping(self):
+        """Batch ids agree with freq_to_swara across several octaves."""
+        sa = 261.63
+        freqs = sa * 2 ** (np.arange(-1200, 2400, 7.3) / 1200)
+        freqs = np.concatenate([freqs, [0.0, -5.0]])
+        ids = freq_to_swara_batch(freqs, reference_sa_hz=sa)
+        for f, swara_id in zip(freqs, ids, strict=True):
+            match = freq_to_swara(f, reference_sa_hz=sa)
+            assert swara_id == (match.swara_id if match else "")
+
+    def test_wraps_near_upper_sa(self):
+        sa = 261.63
+        ids = freq_to_swara_batch(np.array([sa * 2 ** (1190 / 1200)]), reference_sa_hz=sa)
+        assert ids.tolist() == ["Sa"]
+
+    def test_cent_lookup_matches_full_search(self):
+        """The per-cent table agrees with the full search, boundaries included."""
+        sa = 261.63
+        table, _ = _default_swara_table()
+        cents = np.concatenate([np.arange(-1200, 2400, 0.05), np.arange(-1200, 2400) + 0.5])
+        freqs = sa * 2 ** (cents / 1200)
+        for tolerance in (25.0, 50.0, 600.0):
+            idx, dev = _nearest_swaras(freqs, sa, tolerance, table)
+            lut_idx, lut_dev = _nearest_swaras(freqs, sa, tolerance, table, _default_swara_lut())
+            np.testing.assert_array_equal(lut_idx, idx)
+            matched = idx < len(table)
+            np.testing.assert_array_equal(lut_dev[matched], dev[matched])
@@ -1,14 +1,20 @@
 """Tests for the audio synthesis / composition rendering module."""
 
 import numpy as np
+import soundfile as sf
 
 from crj_engine.synthesis.render import (
+    _SINE_BLOCK,
     ADSREnvelope,
     ToneType,
+    _sum_of_sines,
+    _swara_freq_cached,
     _swara_to_freq,
     generate_tanpura,
     render_bar_audio,
     render_composition,
+    render_composition_to_wav,
+    save_wav_pcm16,
 )
 from crj_engine.tala.models import (
     Bar,
@@ -85,6 +91,13 @@ class TestSwaraToFreq:
     def test_sustain_returns_none(self):
         assert _swara_to_freq(_note(","), REFERENCE_SA_HZ) is None
 
+    def test_repeated_lookups_hit_the_cache(self):
+        _swara_freq_cached.cache_clear()
+        first = _swara_to_freq(_note("Ga3", Octave.TARA), REFERENCE_SA_HZ)
+        again = _swara_to_freq(_note("Ga3", Octave.TARA), REFERENCE_SA_HZ)
+        assert again == first
+        assert _swara_freq_cached.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # ADSR Envelope
@@ -111,6 +124,11 @@ class TestADSREnvelope:
         result = env.apply(signal)
         assert len(result) == 500
 
+    def test_apply_multiplies_by_built_envelope(self):
+        env = ADSREnvelope()
+        signal = np.linspace(-1, 1, 700, dtype=np.float32)
+        np.testing.assert_array_equal(env.apply(signal), signal * env.build(700))
+
 
 # ---------------------------------------------------------------------------
 # Tone generation
@@ -184,6 +202,23 @@ class TestToneGeneration:
         third = len(audio) // 3
         assert np.max(np.abs(audio[third:2*third])) > 0.1
 
+    def test_sustain_after_rest_is_silent(self):
+        bar = Bar(
+            tala_id="eka_tisra",
+            speed=Speed.PRATAMA,
+            swaras=[_note(","), _note("Sa"), _note("-"), _note(",")],
+            saahitya=[_syl("-"), _syl("sa"), _syl("-"), _syl("-")],
+        )
+        audio = render_bar_audio(
+            bar, REFERENCE_SA_HZ, tempo_bpm=120,
+            tone=ToneType.SINE,
+        )
+        first, note, rest, sustain = np.split(audio, 4)
+        assert np.max(np.abs(first)) == 0
+        assert np.max(np.abs(note)) > 0.1
+        assert np.max(np.abs(rest)) == 0
+        assert np.max(np.abs(sustain)) == 0
+
     def test_audio_not_clipping(self):
         bar = _simple_bar()
         audio = render_bar_audio(
@@ -192,6 +227,40 @@ class TestToneGeneration:
         )
         assert np.max(np.abs(audio)) <= 1.0
 
+    def test_repeated_render_unaffected_by_caller_edits(self):
+        bar = _simple_bar()
+        first = render_bar_audio(
+            bar, REFERENCE_SA_HZ, tempo_bpm=120,
+            tone=ToneType.STRING,
+        )
+        expected = first.copy()
+        first *= 0
+        again = render_bar_audio(
+            bar, REFERENCE_SA_HZ, tempo_bpm=120,
+            tone=ToneType.STRING,
+        )
+        np.testing.assert_array_equal(again, expected)
+
+    def test_string_kernel_matches_numpy_path(self, monkeypatch):
+        import crj_engine.synthesis.render as render
+
+        t = np.linspace(0, 0.25, 11025, endpoint=False)
+        compiled = render._generate_string(293.66, t, 44100)
+        monkeypatch.setattr(render, "HAVE_NUMBA", False)
+        vectorized = render._generate_string(293.66, t, 44100)
+        np.testing.assert_array_equal(compiled, vectorized)
+
+    def test_voice_kernel_matches_numpy_path(self, monkeypatch):
+        import crj_engine.synthesis.render as render
+
+        t = np.linspace(0, 0.02, 882, endpoint=False)
+        compiled = render._generate_voice(293.66, t, 44100)
+        monkeypatch.setattr(render, "HAVE_NUMBA", False)
+        vectorized = render._generate_voice(293.66, t, 44100)
+        assert compiled.dtype == vectorized.dtype == np.float32
+        # The kernel runs the recurrence in float64, the NumPy path in float32
+        np.testing.assert_allclose(compiled, vectorized, atol=1e-6)
+
 
 # ---------------------------------------------------------------------------
 # Tanpura
@@ -213,6 +282,16 @@ class TestTanpura:
         audio = generate_tanpura(REFERENCE_SA_HZ, duration_s=2.0)
         assert np.max(np.abs(audio)) <= 1.0
 
+    def test_block_sum_matches_direct_sines(self):
+        omegas = 2 * np.pi * np.array([261.63, 523.26 * 1.001, 392.4])
+        weights = np.array([0.3, 0.2, 0.1])
+        n = 3 * _SINE_BLOCK + 123
+        t = np.arange(n) / 44100
+        direct = weights @ np.sin(np.multiply.outer(omegas, t))
+        np.testing.assert_allclose(
+            _sum_of_sines(omegas, weights, n, 44100), direct, atol=1e-9,
+        )
+
 
 # ---------------------------------------------------------------------------
 # Full composition rendering
@@ -273,6 +352,37 @@ class TestCompositionRendering:
         )
         assert abs(len(a2) - 2 * len(a1)) < 100
 
+    def test_repeats_copy_the_first_rendering(self):
+        line = Line(bars=[_simple_bar()], repeat=3)
+        comp = Composition(
+            title="T", raga="R", tala_id="triputa_chatusra",
+            composer="C", reference_sa_hz=REFERENCE_SA_HZ,
+            sections=[Section("p", [line])],
+        )
+        audio = render_composition(
+            comp, tone=ToneType.SINE, include_tanpura=False,
+        )
+        first, second, third = np.split(audio, 3)
+        np.testing.assert_array_equal(second, first)
+        np.testing.assert_array_equal(third, first)
+
+    def test_non_positive_repeats_render_nothing(self):
+        bar = _simple_bar()
+
+        def comp(*repeats):
+            return Composition(
+                title="T", raga="R", tala_id="triputa_chatusra",
+                composer="C", reference_sa_hz=REFERENCE_SA_HZ,
+                sections=[Section("p", [Line(bars=[bar], repeat=r) for r in repeats])],
+            )
+
+        for repeats in [(-1,), (0,)]:
+            audio = render_composition(comp(*repeats), tone=ToneType.SINE)
+            assert len(audio) == 0
+        expected = render_composition(comp(2), tone=ToneType.SINE)
+        mixed = render_composition(comp(-1, 2, 0), tone=ToneType.SINE)
+        np.testing.assert_array_equal(mixed, expected)
+
     def test_with_tanpura_not_clipping(self):
         comp = self._make_composition()
         audio = render_composition(
@@ -280,3 +390,50 @@ class TestCompositionRendering:
             include_tanpura=True,
         )
         assert np.max(np.abs(audio)) <= 1.0
+
+    def test_streamed_wav_matches_in_memory_render(self, tmp_path):
+        comp = self._make_composition()
+        for include_tanpura in (False, True):
+            path = tmp_path / f"comp_{include_tanpura}.wav"
+            render_composition_to_wav(
+                comp, path, tempo_bpm=120, tone=ToneType.VOICE,
+                include_tanpura=include_tanpura,
+            )
+            expected = render_composition(
+                comp, tempo_bpm=120, tone=ToneType.VOICE,
+                include_tanpura=include_tanpura,
+            )
+            streamed, sr = sf.read(str(path), dtype="float32")
+            assert sr == 44100
+            np.testing.assert_allclose(streamed, expected, atol=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# WAV output
+# ---------------------------------------------------------------------------
+
+class TestSaveWavPcm16:
+    def test_round_trip(self, tmp_path):
+        audio = generate_tanpura(REFERENCE_SA_HZ, duration_s=0.5)
+        path = tmp_path / "drone.wav"
+        save_wav_pcm16(audio, path, sr=44100)
+
+        info = sf.info(str(path))
+        assert info.samplerate == 44100
+        assert info.channels == 1
+        assert info.subtype == "PCM_16"
+
+        restored, _ = sf.read(str(path), dtype="float32")
+        assert len(restored) == len(audio)
+        assert np.max(np.abs(restored - audio)) < 1e-4
+
+    def test_clips_out_of_range(self, tmp_path):
+        path = tmp_path / "loud.wav"
+        save_wav_pcm16(np.array([2.0, -2.0, 0.0], dtype=np.float32), path)
+        restored, _ = sf.read(str(path), dtype="int16")
+        assert restored.tolist() == [32767, -32767, 0]
+
+    def test_does_not_modify_input(self, tmp_path):
+        audio = np.array([0.5, -1.5, 0.25], dtype=np.float32)
+        save_wav_pcm16(audio, tmp_path / "in.wav")
+        assert audio.tolist() == [0.5, -1.5, 0.25]
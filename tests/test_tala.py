@@ -1,11 +1,14 @@
 """Tests for the tala composition and notation module."""
 
+import dataclasses
 import json
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from crj_engine.pitch.detector import PitchAlgorithm, PitchContour
 from crj_engine.tala.models import (
     Bar,
     Composition,
@@ -31,6 +34,7 @@ from crj_engine.tala.serializer import (
     load_composition,
     save_composition,
 )
+from crj_engine.tala.transcribe import Transcription, transcribe_contour
 
 # ---------------------------------------------------------------------------
 # Tala Database
@@ -163,6 +167,13 @@ class TestOctaveNotation:
         # Tara should have dot above
         assert "\u0307" in r_tara
 
+    def test_equal_notes_share_a_rendering(self):
+        render_swara.cache_clear()
+        render_swara(SwaraNote(swara_id="Ga3", octave=Octave.TARA), "iast")
+        rendered = render_swara(SwaraNote(swara_id="Ga3", octave=Octave.TARA), "iast")
+        assert "\u0307" in rendered
+        assert render_swara.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # Bar and Composition Model
@@ -223,6 +234,13 @@ class TestBarModel:
         with pytest.raises(ValueError, match="expects 8"):
             bar.validate(db)
 
+    def test_notes_are_immutable_values(self):
+        note = SwaraNote(swara_id="Sa", octave=Octave.TARA)
+        assert note == SwaraNote(swara_id="Sa", octave=Octave.TARA)
+        assert len({note, SwaraNote(swara_id="Sa", octave=Octave.TARA)}) == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            note.swara_id = "Pa"
+
 
 class TestCompositionModel:
     def test_basic_composition_structure(self):
@@ -391,3 +409,84 @@ class TestSerialization:
         bar_data = d["sections"][0]["lines"][0]["bars"][0]
         assert isinstance(bar_data["saahitya"], list)
         assert all(isinstance(s, str) for s in bar_data["saahitya"])
+
+
+# ---------------------------------------------------------------------------
+# Transcription
+# ---------------------------------------------------------------------------
+
+def _contour(cents: list[float], frames_each: int = 20, hop_ms: float = 10.0):
+    """Contour holding each cents value (relative to Sa 261.63) for a run of frames."""
+    freqs = np.repeat([261.63 * 2 ** (c / 1200) if c is not None else 0.0
+                       for c in cents], frames_each)
+    return PitchContour.from_arrays(
+        np.arange(len(freqs)) * hop_ms, freqs, np.full(len(freqs), 0.9),
+        PitchAlgorithm.PYIN, 16000, hop_ms,
+    )
+
+
+class TestTranscription:
+    def test_notes_and_octaves(self):
+        contour = _contour([0, 200, 400, None, -500, 1200], frames_each=20)
+        notes = [n for p in transcribe_contour(contour).phrases for n in p.notes]
+        assert [n.swara_id for n in notes] == ["Sa", "Ri2", "Ga3", "Pa", "Sa"]
+        assert [n.octave for n in notes] == [
+            Octave.MADHYA, Octave.MADHYA, Octave.MADHYA, Octave.MANDRA, Octave.TARA,
+        ]
+        assert notes[0].start_ms == 0.0
+        assert notes[0].end_ms == pytest.approx(200.0)
+
+    def test_short_runs_dropped(self):
+        contour = _contour([0, 700], frames_each=5)
+        assert transcribe_contour(contour, min_note_ms=80.0).phrases == []
+
+    def test_columns_round_trip_through_phrases(self):
+        contour = _contour([0, 200, None, None, None, 700, 900], frames_each=20)
+        transcription = transcribe_contour(contour, phrase_gap_ms=300.0)
+        assert transcription.phrase_bounds.tolist() == [0, 2, 4]
+        assert transcription.all_swara_ids.tolist() == ["Sa", "Ri2", "Pa", "Dha2"]
+        assert transcription.columns.octaves == [
+            n.octave for p in transcription.phrases for n in p.notes
+        ]
+
+        rebuilt = Transcription(
+            phrases=transcription.phrases,
+            reference_sa_hz=transcription.reference_sa_hz,
+            duration_s=transcription.duration_s,
+        )
+        assert rebuilt.phrase_bounds.tolist() == [0, 2, 4]
+        assert rebuilt.columns.notes() == transcription.columns.notes()
+
+    def test_phrases_are_built_from_columns(self):
+        contour = _contour([0, 200, None, None, None, 700, 900], frames_each=20)
+        phrases = transcribe_contour(contour, phrase_gap_ms=300.0).phrases
+        transcription = Transcription(
+            phrases=phrases, reference_sa_hz=261.63, duration_s=1.0,
+        )
+        expected = [list(p.notes) for p in phrases]
+
+        phrases.pop()
+        phrases[0].notes.clear()
+        assert transcription.phrases is not phrases
+        assert [p.notes for p in transcription.phrases] == expected
+        assert transcription.columns.notes() == [n for notes in expected for n in notes]
+
+    def test_jit_runs_match_numpy_path(self, monkeypatch):
+        import crj_engine.tala.transcribe as transcribe
+
+        rng = np.random.default_rng(0)
+        cents = rng.choice([0, 200, 400, 500, 700, 900, 1100, None], 200).tolist()
+        contour = _contour(cents, frames_each=9)
+        jit = transcribe_contour(contour, min_note_ms=50.0)
+        monkeypatch.setattr(transcribe, "HAVE_NUMBA", False)
+        numpy_path = transcribe_contour(contour, min_note_ms=50.0)
+
+        jit_notes = [n for p in jit.phrases for n in p.notes]
+        numpy_notes = [n for p in numpy_path.phrases for n in p.notes]
+        assert len(jit_notes) == len(numpy_notes) > 0
+        for a, b in zip(jit_notes, numpy_notes, strict=True):
+            assert (a.start_ms, a.end_ms, a.swara_id, a.octave) == (
+                b.start_ms, b.end_ms, b.swara_id, b.octave,
+            )
+            assert a.frequency_hz == pytest.approx(b.frequency_hz)
+            assert a.cents_deviation == pytest.approx(b.cents_deviation, abs=1e-9)